@@ -49,6 +49,72 @@ def is_interactive():
     return all(_is_stream_tty(s) for s in (sys.stdin, sys.stdout, sys.stderr))
 
 
+############
+# Generators of synthetic datasets
+
+def make_large_dataset(path, nfiles, annex=True, files_per_dir=1000):
+    """Create a dataset with a large number of small files
+
+    Files are spread across directories of `files_per_dir` files each. All
+    files have unique content, hence an annex holds as many keys as there
+    are files. The last percent of the files is added in a second commit, so
+    there is a non-trivial `HEAD~1..HEAD` diff.
+
+    Parameters
+    ----------
+    path : str
+    nfiles : int
+    annex : bool, optional
+      Whether to create an annex, or a plain Git repository.
+    files_per_dir : int, optional
+
+    Returns
+    -------
+    Dataset
+    """
+    ds = Dataset(path).create(annex=annex)
+    nlast = max(nfiles // 100, 1)
+    for ifiles in (range(nfiles - nlast), range(nfiles - nlast, nfiles)):
+        for i in ifiles:
+            dirpath = op.join(path, 'dir%d' % (i // files_per_dir))
+            if not i % files_per_dir:
+                os.makedirs(dirpath, exist_ok=True)
+            with open(op.join(dirpath, 'file%d' % i), 'w') as f:
+                f.write('content %d\n' % i)
+        # bypass `save` - it is among the things to be benchmarked, and
+        # too slow to generate the largest datasets
+        ds.repo.add(['.'])
+        ds.repo.commit('Add %d files' % len(ifiles))
+    return ds
+
+
+def make_dataset_hierarchy(path, depth, width, annex=False):
+    """Create a hierarchy of (empty) datasets
+
+    Parameters
+    ----------
+    path : str
+    depth : int
+      Number of levels of subdatasets.
+    width : int
+      Number of subdatasets of each dataset that is not at the lowest level.
+    annex : bool, optional
+
+    Returns
+    -------
+    Dataset
+      The top-level dataset.
+    """
+    ds = Dataset(path).create(annex=annex)
+    if depth:
+        for i in range(width):
+            make_dataset_hierarchy(
+                op.join(path, 'sub%d' % i), depth - 1, width, annex=annex)
+        # register all subdatasets at once
+        ds.save(message='Add subdatasets')
+    return ds
+
+
 class SuprocBenchmarks(object):
     # manually set a number since otherwise takes way too long!
     # see https://github.com/spacetelescope/asv/issues/497
@@ -65,6 +65,28 @@ class startup(SuprocBenchmarks):
         call([sys.executable, "-c", "import datalad.api"])
 
 
+class import_time(SuprocBenchmarks):
+    """
+    Cumulative import time of the modules on the startup path, as
+    reported by ``python -X importtime``
+    """
+
+    params = ['datalad', 'datalad.api', 'datalad.coreapi',
+              'datalad.cmdline.main']
+    param_names = ['module']
+    unit = "us"
+
+    def track_import_time(self, module):
+        from subprocess import check_output, STDOUT
+        out = check_output(
+            [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+            stderr=STDOUT, universal_newlines=True)
+        for line in out.splitlines():
+            fields = [f.strip() for f in line.split('|')]
+            if len(fields) == 3 and fields[2] == module:
+                return int(fields[1])
+
+
 class runner(SuprocBenchmarks):
     """Some rudimentary tests to see if there is no major slowdowns from Runner
     """
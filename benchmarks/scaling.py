@@ -0,0 +1,225 @@
+# ex: set sts=4 ts=4 sw=4 noet:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Benchmarks of scaling-critical operations on large synthetic datasets
+
+Generating the datasets for this tier takes a long time (hours for the
+largest ones). The largest dataset size can be capped via the
+DATALAD_BENCHMARKS_MAX_NFILES environment variable, e.g.
+
+    DATALAD_BENCHMARKS_MAX_NFILES=10000 asv run --python=same -b scaling
+"""
+
+import os
+import os.path as op
+import tempfile
+
+from datalad.api import Dataset
+from datalad.utils import get_tempfile_kwargs
+
+from .common import (
+    SuprocBenchmarks,
+    make_dataset_hierarchy,
+    make_large_dataset,
+)
+
+
+NFILES = [10 ** 4, 10 ** 5, 10 ** 6]
+REPOS = ['git', 'annex']
+_max_nfiles = os.environ.get('DATALAD_BENCHMARKS_MAX_NFILES')
+if _max_nfiles:
+    NFILES = [n for n in NFILES if n <= int(_max_nfiles)] or NFILES[:1]
+
+# (depth, width): wide, bushy, and deep hierarchies
+HIERARCHIES = [(1, 500), (3, 8), (25, 1)]
+
+
+class LargeDatasetBenchmarks(SuprocBenchmarks):
+    """Base class for benchmarks on datasets with many files
+
+    The datasets are generated once (per benchmark run), and shared by all
+    derived classes.
+    """
+
+    params = [NFILES, REPOS]
+    param_names = ['nfiles', 'repo']
+    timeout = 4 * 3600
+
+    def setup_cache(self):
+        paths = {}
+        for nfiles in NFILES:
+            # all datasets, as the cache is shared with derived classes that
+            # are restricted to some of them
+            for repo in REPOS:
+                path = op.realpath('%s%d' % (repo, nfiles))
+                self.log("Generating %s", path)
+                make_large_dataset(path, nfiles, annex=repo == 'annex')
+                paths[(nfiles, repo)] = path
+        return paths
+
+    def setup(self, paths, nfiles, repo):
+        self.ds = Dataset(paths[(nfiles, repo)])
+        self.repo = self.ds.repo
+
+    def teardown(self, *args):
+        self._cleanup()
+
+
+class large_dataset(LargeDatasetBenchmarks):
+    """Read-only operations"""
+
+    def time_status(self, *args):
+        self.ds.status()
+
+    def peakmem_status(self, *args):
+        self.ds.status()
+
+    def time_diff(self, *args):
+        self.ds.diff(fr='HEAD~1', to='HEAD')
+
+    def peakmem_diff(self, *args):
+        self.ds.diff(fr='HEAD~1', to='HEAD')
+
+    def time_get_content_info(self, *args):
+        info = self.repo.get_content_info()
+        assert isinstance(info, dict)
+
+    def peakmem_get_content_info(self, *args):
+        self.repo.get_content_info()
+
+
+class large_dataset_annex(LargeDatasetBenchmarks):
+    """Read-only operations specific to annex repositories"""
+
+    params = [NFILES, ['annex']]
+
+    def time_status_annex_availability(self, *args):
+        self.ds.status(annex='availability')
+
+    def time_get_content_annexinfo(self, *args):
+        self.repo.get_content_annexinfo()
+
+
+class large_dataset_save(LargeDatasetBenchmarks):
+    """Saving new files (one percent of the existing ones) to a large dataset
+    """
+
+    # setup must be rerun before each call
+    number = 1
+    warmup_time = 0
+
+    def setup(self, paths, nfiles, repo):
+        super().setup(paths, nfiles, repo)
+        self.head = self.repo.get_hexsha()
+        dirpath = op.join(self.ds.path, 'new')
+        os.makedirs(dirpath)
+        for i in range(max(nfiles // 100, 1)):
+            with open(op.join(dirpath, 'file%d' % i), 'w') as f:
+                f.write('new content %d\n' % i)
+
+    def teardown(self, *args):
+        self.repo.call_git(['reset', '--hard', self.head])
+        self.repo.call_git(['clean', '-fdx'])
+        super().teardown(*args)
+
+    def time_save(self, *args):
+        self.ds.save(message='Add new files')
+
+    def peakmem_save(self, *args):
+        self.ds.save(message='Add new files')
+
+
+class large_dataset_ria_push(LargeDatasetBenchmarks):
+    """Push of all (annexed) content to a fresh local RIA store"""
+
+    params = [NFILES, ['annex']]
+    number = 1
+    warmup_time = 0
+
+    def setup(self, paths, nfiles, repo):
+        super().setup(paths, nfiles, repo)
+        store = tempfile.mkdtemp(**get_tempfile_kwargs({}, prefix='bm_ria'))
+        self.remove_paths.append(store)
+        # a unique name (across the processes asv runs repeats in), as the
+        # special remote cannot be removed from the git-annex branch again
+        self.sibling = op.basename(store)
+        self.ds.create_sibling_ria(
+            'ria+file://%s' % store, name=self.sibling)
+
+    def teardown(self, *args):
+        for remote in (self.sibling, self.sibling + '-storage'):
+            self.repo.call_git(['remote', 'remove', remote])
+        super().teardown(*args)
+
+    def time_push(self, *args):
+        self.ds.push(to=self.sibling)
+
+
+class large_dataset_metadata(LargeDatasetBenchmarks):
+    """Metadata aggregation and search"""
+
+    params = [NFILES, ['annex']]
+
+    def setup_cache(self):
+        paths = {}
+        for nfiles in NFILES:
+            path = op.realpath('metadata%d' % nfiles)
+            self.log("Generating %s", path)
+            ds = make_large_dataset(path, nfiles)
+            ds.aggregate_metadata()
+            paths[(nfiles, 'annex')] = path
+        return paths
+
+    def time_aggregate_metadata(self, *args):
+        # metadata is identical to the aggregated one, hence there is no
+        # need to reset anything
+        self.ds.aggregate_metadata(force_extraction=True, save=False)
+
+    def peakmem_aggregate_metadata(self, *args):
+        self.ds.aggregate_metadata(force_extraction=True, save=False)
+
+    def time_search(self, *args):
+        # no match, so all records are inspected
+        self.ds.search('nosuchvalue', mode='egrep')
+
+    def peakmem_search(self, *args):
+        self.ds.search('nosuchvalue', mode='egrep')
+
+
+class dataset_hierarchy(SuprocBenchmarks):
+    """Operations on deep and wide hierarchies of subdatasets"""
+
+    params = [HIERARCHIES]
+    param_names = ['depth_width']
+    timeout = 4 * 3600
+
+    def setup_cache(self):
+        paths = {}
+        for depth, width in HIERARCHIES:
+            path = op.realpath('hierarchy%dx%d' % (depth, width))
+            self.log("Generating %s", path)
+            make_dataset_hierarchy(path, depth, width)
+            paths[(depth, width)] = path
+        return paths
+
+    def setup(self, paths, depth_width):
+        self.ds = Dataset(paths[depth_width])
+
+    def teardown(self, *args):
+        self._cleanup()
+
+    def time_subdatasets_recursive(self, *args):
+        self.ds.subdatasets(recursive=True)
+
+    def peakmem_subdatasets_recursive(self, *args):
+        self.ds.subdatasets(recursive=True)
+
+    def time_status_recursive(self, *args):
+        self.ds.status(recursive=True)
+
+    def peakmem_status_recursive(self, *args):
+        self.ds.status(recursive=True)
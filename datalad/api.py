@@ -8,91 +8,96 @@
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 """Python DataLad API exposing user-oriented commands (also available via CLI)"""
 
-from datalad.coreapi import *
+from datalad.distribution.dataset import Dataset
 
 
 def _command_summary():
     # Import here to avoid polluting the datalad.api namespace.
     from collections import defaultdict
-    from datalad.interface.base import alter_interface_docs_for_api
     from datalad.interface.base import get_api_name
-    from datalad.interface.base import get_cmd_doc
     from datalad.interface.base import get_cmd_summaries
     from datalad.interface.base import get_interface_groups
-    from datalad.interface.base import load_interface
+    from datalad.interface.base import get_interface_summaries
+    from datalad.interface.base import _get_interface_spec_id
 
     groups = get_interface_groups(include_plugins=True)
+    # cached, so that not all interfaces need to be imported
+    summaries = get_interface_summaries(groups)
     grp_short_descriptions = defaultdict(list)
     for group, _, specs in sorted(groups, key=lambda x: x[1]):
         for spec in specs:
-            intf = load_interface(spec)
-            if intf is None:
+            sdescr = summaries.get(_get_interface_spec_id(spec))
+            if sdescr is None:
                 continue
-            sdescr = getattr(intf, "short_description", None) or \
-                alter_interface_docs_for_api(get_cmd_doc(intf)).split("\n")[0]
             grp_short_descriptions[group].append(
-                (get_api_name(spec), sdescr))
+                (get_api_name(spec), sdescr[0]))
     return "\n".join(get_cmd_summaries(grp_short_descriptions, groups))
 
 
 __doc__ += "\n\n{}".format(_command_summary())
 
 
-def _load_plugins():
-    from datalad.plugin import _get_plugins
-    from datalad.plugin import _load_plugin
-    import re
+def _make_lazy_api():
+    """Return module-level __getattr__ and __dir__ implementations
 
-    camel = re.compile(r'([a-z])([A-Z])')
+    Commands are only imported when they are accessed for the first time.
+    A third function binds all commands right away, for Python versions
+    without support for a module-level __getattr__ (PEP 562).
+    """
+    from datalad.interface.base import get_api_name
+    from datalad.interface.base import get_extension_interface_groups
+    from datalad.interface.base import get_interface_groups
+    from datalad.interface.base import load_interface
+
+    api_specs = {}
+
+    def _get_specs():
+        if api_specs:
+            return api_specs
+        groups = get_interface_groups(include_plugins=True)
+        # extension commands can replace core commands, and plugins any
+        # command, so add them in the order of precedence
+        plugins = groups.pop()
+        groups.extend(get_extension_interface_groups())
+        groups.append(plugins)
+        api_specs.update(
+            (get_api_name(spec), spec)
+            for _, _, specs in groups
+            for spec in specs)
+        return api_specs
+
+    def __getattr__(name):
+        if name == '__all__':
+            # any star-import will import all commands
+            return ['Dataset'] + sorted(_get_specs())
+        spec = _get_specs().get(name)
+        intf = load_interface(spec) if spec else None
+        if intf is None:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name))
+        globals()[name] = intf.__call__
+        return intf.__call__
+
+    def __dir__():
+        return sorted(set(globals()).union(_get_specs()))
+
+    def bind_all():
+        for name, spec in _get_specs().items():
+            intf = load_interface(spec)
+            if intf is not None:
+                globals()[name] = intf.__call__
 
-    for pname, props in _get_plugins():
-        pi = _load_plugin(props['file'], fail=False)
-        if pi is None:
-            continue
-        globals()[camel.sub('\\1_\\2', pi.__name__).lower()] = pi.__call__
+    return __getattr__, __dir__, bind_all
 
 
-def _generate_extension_api():
-    """Auto detect all available extensions and generate an API from them
-    """
-    from importlib import import_module
-    from pkg_resources import iter_entry_points
-    from .interface.base import get_api_name
-
-    from datalad.dochelpers import exc_str
-    import logging
-    lgr = logging.getLogger('datalad.api')
-
-    for entry_point in iter_entry_points('datalad.extensions'):
-        try:
-            lgr.debug(
-                'Loading entrypoint %s from datalad.extensions for API building',
-                entry_point.name)
-            grp_descr, interfaces = entry_point.load()
-            lgr.debug(
-                'Loaded entrypoint %s from datalad.extensions',
-                entry_point.name)
-        except Exception as e:
-            lgr.warning('Failed to load entrypoint %s: %s', entry_point.name, exc_str(e))
-            continue
-
-        for intfspec in interfaces:
-            # turn the interface spec into an instance
-            mod = import_module(intfspec[0])
-            intf = getattr(mod, intfspec[1])
-            api_name = get_api_name(intfspec)
-            if api_name in globals():
-                lgr.debug(
-                    'Command %s from extension %s is replacing a previously loaded implementation',
-                    api_name,
-                    entry_point.name)
-            globals()[api_name] = intf.__call__
-
-
-_generate_extension_api()
-_load_plugins()
+import sys
+if sys.version_info >= (3, 7):
+    __getattr__, __dir__ = _make_lazy_api()[:2]
+else:
+    # a module-level __getattr__ would be ignored
+    _make_lazy_api()[2]()
+del sys
 
 # Be nice and clean up the namespace properly
-del _load_plugins
-del _generate_extension_api
+del _make_lazy_api
 del _command_summary
@@ -12,6 +12,7 @@ Wrapper for command and function calls, allowing for dry runs and output handlin
 """
 
 import time
+import selectors
 import subprocess
 import sys
 import logging
@@ -39,12 +40,17 @@ from .support.protocol import (
     ExecutionTimeProtocol,
     ExecutionTimeExternalsProtocol,
 )
+from .support.tracer import (
+    get_command_label,
+    subprocess_tracer,
+)
 from .utils import (
     assure_bytes,
     assure_unicode,
     auto_repr,
     generate_file_chunks,
     get_tempfile_kwargs,
+    on_windows,
     split_cmdline,
     try_multiple,
     unlink,
@@ -376,6 +382,25 @@ class KillOutput(WitlessProtocol):
                 len(data), self.pid, self.FD_NAMES[fd])
 
 
+def _get_traced_protocol(protocol):
+    """Derive a protocol class that counts the bytes received from a process
+
+    Returns
+    -------
+    WitlessProtocol, list
+      The derived class, and a single-item list that will hold the number
+      of received bytes.
+    """
+    received = [0]
+
+    class TracedProtocol(protocol):
+        def pipe_data_received(self, fd, data):
+            received[0] += len(data)
+            super().pipe_data_received(fd, data)
+
+    return TracedProtocol, received
+
+
 class WitlessRunner(object):
     """Minimal Runner with support for online command output processing
 
@@ -484,18 +509,30 @@ class WitlessRunner(object):
         else:
             event_loop = asyncio.SelectorEventLoop()
         asyncio.set_event_loop(event_loop)
-        # include the subprocess manager in the asyncio event loop
-        results = event_loop.run_until_complete(
-            run_async_cmd(
-                event_loop,
-                cmd,
-                protocol,
-                stdin,
-                protocol_kwargs=kwargs,
-                cwd=cwd,
-                env=env,
+        traced = None
+        if subprocess_tracer.enabled:
+            protocol, traced = _get_traced_protocol(protocol)
+            tstart = subprocess_tracer.start()
+        results = None
+        try:
+            # include the subprocess manager in the asyncio event loop
+            results = event_loop.run_until_complete(
+                run_async_cmd(
+                    event_loop,
+                    cmd,
+                    protocol,
+                    stdin,
+                    protocol_kwargs=kwargs,
+                    cwd=cwd,
+                    env=env,
+                )
             )
-        )
+        finally:
+            if traced is not None:
+                subprocess_tracer.record(
+                    cmd, tstart, cwd=cwd,
+                    code=results.get('code') if results else None,
+                    bytes_out=traced[0])
         # terminate the event loop, cannot be undone, hence we start a fresh
         # one each time (see BlockingIOError notes above)
         event_loop.close()
@@ -538,6 +575,9 @@ class Runner(object):
     __slots__ = ['commands', 'dry', 'cwd', 'env', 'protocol',
                  '_log_opts']
 
+    # maximum number of bytes to read from a subprocess pipe at once
+    _READ_SIZE = 65536
+
     def __init__(self, cwd=None, env=None, protocol=None, log_outputs=None):
         """
         Parameters
@@ -697,8 +737,6 @@ class Runner(object):
         -------
 
         """
-        stdout, stderr = bytes(), bytes()
-
         log_stdout_ = _decide_to_log(log_stdout)
         log_stderr_ = _decide_to_log(log_stderr)
         log_stdout_is_callable = callable(log_stdout_)
@@ -715,6 +753,91 @@ class Runner(object):
                 expect_stderr or expect_fail
         )
 
+        if on_windows:
+            # selectors cannot wait on pipes on Windows
+            stdout, stderr = self._read_output_lines(
+                proc, log_stdout_, log_stderr_, outputstream, errstream,
+                stdout_args, stderr_args)
+        else:
+            stdout, stderr = self._read_output_chunks(
+                proc, log_stdout_, log_stderr_, stdout_args, stderr_args)
+
+        stdout_, stderr_ = proc.communicate()
+        # ??? should we condition it on log_stdout in {'offline'} ???
+        stdout += self._process_remaining_output(outputstream, stdout_, *stdout_args)
+        stderr += self._process_remaining_output(errstream, stderr_, *stderr_args)
+
+        return stdout, stderr
+
+    def _read_output_chunks(self, proc, log_stdout_, log_stderr_,
+                            stdout_args, stderr_args):
+        """Read output from all pipes to be logged until they are closed
+
+        Output is read in chunks as soon as it becomes available, and only
+        complete lines are passed on to `_process_lines()`.
+        """
+        sel = selectors.DefaultSelector()
+        out = {}
+        partial = {}
+        for stream, log_, args in ((proc.stdout, log_stdout_, stdout_args),
+                                   (proc.stderr, log_stderr_, stderr_args)):
+            if log_ and stream is not None:
+                sel.register(stream, selectors.EVENT_READ, args)
+                out[args[0]] = []
+                partial[args[0]] = bytes()
+        try:
+            while sel.get_map():
+                for key, _ in sel.select():
+                    out_type = key.data[0]
+                    data = os.read(key.fd, self._READ_SIZE)
+                    if not data:
+                        # EOF, process an incomplete last line
+                        sel.unregister(key.fileobj)
+                        data, end = partial[out_type], None
+                    else:
+                        data = partial[out_type] + data
+                        end = data.rfind(b'\n') + 1
+                        partial[out_type] = data[end:]
+                    if data[:end]:
+                        out[out_type].append(
+                            self._process_lines(data[:end], *key.data))
+        finally:
+            sel.close()
+        return tuple(bytes().join(out.get(t, [])) for t in ('stdout', 'stderr'))
+
+    def _process_lines(self, data, out_type, proc, log_, log_is_callable,
+                       expected=False):
+        """Process a chunk of output, consisting of complete lines
+
+        Equivalent to calling `_process_one_line()` on each line of `data`,
+        but avoids any per-line work if neither a callable nor output logging
+        was requested.
+        """
+        log_outputs = self.log_outputs
+        if not (log_is_callable or log_outputs):
+            return data
+        lines = assure_unicode(data).split('\n')
+        # empty if `data` ends with a newline
+        last = lines.pop()
+        lines = [l + '\n' for l in lines]
+        if last:
+            lines.append(last)
+        if log_is_callable:
+            # Let it be processed, swallowing lines the callable returned
+            # None for
+            lines = [l for l in map(log_, lines) if l]
+        if log_outputs:
+            for line in lines:
+                if out_type == 'stdout':
+                    self._log_out(line)
+                else:
+                    self._log_err(line, expected)
+        return assure_bytes(''.join(lines))
+
+    def _read_output_lines(self, proc, log_stdout_, log_stderr_,
+                           outputstream, errstream, stdout_args, stderr_args):
+        """Read output line by line while the process is running"""
+        stdout, stderr = bytes(), bytes()
         while proc.poll() is None:
             # see for a possibly useful approach to processing output
             # in another thread http://codereview.stackexchange.com/a/17959
@@ -741,11 +864,6 @@ class Runner(object):
                 outputstream, proc.stdout.read(), *stdout_args)
             stderr += self._process_remaining_output(
                 errstream, proc.stderr.read(), *stderr_args)
-        stdout_, stderr_ = proc.communicate()
-        # ??? should we condition it on log_stdout in {'offline'} ???
-        stdout += self._process_remaining_output(outputstream, stdout_, *stdout_args)
-        stderr += self._process_remaining_output(errstream, stderr_, *stderr_args)
-
         return stdout, stderr
 
     def _process_remaining_output(self, stream, out_, *pargs):
@@ -913,6 +1031,8 @@ class Runner(object):
                     split_cmdline(cmd)
                     if isinstance(cmd, str)
                     else cmd)
+            tstart = subprocess_tracer.start() \
+                if subprocess_tracer.enabled else None
             try:
                 proc = subprocess.Popen(cmd,
                                         stdout=outputstream,
@@ -926,12 +1046,15 @@ class Runner(object):
                 prot_exc = e
                 lgr.log(11, "Failed to start %r%r: %s" %
                         (cmd, " under %r" % cwd if cwd else '', exc_str(e)))
+                if tstart is not None:
+                    subprocess_tracer.record(cmd, tstart, cwd=popen_cwd)
                 raise
 
             finally:
                 if self.protocol.records_ext_commands:
                     self.protocol.end_section(prot_id, prot_exc)
 
+            bytes_out = None
             try:
                 if log_online:
                     out = self._get_output_online(proc,
@@ -941,6 +1064,7 @@ class Runner(object):
                                                   expect_fail=expect_fail)
                 else:
                     out = proc.communicate()
+                bytes_out = sum(len(o) for o in out if o)
 
                 # Decoding was delayed to this point
                 def decode_if_not_None(x):
@@ -995,6 +1119,10 @@ class Runner(object):
                 raise exc_info[1]
 
             finally:
+                if tstart is not None:
+                    subprocess_tracer.record(
+                        cmd, tstart, cwd=popen_cwd, code=proc.returncode,
+                        bytes_out=bytes_out)
                 # Those streams are for us to close if we asked for a PIPE
                 # TODO -- assure closing the files
                 _cleanup_output(outputstream, proc.stdout)
@@ -1074,12 +1202,12 @@ class GitRunnerBase(object):
         if found.  If it is empty (but not None), we do nothing
         """
         if GitRunnerBase._GIT_PATH is None:
-            from distutils.spawn import find_executable
+            from shutil import which
             # with all the nesting of config and this runner, cannot use our
             # cfg here, so will resort to dark magic of environment options
             if (os.environ.get('DATALAD_USE_DEFAULT_GIT', '0').lower()
                     in ('1', 'on', 'true', 'yes')):
-                git_fpath = find_executable("git")
+                git_fpath = which("git")
                 if git_fpath:
                     GitRunnerBase._GIT_PATH = ''
                     lgr.log(9, "Will use default git %s", git_fpath)
@@ -1092,8 +1220,8 @@ class GitRunnerBase(object):
 
     @staticmethod
     def _get_bundled_path():
-        from distutils.spawn import find_executable
-        annex_fpath = find_executable("git-annex")
+        from shutil import which
+        annex_fpath = which("git-annex")
         if not annex_fpath:
             # not sure how to live further anyways! ;)
             alongside = False
@@ -1299,18 +1427,35 @@ class BatchedCommand(SafeDelCloseMixin):
         # according to the internet wisdom there is no easy way with subprocess
         self._check_process(restart=True)
         process = self._process  # _check_process might have restarted it
-        process.stdin.write(entry)
-        process.stdin.flush()
-        lgr.log(5, "Done sending.")
-        still_alive, stderr = self._check_process(restart=False)
-        # TODO: we might want to handle still_alive, e.g. to allow for
-        #       a number of restarts/resends, but it should be per command
-        #       since for some we cannot just resend the same query. But if
-        #       it is just a "get"er - we could resend it few times
-        # The default output_proc expects a single line output.
-        # TODO: timeouts etc
-        stdout = assure_unicode(self.output_proc(process.stdout)) \
-            if not process.stdout.closed else None
+        tstart = subprocess_tracer.start() \
+            if subprocess_tracer.enabled else None
+        still_alive = False
+        stdout = None
+        try:
+            process.stdin.write(entry)
+            process.stdin.flush()
+            lgr.log(5, "Done sending.")
+            still_alive, stderr = self._check_process(restart=False)
+            # TODO: we might want to handle still_alive, e.g. to allow for
+            #       a number of restarts/resends, but it should be per command
+            #       since for some we cannot just resend the same query. But if
+            #       it is just a "get"er - we could resend it few times
+            # The default output_proc expects a single line output.
+            # TODO: timeouts etc
+            stdout = assure_unicode(self.output_proc(process.stdout)) \
+                if not process.stdout.closed else None
+        finally:
+            # record the request even if it failed to complete
+            if tstart is not None:
+                # a single request counts as a call, no matter how long the
+                # process is around already
+                subprocess_tracer.record(
+                    self.cmd, tstart, cwd=self.path,
+                    code=None if still_alive else process.returncode,
+                    bytes_in=len(entry),
+                    bytes_out=len(stdout) if stdout else 0,
+                    label='{} (batched)'.format(
+                        get_command_label(self.cmd)))
         if stderr:
             lgr.warning("Received output in stderr: %r", stderr)
         lgr.log(5, "Received output: %r" % stdout)
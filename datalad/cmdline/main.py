@@ -103,7 +103,8 @@ def setup_parser(
     # delay since it can be a heavy import
     from ..interface.base import dedent_docstring, get_interface_groups, \
         get_cmdline_command_name, alter_interface_docs_for_cmdline, \
-        load_interface, get_cmd_doc, get_cmd_ex
+        load_interface, get_cmd_doc, get_cmd_ex, get_interface_summaries, \
+        _get_interface_spec_id
     # setup cmdline args parser
     parts = {}
     # main parser
@@ -181,6 +182,14 @@ def setup_parser(
         of the command; 'continue' works like 'ignore', but an error causes a
         non-zero exit code; 'stop' halts on first failure and yields non-zero exit
         code. A failure is any result with status 'impossible' or 'error'.""")
+    parser.add_argument(
+        '--trace-subprocesses', action='store_true',
+        dest='common_trace_subprocesses',
+        help="""record all external commands (e.g. git, git-annex) that are
+        executed, and report their number and timing per command type on exit.
+        The same can be achieved by setting the DATALAD_TRACE environment
+        variable. If DATALAD_TRACE_FILE is set to a file name, a trace of all
+        commands is written to it in Chrome's trace event format.""")
     parser.add_argument(
         '--cmd', dest='_', action='store_true',
         help="""syntactical helper that can be used to end the list of global
@@ -225,8 +234,12 @@ def setup_parser(
     # or a command. Among unknown could be --help/--help-np which would
     # need to be dealt with
     unparsed_arg = unparsed_args[0] if unparsed_args else None
+    # only the general help is requested, for which no command needs to be
+    # loaded
+    only_help_summary = False
     if need_single_subparser is not None \
             or unparsed_arg in ('--help', '--help-np', '-h'):
+        only_help_summary = need_single_subparser is None and not completing
         need_single_subparser = False
         if not help_ignore_extensions:
             add_entrypoints_to_interface_groups(interface_groups)
@@ -278,6 +291,9 @@ def setup_parser(
     helpers.parser_add_common_opt(parser, 'help')
 
     grp_short_descriptions = defaultdict(list)
+    # cached short descriptions of all commands
+    summaries = get_interface_summaries(interface_groups) \
+        if only_help_summary else None
     # create subparser, use module suffix as cmd name
     subparsers = parser.add_subparsers()
     for group_name, _, _interfaces \
@@ -286,6 +302,16 @@ def setup_parser(
             cmd_name = get_cmdline_command_name(_intfspec)
             if need_single_subparser and cmd_name != need_single_subparser:
                 continue
+            if summaries is not None:
+                # no need to set up a full parser for listing the command
+                sdescr = summaries.get(_get_interface_spec_id(_intfspec))
+                if sdescr is None:
+                    continue
+                parts[cmd_name] = subparsers.add_parser(
+                    cmd_name, add_help=False, description=sdescr[1])
+                grp_short_descriptions[group_name].append(
+                    (cmd_name, sdescr[1]))
+                continue
             _intf = load_interface(_intfspec)
             if _intf is None:
                 # TODO(yoh):  add doc why we could skip this one... makes this
@@ -409,23 +435,9 @@ def get_commands_from_groups(groups):
 
 def add_entrypoints_to_interface_groups(interface_groups):
     lgr.debug("Loading entrypoints")
-    from pkg_resources import iter_entry_points  # delay expensive import
-    for ep in iter_entry_points('datalad.extensions'):
-        lgr.debug(
-            'Loading entrypoint %s from datalad.extensions for docs building',
-            ep.name)
-        try:
-            spec = ep.load()
-            if len(spec) < 2 or not spec[1]:
-                lgr.debug(
-                    'Extension does not provide a command suite: %s',
-                    ep.name)
-                continue
-            interface_groups.append((ep.name, spec[0], spec[1]))
-            lgr.debug('Loaded entrypoint %s', ep.name)
-        except Exception as e:
-            lgr.warning('Failed to load entrypoint %s: %s', ep.name, exc_str(e))
-            continue
+    # the entrypoints are only scanned, if the installed packages changed
+    from ..interface.base import get_extension_interface_groups
+    interface_groups.extend(get_extension_interface_groups())
 
 def _fix_datalad_ri(s):
     """Fixup argument if it was a DataLadRI and had leading / removed
@@ -499,6 +511,10 @@ def main(args=None):
     # enable overrides
     datalad.cfg.reload(force=True)
 
+    if cmdlineargs.common_trace_subprocesses:
+        from datalad.support.tracer import subprocess_tracer
+        subprocess_tracer.enable()
+
     if cmdlineargs.change_path is not None:
         from .common_args import change_path as change_path_opt
         for path in cmdlineargs.change_path:
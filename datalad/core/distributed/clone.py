@@ -13,6 +13,7 @@ import logging
 import re
 import requests
 from os.path import expanduser
+from time import time
 from collections import OrderedDict
 from urllib.parse import unquote as urlunquote
 
@@ -418,6 +419,9 @@ def clone_dataset(
         unit=' Candidate locations',
     )
     error_msgs = OrderedDict()  # accumulate all error messages formatted per each url
+    # time spent in the individual phases of the clone
+    timings = OrderedDict()
+    t0 = time()
     for cand in candidate_sources:
         log_progress(
             lgr.info,
@@ -430,6 +434,19 @@ def clone_dataset(
 
         if cand.get('version', None):
             clone_opts['branch'] = cand['version']
+        # configuration that is known before the clone is made is written
+        # by git-clone in one go, instead of one git-config call per
+        # setting after the fact
+        clone_cfg = _get_clone_config(cand, reckless)
+        if clone_cfg:
+            clone_opts['config'] = [
+                '{}={}'.format(k, v) for k, v in clone_cfg.items()]
+        if cand['type'] == 'ria' and reckless in ('auto', 'ephemeral') \
+                and cand['giturl'].startswith('file:'):
+            # for a RIA store on a local or shared file system, reference
+            # the store's Git objects via alternates, rather than copying
+            # or hard-linking them
+            clone_opts['shared'] = True
         try:
             # TODO for now GitRepo.clone() cannot handle Path instances, and PY35
             # doesn't make it happen seemlessly
@@ -482,6 +499,7 @@ def clone_dataset(
         'cloneds',
         'Completed clone attempts for %s', destds
     )
+    timings['clone'] = time() - t0
 
     if not destds.is_installed():
         if len(error_msgs):
@@ -512,6 +530,7 @@ def clone_dataset(
             **result_props)
         return
 
+    t0 = time()
     if not cand.get("version"):
         postclone_check_head(destds)
 
@@ -521,18 +540,23 @@ def clone_dataset(
     if reckless and reckless.startswith('shared-'):
         lgr.debug('Reinit %s to enable shared access permissions', destds)
         destds.repo.call_git(['init', '--shared={}'.format(reckless[7:])])
+    timings['checkout'] = time() - t0
 
+    t0 = time()
     yield from postclonecfg_annexdataset(
         destds,
         reckless,
         description)
+    timings['annex-setup'] = time() - t0
 
     # perform any post-processing that needs to know details of the clone
     # source
     if result_props['source']['type'] == 'ria':
+        t0 = time()
         yield from postclonecfg_ria(destds, result_props['source'])
+        timings['ria-setup'] = time() - t0
 
-    if reckless:
+    if reckless and destds.config.get('datalad.clone.reckless') != reckless:
         # store the reckless setting in the dataset to make it
         # known to later clones of subdatasets via get()
         destds.config.set(
@@ -540,6 +564,10 @@ def clone_dataset(
             where='local',
             reload=True)
 
+    lgr.debug(
+        'Time spent on cloning %s: %s', destds,
+        ', '.join('{} {:.3f}s'.format(k, v) for k, v in timings.items()))
+
     # yield successful clone of the base dataset now, as any possible
     # subdataset clone down below will not alter the Git-state of the
     # parent
@@ -579,34 +607,73 @@ def postclone_check_head(ds):
                     "with commits", ds.path)
 
 
-def postclonecfg_ria(ds, props):
-    """Configure a dataset freshly cloned from a RIA store"""
-    repo = ds.repo
-    # RIA uses hashdir mixed, copying data to it via git-annex (if cloned via
-    # ssh) would make it see a bare repo and establish a hashdir lower annex
-    # object tree.
-    # Moreover, we want the ORA remote to receive all data for the store, so its
-    # objects could be moved into archives (the main point of a RIA store).
-    RIA_REMOTE_NAME = 'origin'  # don't hardcode everywhere
-    ds.config.set(
-        'remote.{}.annex-ignore'.format(RIA_REMOTE_NAME), 'true',
-        where='local')
-
-    # chances are that if this dataset came from a RIA store, its subdatasets
-    # may live there too. Place a subdataset source candidate config that makes
-    # get probe this RIA store when obtaining subdatasets
-    ds.config.set(
+def _get_clone_config(props, reckless):
+    """Configuration for a new clone from the source described by `props`
+
+    Returns
+    -------
+    OrderedDict
+    """
+    cfg = OrderedDict()
+    if reckless:
+        # store the reckless setting in the dataset to make it
+        # known to later clones of subdatasets via get()
+        cfg['datalad.clone.reckless'] = reckless
+        if reckless == 'auto':
+            # hardlink annex content from local sources, if possible
+            cfg['annex.hardlink'] = 'true'
+        elif reckless == 'ephemeral':
+            # we don't want annex copy-to origin
+            cfg['remote.origin.annex-ignore'] = 'true'
+    if props['type'] == 'ria':
+        cfg.update(_get_ria_config(props))
+    return cfg
+
+
+RIA_REMOTE_NAME = 'origin'  # don't hardcode everywhere
+
+
+def _get_ria_config(props):
+    """Configuration for a new clone from a RIA store"""
+    return OrderedDict([
+        # RIA uses hashdir mixed, copying data to it via git-annex (if cloned
+        # via ssh) would make it see a bare repo and establish a hashdir lower
+        # annex object tree.
+        # Moreover, we want the ORA remote to receive all data for the store,
+        # so its objects could be moved into archives (the main point of a RIA
+        # store).
+        ('remote.{}.annex-ignore'.format(RIA_REMOTE_NAME), 'true'),
+        # chances are that if this dataset came from a RIA store, its
+        # subdatasets may live there too. Place a subdataset source candidate
+        # config that makes get probe this RIA store when obtaining
+        # subdatasets.
         # we use the label 'origin' for this candidate in order to not have to
         # generate a complicated name from the actual source specification.
         # we pick a cost of 200 to sort it before datalad's default candidates
         # for non-RIA URLs, because they prioritize hierarchical layouts that
         # cannot be found in a RIA store
-        'datalad.get.subdataset-source-candidate-200origin',
-        # use the entire original URL, up to the fragment + plus dataset ID
-        # placeholder, this should make things work with any store setup we
-        # support (paths, ports, ...)
-        props['source'].split('#', maxsplit=1)[0] + '#{id}',
-        where='local')
+        ('datalad.get.subdataset-source-candidate-200origin',
+         # use the entire original URL, up to the fragment + plus dataset ID
+         # placeholder, this should make things work with any store setup we
+         # support (paths, ports, ...)
+         props['source'].split('#', maxsplit=1)[0] + '#{id}'),
+    ])
+
+
+def _set_missing_config(ds, cfg):
+    """Set any configuration in `cfg` that is not yet in place in `ds`"""
+    missing = [(k, v) for k, v in cfg.items() if ds.config.get(k) != v]
+    for k, v in missing:
+        ds.config.set(k, v, where='local', reload=False)
+    if missing:
+        ds.config.reload(force=True)
+
+
+def postclonecfg_ria(ds, props):
+    """Configure a dataset freshly cloned from a RIA store"""
+    repo = ds.repo
+    # normally, this was already taken care of by git-clone
+    _set_missing_config(ds, _get_ria_config(props))
 
     # setup publication dependency, if a corresponding special remote exists
     # and was enabled (there could be RIA stores that actually only have repos)
@@ -751,8 +818,7 @@ def postclonecfg_annexdataset(ds, reckless, description=None):
         lgr.debug(
             "Instruct annex to hardlink content in %s from local "
             "sources, if possible (reckless)", ds.path)
-        ds.config.set(
-            'annex.hardlink', 'true', where='local', reload=True)
+        _set_missing_config(ds, {'annex.hardlink': 'true'})
 
     lgr.debug("Initializing annex repo at %s", ds.path)
     # Note, that we cannot enforce annex-init via AnnexRepo().
@@ -782,9 +848,7 @@ def postclonecfg_annexdataset(ds, reckless, description=None):
         # d1
 
         # we don't want annex copy-to origin
-        ds.config.set(
-            'remote.origin.annex-ignore', 'true',
-            where='local')
+        _set_missing_config(ds, {'remote.origin.annex-ignore': 'true'})
 
         ds.repo.set_remote_dead('here')
 
@@ -13,6 +13,11 @@
 __docformat__ = 'restructuredtext'
 
 from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
 import logging
 from tempfile import TemporaryFile
 
@@ -37,6 +42,7 @@ from datalad.support.annexrepo import (
 )
 from datalad.support.gitrepo import GitRepo
 from datalad.support.param import Parameter
+from datalad.support.parallel import get_n_jobs
 from datalad.support.constraints import (
     EnsureStr,
     EnsureNone,
@@ -78,7 +84,8 @@ class Push(Interface):
     specification of a reference dataset. In recursive mode subdatasets will also be
     evaluated, and only those subdatasets are pushed where a change was
     recorded that is reflected in the current state of the top-level reference
-    dataset.
+    dataset. With more than one job, multiple datasets are pushed
+    concurrently, but any subdataset is pushed before its superdataset.
     << REFLOW ||
 
     .. note::
@@ -252,18 +259,24 @@ class Push(Interface):
             recursive,
             recursion_limit)
 
-        # instead of a loop, this could all be done in parallel
         matched_anything = False
-        for dspath, dsrecords in ds_spec:
-            matched_anything = True
-            lgr.debug('Attempt push of Dataset at %s', dspath)
-            pbars = {}
-            yield from _push(
-                dspath, dsrecords, to, data, force, jobs, res_kwargs.copy(), pbars,
+        if get_n_jobs(jobs) > 1:
+            ds_spec = list(ds_spec)
+            matched_anything = bool(ds_spec)
+            yield from _push_concurrently(
+                ds_spec, to, data, force, jobs, res_kwargs,
                 got_path_arg=True if path else False)
-            # take down progress bars for this dataset
-            for i, ds in pbars.items():
-                log_progress(lgr.info, i, 'Finished push of %s', ds)
+        else:
+            for dspath, dsrecords in ds_spec:
+                matched_anything = True
+                lgr.debug('Attempt push of Dataset at %s', dspath)
+                pbars = {}
+                yield from _push(
+                    dspath, dsrecords, to, data, force, jobs, res_kwargs.copy(),
+                    pbars, got_path_arg=True if path else False)
+                # take down progress bars for this dataset
+                for i, ds in pbars.items():
+                    log_progress(lgr.info, i, 'Finished push of %s', ds)
         if not matched_anything:
             yield dict(
                 res_kwargs,
@@ -274,11 +287,18 @@ class Push(Interface):
             )
 
     @staticmethod
-    def custom_result_summary_renderer(results):  # pragma: more cover
+    def custom_result_summary_aggregate(res, hints):
+        # collect all unique hints
+        if hints is None:
+            hints = []
+        hint = res.get('hints', None)
+        if hint is not None and hint not in hints:
+            hints.append(hint)
+        return hints
+
+    @staticmethod
+    def custom_result_summary_renderer(hints):  # pragma: more cover
         # report on any hints at the end
-        # get all unique hints
-        hints = set([r.get('hints', None) for r in results])
-        hints = [hint for hint in hints if hint is not None]
         if hints:
             from datalad.ui import ui
             from datalad.support import ansi_colors
@@ -376,6 +396,66 @@ def _datasets_since_(dataset, since, paths, recursive, recursion_limit):
         yield (cur_ds, ds_res)
 
 
+def _push_concurrently(ds_spec, target, data, force, jobs, res_kwargs,
+                       got_path_arg=False):
+    """Push up to `jobs` datasets at the same time
+
+    A dataset is only pushed once all its subdatasets that are to be pushed
+    have been processed, such that a sibling never references a subdataset
+    commit that it cannot obtain. Results are yielded as soon as the push
+    of a dataset is complete.
+
+    The `jobs` are shared among the datasets pushed at the same time, i.e.
+    the data transfer of each dataset uses an even share of them, instead
+    of all of them.
+    """
+    # we need to know the full set of datasets to schedule anything
+    content = OrderedDict(ds_spec)
+    n_jobs = get_n_jobs(jobs)
+    # number of parallel annex transfers per dataset, such that no more
+    # than `jobs` run in total
+    annex_jobs = n_jobs // max(1, min(n_jobs, len(content)))
+    annex_jobs = annex_jobs if annex_jobs > 1 else None
+    dspaths = {dspath: Path(dspath) for dspath in content}
+    # for each dataset, the subdatasets that need to be pushed first
+    waiting = {
+        dspath: set(
+            d for d, p in dspaths.items() if dspaths[dspath] in p.parents)
+        for dspath in dspaths
+    }
+
+    def _push_to_list(dspath, pbars):
+        lgr.debug('Attempt push of Dataset at %s', dspath)
+        return list(_push(
+            dspath, content[dspath], target, data, force, annex_jobs,
+            res_kwargs.copy(), pbars, got_path_arg=got_path_arg))
+
+    running = {}
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+
+        def _submit_ready():
+            for dspath in [d for d, subds in waiting.items() if not subds]:
+                del waiting[dspath]
+                pbars = {}
+                running[executor.submit(_push_to_list, dspath, pbars)] = \
+                    (dspath, pbars)
+
+        _submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                dspath, pbars = running.pop(future)
+                yield from future.result()
+                # take down progress bars for this dataset
+                for i, ds in pbars.items():
+                    log_progress(lgr.info, i, 'Finished push of %s', ds)
+                # even a failed push releases the superdatasets, just like
+                # a sequential push would continue with the next dataset
+                for subds in waiting.values():
+                    subds.discard(dspath)
+            _submit_ready()
+
+
 def _push(dspath, content, target, data, force, jobs, res_kwargs, pbars,
           done_fetch=None, got_path_arg=False):
     if not done_fetch:
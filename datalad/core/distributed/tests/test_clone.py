@@ -679,6 +679,29 @@ def _move2store(storepath, d):
     Runner(cwd=store_loc).run(['git', 'update-server-info'])
 
 
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+def test_ria_file_clone_config(lcl, storepath):
+    lcl = Path(lcl)
+    storepath = Path(storepath)
+    ds = Dataset(lcl / 'ds').create()
+    _move2store(storepath, ds)
+    url = 'ria+{}#{}'.format(storepath.as_uri(), ds.id)
+    for reckless in (None, 'auto'):
+        riaclone = clone(url, lcl / 'clone{}'.format(reckless),
+                         reckless=reckless)
+        cfg = ConfigManager(dataset=riaclone, source='dataset-local')
+        # RIA config is in place right after the clone
+        eq_(cfg.get('remote.origin.annex-ignore'), 'true')
+        eq_(cfg.get('datalad.get.subdataset-source-candidate-200origin'),
+            'ria+{}#{{id}}'.format(storepath.as_uri()))
+        eq_(cfg.get('datalad.clone.reckless'), reckless)
+        # local store objects are only referenced in reckless mode
+        eq_((riaclone.pathobj / '.git' / 'objects' / 'info' /
+             'alternates').exists(),
+            reckless == 'auto')
+
+
 @slow  # 12sec on Yarik's laptop
 @with_tree(tree={
     'ds': {
@@ -11,6 +11,7 @@
 """
 
 import logging
+from unittest.mock import patch
 
 from datalad.distribution.dataset import Dataset
 from datalad.support.exceptions import (
@@ -47,8 +48,12 @@ from datalad.utils import (
 from datalad.support.gitrepo import GitRepo
 from datalad.support.annexrepo import AnnexRepo
 from datalad.core.distributed.clone import Clone
-from datalad.core.distributed.push import Push
+from datalad.core.distributed.push import (
+    Push,
+    _push,
+)
 from datalad.support.network import get_local_file_url
+from datalad.support.parallel import SUBPROCESSES_IN_THREADS
 
 DEFAULT_REFSPEC = "refs/heads/{0}:refs/heads/{0}".format(DEFAULT_BRANCH)
 
@@ -373,6 +378,44 @@ def test_push_recursive(
             refspec=DEFAULT_REFSPEC)
 
 
+@with_tempfile(mkdir=True)
+def test_push_recursive_concurrent(path):
+    if not SUBPROCESSES_IN_THREADS:
+        raise SkipTest("No concurrent push with this Python version")
+    path = Path(path)
+    top = Dataset(path / 'top').create(annex=False)
+    subs = [top.create('sub{}'.format(i), annex=False) for i in range(3)]
+    subsubs = [s.create('subsub', annex=False) for s in subs]
+    top.save(recursive=True)
+    assert_repo_status(top.path)
+    dss = [top] + subs + subsubs
+    targets = [
+        mk_push_target(d, 'target', str(path / 'targets' / str(i)),
+                       annex=False, bare=True)
+        for i, d in enumerate(dss)]
+
+    with patch('datalad.core.distributed.push._push', wraps=_push) \
+            as push_ds:
+        res = top.push(to='target', recursive=True, jobs=3)
+    # the jobs are shared among the datasets, rather than multiplied
+    eq_(len(push_ds.call_args_list), len(dss))
+    for call in push_ds.call_args_list:
+        eq_(call[0][5], None)
+    for d in dss:
+        assert_in_results(
+            res, action='publish', status='ok', type='dataset', path=d.path,
+            refspec=DEFAULT_REFSPEC)
+    # subdatasets are pushed before their superdatasets
+    order = [r['path'] for r in res
+             if r['action'] == 'publish' and r['type'] == 'dataset']
+    for sub, subsub in zip(subs, subsubs):
+        ok_(order.index(subsub.path) < order.index(sub.path)
+            < order.index(top.path))
+    for d, target in zip(dss, targets):
+        eq_(list(d.repo.get_branch_commits_(DEFAULT_BRANCH)),
+            list(target.get_branch_commits_(DEFAULT_BRANCH)))
+
+
 @slow  # 12sec on Yarik's laptop
 @with_tempfile(mkdir=True)
 @with_tempfile(mkdir=True)
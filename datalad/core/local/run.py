@@ -13,6 +13,9 @@ __docformat__ = 'restructuredtext'
 
 import logging
 import json
+import os
+import sys
+import threading
 import warnings
 
 from argparse import REMAINDER
@@ -32,16 +35,25 @@ from datalad.interface.base import Interface
 from datalad.interface.utils import eval_results
 from datalad.interface.base import build_doc
 from datalad.interface.results import get_status_dict
-from datalad.interface.common_opts import save_message_opt
+from datalad.interface.common_opts import (
+    jobs_opt,
+    save_message_opt,
+)
 
 from datalad.config import anything2bool
 
+from datalad.cmd import (
+    NoCapture,
+    WitlessProtocol,
+    WitlessRunner,
+)
 from datalad.support.constraints import EnsureChoice
 from datalad.support.constraints import EnsureNone
 from datalad.support.constraints import EnsureBool
 from datalad.support.exceptions import CommandError
 from datalad.support.globbedpaths import GlobbedPaths
 from datalad.support.param import Parameter
+from datalad.support.parallel import SUBPROCESSES_IN_THREADS
 from datalad.support.json_py import dump2stream
 
 from datalad.distribution.dataset import Dataset
@@ -56,7 +68,9 @@ from datalad.utils import (
     get_dataset_root,
     getpwd,
     join_cmdline,
+    on_windows,
     quote_cmdlinearg,
+    rmtree,
     SequenceFormatter,
 )
 
@@ -87,6 +101,11 @@ class Run(Interface):
     If the given command errors, a `CommandError` exception with the same exit
     code will be raised, and no modifications will be saved.
 
+    The output of the command is not processed by DataLad. Optionally, the
+    tail of the command output ('datalad.run.record-output' configuration
+    variable) and its resource usage ('datalad.run.record-resources') can be
+    included in the run record.
+
     *Command format*
 
     || REFLOW >>
@@ -220,6 +239,18 @@ class Run(Interface):
             '.datalad/runinfo' directory (customizable via the
             'datalad.run.record-directory' configuration variable).""",
             constraints=EnsureNone() | EnsureBool()),
+        jobs=jobs_opt,
+        stream_inputs=Parameter(
+            args=("--stream-inputs",),
+            action="store_true",
+            doc="""Start the command right after the retrieval of inputs
+            was initiated, rather than waiting for all inputs to be present.
+            Content is retrieved in the background while the command runs,
+            hence the command itself must be prepared to wait for inputs
+            to appear (annexed file content appears atomically once
+            complete). Any required subdatasets are still installed
+            beforehand. Python versions before 3.8 do not support this, and
+            always retrieve inputs before the command starts."""),
     )
 
     @staticmethod
@@ -233,13 +264,17 @@ class Run(Interface):
             expand=None,
             explicit=False,
             message=None,
-            sidecar=None):
+            sidecar=None,
+            jobs=None,
+            stream_inputs=False):
         for r in run_command(cmd, dataset=dataset,
                              inputs=inputs, outputs=outputs,
                              expand=expand,
                              explicit=explicit,
                              message=message,
-                             sidecar=sidecar):
+                             sidecar=sidecar,
+                             jobs=jobs,
+                             stream_inputs=stream_inputs):
             yield r
 
 
@@ -323,7 +358,8 @@ def _install_and_reglob(dset_path, gpaths):
         dirs, dirs_new = dirs_new, glob_dirs()
 
 
-def prepare_inputs(dset_path, inputs, extra_inputs=None):
+def prepare_inputs(dset_path, inputs, extra_inputs=None, jobs=None,
+                   get_content=True):
     """Prepare `inputs` for running a command.
 
     This consists of installing required subdatasets and getting the input
@@ -334,6 +370,11 @@ def prepare_inputs(dset_path, inputs, extra_inputs=None):
     dset_path : str
     inputs : GlobbedPaths object
     extra_inputs : GlobbedPaths object, optional
+    jobs : int or 'auto' or None, optional
+        Number of parallel jobs to get content with.
+    get_content : bool, optional
+        If False, only install subdatasets, but do not get file content (see
+        `InputGetter`).
 
     Returns
     -------
@@ -345,16 +386,66 @@ def prepare_inputs(dset_path, inputs, extra_inputs=None):
     if gps:
         lgr.info('Making sure inputs are available (this may take some time)')
 
-    get = Get()
     for gp in gps:
         for res in _install_and_reglob(dset_path, gp):
             yield res
-        for res in get(dataset=dset_path, path=gp.expand(), on_failure="ignore"):
-            if _is_nonexistent_path(res):
-                # MIH why just a warning if given inputs are not valid?
-                lgr.warning("Input does not exist: %s", res["path"])
-            else:
-                yield res
+        if not get_content:
+            continue
+        for res in _get_inputs(dset_path, gp.expand(), jobs=jobs):
+            yield res
+
+
+def _get_inputs(dset_path, paths, jobs=None):
+    for res in Get()(dataset=dset_path, path=paths, jobs=jobs,
+                     on_failure="ignore"):
+        if _is_nonexistent_path(res):
+            # MIH why just a warning if given inputs are not valid?
+            lgr.warning("Input does not exist: %s", res["path"])
+        else:
+            yield res
+
+
+class InputGetter(threading.Thread):
+    """Get the content of inputs in the background
+
+    Results are collected and made available by `results()`, once the
+    retrieval has finished.
+
+    Parameters
+    ----------
+    dset_path : str
+    gpaths : list of GlobbedPaths objects
+    jobs : int or 'auto' or None, optional
+    """
+    def __init__(self, dset_path, gpaths, jobs=None):
+        super(InputGetter, self).__init__(name="datalad-run-inputs")
+        self.daemon = True
+        # resolve now, relative paths would be interpreted relative to
+        # whatever the working directory is once the thread runs
+        self._paths = [p for gp in gpaths for p in gp.expand(full=True)]
+        self._dset_path = dset_path
+        self._jobs = jobs
+        self._results = []
+        self._exc = None
+
+    def run(self):
+        if not self._paths:
+            return
+        try:
+            self._results.extend(
+                _get_inputs(self._dset_path, self._paths, jobs=self._jobs))
+        except Exception as e:
+            self._exc = e
+
+    def results(self):
+        """Wait for the retrieval to finish and return its result records
+
+        Any exception raised during the retrieval is re-raised.
+        """
+        self.join()
+        if self._exc is not None:
+            raise self._exc
+        return self._results
 
 
 def _unlock_or_remove(dset_path, paths):
@@ -453,43 +544,166 @@ def format_command(dset, command, **kwds):
     return sfmt.format(command, **kwds)
 
 
-def _execute_command(command, pwd, expected_exit=None):
-    from datalad.cmd import Runner
+class OutputTail(WitlessProtocol):
+    """WitlessProtocol that passes output through and keeps its tail
 
+    Any output of the subprocess is immediately written to the stdout/stderr
+    of this process, without any line processing. The last `tail_size` bytes
+    of each stream are kept in a buffer and returned as 'stdout' and
+    'stderr' in the result.
+    """
+    proc_out = True
+    proc_err = True
+
+    def __init__(self, done_future, tail_size=0, encoding=None):
+        super().__init__(done_future, encoding=encoding)
+        self.tail_size = tail_size
+
+    def pipe_data_received(self, fd, data):
+        self._log(fd, data)
+        stream = sys.stdout if fd == 1 else sys.stderr
+        try:
+            stream.buffer.write(data)
+        except AttributeError:
+            # e.g. a StringIO, as used by swallow_outputs()
+            stream.write(data.decode(self.encoding, errors='replace'))
+        stream.flush()
+        buf = self.buffer[fd - 1]
+        buf.extend(data[-self.tail_size:])
+        if len(buf) > self.tail_size:
+            del buf[:len(buf) - self.tail_size]
+
+    def _prepare_result(self):
+        results = super()._prepare_result()
+        # the tail may begin in the middle of a multi-byte character
+        for name, byt in zip(self.FD_NAMES[1:], self.buffer):
+            results[name] = bytes(byt).decode(self.encoding, errors='replace')
+        return results
+
+
+# Executed with the current Python interpreter to report on the resource usage
+# of a command. It runs the command (all arguments after the first), waits for
+# it via os.wait4(), writes the collected usage as JSON to the file given as
+# the first argument and then exits like the command did.
+_RESOURCE_PROBE = """import json, os, signal, subprocess, sys, time
+start = time.time()
+proc = subprocess.Popen(sys.argv[2:])
+# the command receives any interrupt itself, we just wait for it to finish
+signal.signal(signal.SIGINT, signal.SIG_IGN)
+_, status, ru = os.wait4(proc.pid, 0)
+proc.returncode = 0
+with open(sys.argv[1], 'w') as f:
+    json.dump({
+        'wall_time': round(time.time() - start, 3),
+        'user_time': round(ru.ru_utime, 3),
+        'system_time': round(ru.ru_stime, 3),
+        # kilobytes, but bytes on macOS
+        'max_rss': ru.ru_maxrss * (1 if sys.platform == 'darwin' else 1024),
+    }, f)
+if os.WIFSIGNALED(status):
+    signal.signal(os.WTERMSIG(status), signal.SIG_DFL)
+    os.kill(os.getpid(), os.WTERMSIG(status))
+sys.exit(os.WEXITSTATUS(status))
+"""
+
+
+def _get_command_argv(command):
+    """Turn a command into a list of arguments for `WitlessRunner`
+
+    A string is executed by the shell, like `subprocess.Popen(shell=True)`
+    would do.
+    """
+    if not isinstance(command, str):
+        return command
+    if on_windows:
+        return [os.environ.get('COMSPEC', 'cmd.exe'), '/c', command]
+    return ['/bin/sh', '-c', command]
+
+
+def _execute_command(command, pwd, expected_exit=None, output_tail=0,
+                     probe_resources=False):
+    """Execute `command` in `pwd`
+
+    Parameters
+    ----------
+    command : str or list
+    pwd : str
+    expected_exit : int, optional
+        If given and the command fails with a different exit code, the
+        CommandError is raised rather than returned.
+    output_tail : int, optional
+        If positive, the last `output_tail` bytes of the command's stdout
+        and stderr are kept and reported. Otherwise, the output is not
+        handled by DataLad at all.
+    probe_resources : bool, optional
+        Whether to report the wall time, CPU time, and peak memory usage of
+        the command (not supported on Windows).
+
+    Returns
+    -------
+    tuple
+        Exit code, CommandError (or None), and a dict with the keys 'output'
+        and/or 'resources' for any information that was requested to be
+        collected.
+    """
     exc = None
     cmd_exitcode = None
-    runner = Runner(cwd=pwd)
+    info = {}
+    argv = _get_command_argv(command)
+    probe_file = None
+    if probe_resources and not hasattr(os, 'wait4'):
+        lgr.warning("Resource usage cannot be probed on this platform")
+    elif probe_resources:
+        probe_file = op.join(mkdtemp(prefix="datalad-run-"), 'resources.json')
+        argv = [sys.executable, '-c', _RESOURCE_PROBE, probe_file] + argv
+    if output_tail > 0:
+        protocol = OutputTail
+        protocol_kwargs = dict(tail_size=output_tail)
+    else:
+        # all output goes straight to where our own output goes
+        protocol = NoCapture
+        protocol_kwargs = {}
+
+    runner = WitlessRunner(cwd=pwd, env=os.environ)
     try:
         lgr.info("== Command start (output follows) =====")
-        runner.run(
-            command,
-            # immediate output
-            log_online=True,
-            # not yet sure what we should do with the command output
-            # IMHO `run` itself should be very silent and let the command talk
-            log_stdout=False,
-            log_stderr=False,
-            expect_stderr=True,
-            expect_fail=True,
-            # TODO stdin
-        )
-    except CommandError as e:
-        # strip our own info from the exception. The original command output
-        # went to stdout/err -- we just have to exitcode in the same way
-        exc = e
-        cmd_exitcode = e.code
-
-        if expected_exit is not None and expected_exit != cmd_exitcode:
-            # we failed in a different way during a rerun.  This can easily
-            # happen if we try to alter a locked file
-            #
-            # TODO add the ability to `git reset --hard` the dataset tree on failure
-            # we know that we started clean, so we could easily go back, needs gh-1424
-            # to be able to do it recursively
-            raise exc
+        try:
+            out = runner.run(argv, protocol=protocol, **protocol_kwargs)
+        except CommandError as e:
+            # strip our own info from the exception. The original command
+            # output went to stdout/err -- we just have to exitcode in the
+            # same way
+            e.cmd = command
+            exc = e
+            cmd_exitcode = e.code
+            out = {'stdout': e.stdout, 'stderr': e.stderr}
+
+        if output_tail > 0:
+            info['output'] = {k: out[k] for k in ('stdout', 'stderr')
+                              if out.get(k)}
+        if probe_file:
+            try:
+                with open(probe_file) as f:
+                    info['resources'] = json.load(f)
+            except (OSError, ValueError) as e:
+                lgr.warning("Failed to read resource usage of the command: %s",
+                            e)
+    finally:
+        if probe_file:
+            rmtree(op.dirname(probe_file))
+
+    if exc is not None and expected_exit is not None \
+            and expected_exit != cmd_exitcode:
+        # we failed in a different way during a rerun.  This can easily
+        # happen if we try to alter a locked file
+        #
+        # TODO add the ability to `git reset --hard` the dataset tree on failure
+        # we know that we started clean, so we could easily go back, needs gh-1424
+        # to be able to do it recursively
+        raise exc
 
     lgr.info("== Command exit (modification check follows) =====")
-    return cmd_exitcode or 0, exc
+    return cmd_exitcode or 0, exc, info
 
 
 def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
@@ -498,7 +712,9 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
                 rerun_info=None,
                 extra_inputs=None,
                 rerun_outputs=None,
-                inject=False):
+                inject=False,
+                jobs=None,
+                stream_inputs=False):
     """Run `cmd` in `dataset` and record the results.
 
     `Run.__call__` is a simple wrapper over this function. Aside from backward
@@ -527,6 +743,11 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
         preparation and command execution. In this mode, the caller is
         responsible for ensuring that the state of the working tree is
         appropriate for recording the command's results.
+    jobs : int or 'auto' or None, optional
+        Number of parallel jobs to get inputs with.
+    stream_inputs : bool, optional
+        Get the content of inputs in the background while the command is
+        already running (unless `SUBPROCESSES_IN_THREADS` is false).
 
     Yields
     ------
@@ -536,6 +757,12 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
         lgr.warning("No command given")
         return
 
+    if stream_inputs and not SUBPROCESSES_IN_THREADS:
+        lgr.debug('Background retrieval of inputs is not supported by '
+                  'Python %s, retrieving them upfront',
+                  sys.version.split()[0])
+        stream_inputs = False
+
     rel_pwd = rerun_info.get('pwd') if rerun_info else None
     if rel_pwd and dataset:
         # recording is relative to the dataset
@@ -568,21 +795,32 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
 
     cmd = normalize_command(cmd)
 
+    # match input globs against the index rather than the file system
+    inputs_repo = ds.repo \
+        if ds.config.obtain('datalad.run.inputs-from-index') else None
     inputs = GlobbedPaths(inputs, pwd=pwd,
-                          expand=expand in ["inputs", "both"])
+                          expand=expand in ["inputs", "both"],
+                          repo=inputs_repo)
     extra_inputs = GlobbedPaths(extra_inputs, pwd=pwd,
                                 # Follow same expansion rules as `inputs`.
-                                expand=expand in ["inputs", "both"])
+                                expand=expand in ["inputs", "both"],
+                                repo=inputs_repo)
     outputs = GlobbedPaths(outputs, pwd=pwd,
                            expand=expand in ["outputs", "both"])
 
     # ATTN: For correct path handling, all dataset commands call should be
     # unbound. They should (1) receive a string dataset argument, (2) receive
     # relative paths, and (3) happen within a chpwd(pwd) context.
+    input_getter = None
     if not inject:
         with chpwd(pwd):
-            for res in prepare_inputs(ds_path, inputs, extra_inputs):
+            for res in prepare_inputs(ds_path, inputs, extra_inputs,
+                                      jobs=jobs,
+                                      get_content=not stream_inputs):
                 yield res
+            if stream_inputs:
+                input_getter = InputGetter(
+                    ds_path, [inputs, extra_inputs], jobs=jobs)
 
             if outputs:
                 for res in _install_and_reglob(ds_path, outputs):
@@ -598,6 +836,7 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
         # so in extra_info.
         cmd_exitcode = 0
         exc = None
+        exec_info = {}
 
     try:
         cmd_expanded = format_command(
@@ -619,9 +858,21 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
         return
 
     if not inject:
-        cmd_exitcode, exc = _execute_command(
-            cmd_expanded, pwd,
-            expected_exit=rerun_info.get("exit", 0) if rerun_info else None)
+        if input_getter:
+            input_getter.start()
+        try:
+            cmd_exitcode, exc, exec_info = _execute_command(
+                cmd_expanded, pwd,
+                expected_exit=rerun_info.get("exit", 0) if rerun_info else None,
+                output_tail=ds.config.obtain('datalad.run.record-output'),
+                probe_resources=ds.config.obtain(
+                    'datalad.run.record-resources'))
+        finally:
+            if input_getter:
+                if input_getter.is_alive():
+                    lgr.info("Waiting for the retrieval of inputs to finish")
+                for res in input_getter.results():
+                    yield res
 
 
     # amend commit message with `run` info:
@@ -636,6 +887,8 @@ def run_command(cmd, dataset=None, inputs=None, outputs=None, expand=None,
         'extra_inputs': extra_inputs.paths,
         'outputs': outputs.paths,
     }
+    # command output tail and resource usage, if requested
+    run_info.update(exec_info)
     if rel_pwd is not None:
         # only when inside the dataset to not leak information
         run_info['pwd'] = rel_pwd
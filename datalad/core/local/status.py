@@ -454,34 +454,48 @@ class Status(Interface):
                 ac.color_word(type_, ac.MAGENTA) if type_ else '')))
 
     @staticmethod
-    def custom_result_summary_renderer(results):  # pragma: more cover
+    def custom_result_summary_aggregate(res, summary):
+        if summary is None:
+            summary = dict(annexed=0, size=0, present_size=0,
+                           have_availability=False, clean=True)
+        is_status = res.get('action', None) == 'status'
         # fish out sizes of annexed files. those will only be present
         # with --annex ...
-        annexed = [
-            (int(r['bytesize']), r.get('has_content', None))
-            for r in results
-            if r.get('action', None) == 'status' \
-            and 'key' in r and 'bytesize' in r]
+        if is_status and 'key' in res and 'bytesize' in res:
+            summary['annexed'] += 1
+            summary['size'] += int(res['bytesize'])
+            has_content = res.get('has_content', None)
+            if has_content is not None:
+                summary['have_availability'] = True
+            if has_content:
+                summary['present_size'] += int(res['bytesize'])
+        if not is_status or res.get('state', None) != 'clean':
+            summary['clean'] = False
+        return summary
+
+    @staticmethod
+    def custom_result_summary_renderer(summary):  # pragma: more cover
+        from datalad.ui import ui
+        if summary is None:
+            # no results at all
+            ui.message("nothing to save, working tree clean")
+            return
+        annexed = summary['annexed']
         if annexed:
-            have_availability = any(a[1] is not None for a in annexed)
-            total_size = bytes2human(sum(a[0] for a in annexed))
+            total_size = bytes2human(summary['size'])
             # we have availability info encoded in the results
-            from datalad.ui import ui
-            if have_availability:
+            if summary['have_availability']:
                 ui.message(
                     "{} annex'd {} ({}/{} present/total size)".format(
-                        len(annexed),
-                        single_or_plural('file', 'files', len(annexed)),
-                        bytes2human(sum(a[0] for a in annexed if a[1])),
+                        annexed,
+                        single_or_plural('file', 'files', annexed),
+                        bytes2human(summary['present_size']),
                         total_size))
             else:
                 ui.message(
                     "{} annex'd {} ({} recorded total size)".format(
-                        len(annexed),
-                        single_or_plural('file', 'files', len(annexed)),
+                        annexed,
+                        single_or_plural('file', 'files', annexed),
                         total_size))
-        if all(r.get('action', None) == 'status'
-               and r.get('state', None) == 'clean'
-               for r in results):
-            from datalad.ui import ui
+        if summary['clean']:
             ui.message("nothing to save, working tree clean")
@@ -13,6 +13,7 @@ Note: Tests of `run` that involve `rerun` are in interface.tests.test_run.
 
 __docformat__ = 'restructuredtext'
 
+import json
 import logging
 
 import os
@@ -345,6 +346,56 @@ def test_inputs_quotes_needed(path):
     ok_file_has_content(op.join(path, "out0"), "bar.txt foo!blah.txt!out0")
 
 
+@with_tree(tree={"a.dat": "a", "b.dat": "b", "c.txt": "c"})
+def test_run_stream_inputs(path):
+    ds = Dataset(path).create(force=True, annex=False)
+    ds.save()
+    ds.config.set('datalad.run.inputs-from-index', 'true', where='local')
+    create_tree(path, {"untracked.dat": "u"})
+    # the index and the file system disagree on this one
+    os.unlink(op.join(path, "b.dat"))
+    cmd = "import sys; open(sys.argv[-1], 'w').write(' '.join(sys.argv[1:-1]))"
+    res = ds.run([sys.executable, "-c", cmd, "{inputs}", "{outputs[0]}"],
+                 inputs=["*.dat"], outputs=["out"], expand="inputs",
+                 stream_inputs=True, jobs=2, explicit=True)
+    # the results of the background retrieval are reported
+    assert_in_results(res, action="get", path=op.join(path, "a.dat"))
+    assert_in_results(res, action="save", status="ok")
+    # inputs were matched against the index (which also lists untracked
+    # files), not the file system
+    ok_file_has_content(op.join(path, "out"), "a.dat b.dat untracked.dat")
+
+
+@with_tempfile(mkdir=True)
+def test_run_record_output_resources(path):
+    ds = Dataset(path).create(annex=False)
+    ds.config.set('datalad.run.record-output', '5', where='local')
+    if not on_windows:
+        ds.config.set('datalad.run.record-resources', 'true', where='local')
+    cmd = "import sys; sys.stderr.write('error'); " \
+          "open('out', 'w').write('0123456789'); print('0123456789')"
+    with swallow_outputs() as cmo:
+        ds.run([sys.executable, "-c", cmd])
+        # output is passed through
+        assert_in("0123456789", cmo.out)
+    record = json.loads(
+        last_commit_msg(ds.repo).split(
+            "=== Do not change lines below ===")[1].split("^^^")[0])
+    eq_(record["output"], {"stdout": "6789\n", "stderr": "error"})
+    if not on_windows:
+        eq_(set(record["resources"]),
+            {"wall_time", "user_time", "system_time", "max_rss"})
+        ok_(record["resources"]["max_rss"] > 0)
+
+    # the exit code of a failing command is still reported, also via the
+    # resource probe
+    with swallow_outputs():
+        with assert_raises(CommandError) as cme:
+            ds.run("exit 3")
+    eq_(cme.exception.code, 3)
+    eq_(cme.exception.cmd, "exit 3")
+
+
 @with_tree(tree={"foo": "f", "bar": "b"})
 def test_inject(path):
     ds = Dataset(path).create(force=True)
@@ -391,7 +442,8 @@ def test_run_cmdline_disambiguation(path):
                 main(["datalad", "run", "--", "--message"])
             exec_cmd.assert_called_once_with(
                 '"--message"' if on_windows else "--message",
-                path, expected_exit=None)
+                path, expected_exit=None, output_tail=0,
+                probe_resources=False)
 
         # And a twist on above: Our parser mishandles --version (gh-3067),
         # treating 'datalad run CMD --version' as 'datalad --version'.
@@ -13,7 +13,10 @@ __docformat__ = 'restructuredtext'
 import os
 from os.path import join as opj
 import os.path as op
-from collections import OrderedDict
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
 from operator import itemgetter
 import shutil
 
@@ -23,6 +26,7 @@ lgr.log(5, "Importing datalad.customremotes.archive")
 
 from ..dochelpers import exc_str
 from ..support.archives import ArchivesCache
+from ..support.exceptions import CommandError
 from ..support.network import URL
 from ..support.locking import lock_if_check_fails
 from ..support.path import exists
@@ -62,6 +66,130 @@ def link_file_load(src, dst, dry_run=False):
         lgr.log(2, "Hardlinking finished")
 
 
+class ArchiveURLIndex(object):
+    """Per-process index of archive member keys and their archive URLs
+
+    The index is built in a single pass over the URL logs (``*.log.web``)
+    on the git-annex branch, so that the URLs can be looked up for any
+    number of keys without a GETURLS round-trip through the special remote
+    protocol per key.
+
+    The git-annex branch does not include changes which are still in the
+    annex journal. Hence a key missing from the index must not be taken as
+    evidence that it has no URLs, and keys with a URL log in the journal
+    are not answered from the index.
+    """
+
+    def __init__(self, urls, journal_path=None):
+        """
+        Parameters
+        ----------
+        urls : dict
+          Mapping of a key to a list of its (present) URLs.
+        journal_path : str, optional
+          Path of the annex journal to check for pending URL log changes.
+        """
+        self._urls = urls
+        self._journal_path = journal_path
+        self._journal_mtime = None
+        self._journal_keys = set()
+
+    @classmethod
+    def from_repo(cls, repo, url_prefix, branch='git-annex'):
+        """Build an index from the URL logs on the git-annex branch of `repo`
+
+        Parameters
+        ----------
+        repo : GitRepo
+        url_prefix : str
+          Only URLs starting with this prefix (e.g. 'dl+archive:') are
+          considered.
+        branch : str, optional
+          Branch to read the logs from.
+        """
+        lgr.debug("Building index of %s URLs in %s", url_prefix, repo)
+        try:
+            out = repo.call_git(
+                ['grep', '-z', '--fixed-strings', '-e', url_prefix,
+                 branch, '--', '*.log.web'],
+                expect_fail=True)
+        except CommandError as exc:
+            # exit code 1 is "no match", anything else (e.g. no such
+            # branch) leaves us with no knowledge to index
+            if exc.code != 1:
+                lgr.debug("Failed to read URL logs: %s", exc_str(exc))
+            out = ''
+        # git-annex logs could contain multiple records per URL, the most
+        # recent one (by timestamp) states whether the URL is present
+        latest = {}
+        for line in out.splitlines():
+            fname, _, record = line.partition('\0')
+            try:
+                ts, status, url = record.split(None, 2)
+            except ValueError:
+                continue
+            # URLs claimed by special remotes are recorded with a ':' prefix
+            url = url.lstrip(':')
+            if not url.startswith(url_prefix):
+                continue
+            key = op.basename(fname)[:-len('.log.web')]
+            ts = float(ts.rstrip('s'))
+            prev = latest.get((key, url))
+            if prev is None or prev[0] <= ts:
+                latest[(key, url)] = (ts, status)
+        urls = defaultdict(list)
+        for (key, url), (_, status) in latest.items():
+            if status == '1':
+                urls[key].append(url)
+        lgr.debug("Indexed %d keys with %s URLs", len(urls), url_prefix)
+        return cls(
+            dict(urls),
+            journal_path=str(repo.dot_git / 'annex' / 'journal'))
+
+    def __len__(self):
+        return len(self._urls)
+
+    def __contains__(self, key):
+        return key in self._urls
+
+    def _get_journal_keys(self):
+        """Return the keys with a URL log in the journal
+
+        The journal is only listed again when it changed, git-annex
+        replaces journal files by renaming them into place. Keys stay in
+        the returned set once seen, as the index remains outdated for them
+        after the journal was committed to the git-annex branch.
+        """
+        try:
+            mtime = os.stat(self._journal_path).st_mtime_ns
+        except (OSError, TypeError):
+            # no journal (anymore)
+            return self._journal_keys
+        if mtime != self._journal_mtime:
+            # journal files are named after the path in the git-annex branch
+            # with '/' replaced by '_' and '_' by '__'. The hash directories
+            # contain no '_'.
+            self._journal_keys.update(
+                f[:-len('.log.web')].split('_', 2)[-1].replace('__', '_')
+                for f in os.listdir(self._journal_path)
+                if f.endswith('.log.web'))
+            self._journal_mtime = mtime
+        return self._journal_keys
+
+    def get_urls(self, key):
+        """Return the list of URLs known for a key
+
+        Returns
+        -------
+        list or None
+          None if the key is not indexed, or the index might be outdated
+          for it.
+        """
+        if key in self._get_journal_keys():
+            return None
+        return self._urls.get(key)
+
+
 # TODO: RF functionality not specific to being a custom remote (loop etc)
 #       into a separate class
 class ArchiveAnnexCustomRemote(AnnexCustomRemote):
@@ -78,6 +206,9 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
 
     AVAILABILITY = "local"
     COST = 500
+    # number of keys to look up via GETURLS before switching to a single
+    # index of all archive URLs on the git-annex branch
+    URL_INDEX_THRESHOLD = 10
 
     def __init__(self, persistent_cache=True, **kwargs):
         super(ArchiveAnnexCustomRemote, self).__init__(**kwargs)
@@ -87,6 +218,8 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
 
         self._last_url = None  # for heuristic to choose among multiple URLs
         self._cache = ArchivesCache(self.path, persistent=persistent_cache)
+        self._url_index = None
+        self._n_url_queries = 0
 
     def stop(self, *args):
         """Stop communication with annex"""
@@ -126,6 +259,31 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
     def cache(self):
         return self._cache
 
+    @property
+    def url_index(self):
+        """Index of archive URLs, built once per process (see `get_URLS`)"""
+        if self._url_index is None:
+            self._url_index = ArchiveURLIndex.from_repo(
+                self.repo, self.URL_PREFIX)
+        return self._url_index
+
+    def get_URLS(self, key):
+        """Gets URL(s) associated with a Key.
+
+        After `URL_INDEX_THRESHOLD` queries the URLs are taken from an
+        index of the git-annex branch, and only keys not (yet) in that index
+        are asked about through the protocol.
+        """
+        self._n_url_queries += 1
+        if self._url_index is not None \
+                or self._n_url_queries > self.URL_INDEX_THRESHOLD:
+            urls = self.url_index.get_urls(key)
+            if urls:
+                self.heavydebug("Got %d URL(s) for key %s from the index",
+                                len(urls), key)
+                return urls
+        return super(ArchiveAnnexCustomRemote, self).get_URLS(key)
+
     def _parse_url(self, url):
         """Parse url and return archive key, file within archive and additional attributes (such as size)
         """
@@ -19,10 +19,12 @@ from time import sleep
 
 from ..archives import (
     ArchiveAnnexCustomRemote,
+    ArchiveURLIndex,
     link_file_load,
 )
 from ..base import AnnexExchangeProtocol
 from ...support.annexrepo import AnnexRepo
+from ...support.gitrepo import GitRepo
 from ...consts import ARCHIVES_SPECIAL_REMOTE
 from .test_base import (
     BASE_INTERACTION_SCENARIOS,
@@ -36,6 +38,7 @@ from ...tests.utils import (
     assert_not_in,
     assert_true,
     chpwd,
+    create_tree,
     eq_,
     get_most_obscure_supported_name,
     in_,
@@ -53,6 +56,7 @@ from ...utils import (
     _path_,
     on_linux,
     on_osx,
+    rmtree,
     unlink,
 )
 from . import _get_custom_runner
@@ -342,3 +346,49 @@ def test_link_file_load(tempfile):
         assert_equal(f.read(), "LOAD")
     assert_equal(stats(tempfile, times=False), stats(tempfile2, times=False))
     unlink(tempfile2)  # TODO: next two with_tempfile
+
+
+@with_tree(tree={
+    'aaa': {'bbb': {
+        'KEY1.log.web':
+            '1507541150s 1 :dl+archive:AKEY1#path=d/f1&size=3\n'
+            '1507541151s 1 :dl+archive:AKEY2#path=f1\n'
+            '1507541152s 1 http://example.com/f1\n',
+        'KEY2.log.web':
+            '1507541150s 1 :dl+archive:AKEY1#path=d/f2\n'
+            # removed later on
+            '1507541150s 1 :dl+archive:AKEY3#path=f2\n'
+            '1507541160.5s 0 :dl+archive:AKEY3#path=f2\n',
+        'KEY3.log.web': '1507541150s 1 http://example.com/f3\n',
+        'KEY_4.log.web': '1507541150s 1 :dl+archive:AKEY1#path=f4\n',
+        'KEY3.log': '1507541150s 1 dl+archive:AKEY1#path=not-web\n',
+    }}})
+def test_archive_url_index(path):
+    repo = GitRepo(path, create=True)
+    repo.add('.')
+    repo.commit('logs')
+    repo.call_git(['branch', 'git-annex'])
+    remote = ArchiveAnnexCustomRemote
+    idx = ArchiveURLIndex.from_repo(repo, remote.URL_PREFIX)
+    eq_(len(idx), 3)
+    assert_not_in('KEY3', idx)
+    eq_(idx.get_urls('KEY3'), None)
+    eq_(sorted(idx.get_urls('KEY1')),
+        ['dl+archive:AKEY1#path=d/f1&size=3', 'dl+archive:AKEY2#path=f1'])
+    eq_(idx.get_urls('KEY2'), ['dl+archive:AKEY1#path=d/f2'])
+
+    # pending changes in the journal are not known to the index
+    create_tree(str(repo.dot_git / 'annex'), {'journal': {
+        'aaa_bbb_KEY__4.log.web': '1507541170s 0 :dl+archive:AKEY1#path=f4\n',
+        'aaa_bbb_KEY1.log': '1507541170s 1 someuuid\n',
+    }})
+    eq_(idx.get_urls('KEY_4'), None)
+    ok_(idx.get_urls('KEY1'))
+    # and stay unknown once the journal was committed
+    rmtree(str(repo.dot_git / 'annex' / 'journal'))
+    eq_(idx.get_urls('KEY_4'), None)
+
+    # no branch -- empty index
+    idx = ArchiveURLIndex.from_repo(
+        repo, remote.URL_PREFIX, branch='nonexistent')
+    eq_(len(idx), 0)
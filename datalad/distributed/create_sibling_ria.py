@@ -442,10 +442,9 @@ def _create_sibling_ria(
     # we try to init a special remote.
     if ssh_host:
         from datalad import ssh_manager
-        ssh = ssh_manager.get_connection(
+        ssh = ssh_manager.get_shell(
             ssh_host,
             use_remote_annex_bundle=False)
-        ssh.open()
 
     if existing in ['skip', 'error']:
         config_path = repo_path / 'config'
@@ -12,6 +12,7 @@ from shlex import quote as sh_quote
 import subprocess
 import logging
 from functools import wraps
+from datalad.support.exceptions import CommandError
 from datalad.customremotes.ria_utils import (
     get_layout_locations,
     UnknownLayoutVersion,
@@ -237,10 +238,6 @@ class SSHRemoteIO(IOBase):
     It doesn't even think about a windows server.
     """
 
-    # output markers to detect possible command failure as well as end of output from a particular command:
-    REMOTE_CMD_FAIL = "ora-remote: end - fail"
-    REMOTE_CMD_OK = "ora-remote: end - ok"
-
     def __init__(self, host, buffer_size=DEFAULT_BUFFER_SIZE):
         """
         Parameters
@@ -260,39 +257,19 @@ class SSHRemoteIO(IOBase):
             use_remote_annex_bundle=False,
         )
         self.ssh.open()
-        # open a remote shell
-        cmd = ['ssh'] + self.ssh._ssh_args + [self.ssh.sshri.as_str()]
-        self.shell = subprocess.Popen(cmd, stderr=subprocess.DEVNULL, stdout=subprocess.PIPE, stdin=subprocess.PIPE)
-        # swallow login message(s):
-        self.shell.stdin.write(b"echo RIA-REMOTE-LOGIN-END\n")
-        self.shell.stdin.flush()
-        while True:
-            line = self.shell.stdout.readline()
-            if line == b"RIA-REMOTE-LOGIN-END\n":
-                break
-        # TODO: Same for stderr?
+        # a persistent remote shell for all commands
+        self.shell = self.sshmanager.get_shell(
+            host,
+            use_remote_annex_bundle=False,
+        )
 
         # make sure default is used when None was passed, too.
         self.buffer_size = buffer_size if buffer_size else DEFAULT_BUFFER_SIZE
 
     def close(self):
-        # try exiting shell clean first
-        self.shell.stdin.write(b"exit\n")
-        self.shell.stdin.flush()
-        exitcode = self.shell.wait(timeout=0.5)
-        # be more brutal if it doesn't work
-        if exitcode is None:  # timed out
-            # TODO: Theoretically terminate() can raise if not successful. How to deal with that?
-            self.shell.terminate()
+        # terminates the remote shell, too
         self.sshmanager.close()
 
-    def _append_end_markers(self, cmd):
-        """Append end markers to remote command"""
-
-        return cmd + " && printf '%s\\n' {} || printf '%s\\n' {}\n".format(
-            sh_quote(self.REMOTE_CMD_OK),
-            sh_quote(self.REMOTE_CMD_FAIL))
-
     def _get_download_size_from_key(self, key):
         """Get the size of an annex object file from it's key
 
@@ -343,33 +320,17 @@ class SSHRemoteIO(IOBase):
             raise RIARemoteError("invalid key: {}".format(key))
 
     def _run(self, cmd, no_output=True, check=False):
-
-        # TODO: we might want to redirect stderr to stdout here (or have additional end marker in stderr)
-        #       otherwise we can't empty stderr to be ready for next command. We also can't read stderr for better error
-        #       messages (RemoteError) without making sure there's something to read in any case (it's blocking!)
-        #       However, if we are sure stderr can only ever happen if we would raise RemoteError anyway, it might be
-        #       okay
-        call = self._append_end_markers(cmd)
-        self.shell.stdin.write(call.encode())
-        self.shell.stdin.flush()
-
-        lines = []
-        while True:
-            line = self.shell.stdout.readline().decode()
-            lines.append(line)
-            if line == self.REMOTE_CMD_OK + '\n':
-                # end reading
-                break
-            elif line == self.REMOTE_CMD_FAIL + '\n':
-                if check:
-                    raise RemoteCommandFailedError("{cmd} failed: {msg}".format(cmd=cmd,
-                                                                                msg="".join(lines[:-1]))
-                                                   )
-                else:
-                    break
-        if no_output and len(lines) > 1:
-            raise RIARemoteError("{}: {}".format(call, "".join(lines)))
-        return "".join(lines[:-1])
+        try:
+            out, err = self.shell(cmd)
+        except CommandError as e:
+            if check:
+                raise RemoteCommandFailedError(
+                    "{cmd} failed: {msg}".format(
+                        cmd=cmd, msg=e.stdout + e.stderr))
+            out = e.stdout
+        if no_output and out:
+            raise RIARemoteError("{}: {}".format(cmd, out))
+        return out
 
     def mkdir(self, path):
         self._run('mkdir -p {}'.format(sh_quote(str(path))))
@@ -387,16 +348,6 @@ class SSHRemoteIO(IOBase):
 
         # TODO: see get_from_archive()
 
-        # TODO: Currently we will hang forever if the file isn't readable and it's supposed size is bigger than whatever
-        #       cat spits out on stdout. This is because we don't notice that cat has exited non-zero.
-        #       We could have end marker on stderr instead, but then we need to empty stderr beforehand to not act upon
-        #       output from earlier calls. This is a problem with blocking reading, since we need to make sure there's
-        #       actually something to read in any case.
-        cmd = 'cat {}'.format(sh_quote(str(src)))
-        self.shell.stdin.write(cmd.encode())
-        self.shell.stdin.write(b"\n")
-        self.shell.stdin.flush()
-
         from os.path import basename
         key = basename(str(src))
         try:
@@ -409,16 +360,14 @@ class SSHRemoteIO(IOBase):
             self.ssh.get(str(src), str(dst))
             return
 
+        # TODO: Currently we will hang forever if the file isn't readable and it's supposed size is bigger than whatever
+        #       cat spits out on stdout. This is because we don't notice that cat has exited non-zero before `size`
+        #       bytes were read.
+        cmd = 'cat {}'.format(sh_quote(str(src)))
         with open(dst, 'wb') as target_file:
-            bytes_received = 0
-            while bytes_received < size:  # TODO: some additional abortion criteria? check stderr in addition?
-                c = self.shell.stdout.read1(self.buffer_size)
-                # no idea yet, whether or not there's sth to gain by a sophisticated determination of how many bytes to
-                # read at once (like size - bytes_received)
-                if c:
-                    bytes_received += len(c)
-                    target_file.write(c)
-                    progress_cb(bytes_received)
+            self.shell.copy_output(
+                cmd, target_file, size, progress_cb,
+                buffer_size=self.buffer_size)
 
     def rename(self, src, dst):
         self._run('mv {} {}'.format(sh_quote(str(src)), sh_quote(str(dst))))
@@ -465,28 +414,20 @@ class SSHRemoteIO(IOBase):
         # TODO: We probably need to check exitcode on stderr (via marker). If archive or content is missing we will
         #       otherwise hang forever waiting for stdout to fill `size`
 
-        cmd = '7z x -so {} {}\n'.format(
+        cmd = '7z x -so {} {}'.format(
             sh_quote(str(archive)),
             sh_quote(str(src)))
-        self.shell.stdin.write(cmd.encode())
-        self.shell.stdin.flush()
 
         # TODO: - size needs double-check and some robustness
         #       - can we assume src to be a posixpath?
-        #       - RF: Apart from the executed command this should be pretty much identical to self.get(), so move that
-        #         code into a common function
 
         from os.path import basename
         size = self._get_download_size_from_key(basename(str(src)))
 
         with open(dst, 'wb') as target_file:
-            bytes_received = 0
-            while bytes_received < size:
-                c = self.shell.stdout.read1(self.buffer_size)
-                if c:
-                    bytes_received += len(c)
-                    target_file.write(c)
-                    progress_cb(bytes_received)
+            self.shell.copy_output(
+                cmd, target_file, size, progress_cb,
+                buffer_size=self.buffer_size)
 
     def read_file(self, file_path):
 
@@ -15,6 +15,7 @@ from distutils.version import LooseVersion
 from glob import glob
 import logging
 import os
+from collections import OrderedDict
 from os.path import (
     curdir,
     dirname,
@@ -127,34 +128,22 @@ class _RunnerAdapter(Runner):
             copy_fn(source, destination)
 
 
-def _create_dataset_sibling(
-        name,
+def _get_remote_ds_urls(
         ds,
         hierarchy_basepath,
-        shell,
         replicate_local_structure,
         ri,
         target_dir,
         target_url,
-        target_pushurl,
-        existing,
-        shared,
-        group,
-        publish_depends,
-        publish_by_default,
-        install_postupdate_hook,
-        as_common_datasrc,
-        annex_wanted,
-        annex_group,
-        annex_groupwanted,
-        inherit
-):
-    """Everyone is very smart here and could figure out the combinatorial
-    affluence among provided tiny (just slightly over a dozen) number of options
-    and only a few pages of code
+        target_pushurl):
+    """Determine the remote path and access URLs of a dataset's sibling
+
+    Returns
+    -------
+    tuple
+      remote path, (pull) URL, push URL (or None, if not needed)
     """
-    localds_path = ds.path
-    ds_name = relpath(localds_path, start=hierarchy_basepath)
+    ds_name = relpath(ds.path, start=hierarchy_basepath)
     if not replicate_local_structure:
         ds_name = '' if ds_name == curdir \
             else '-{}'.format(ds_name.replace("/", "-"))
@@ -169,7 +158,6 @@ def _create_dataset_sibling(
         # see gh-1188
         remoteds_path = normpath(opj(target_dir, ds_name))
 
-    ds_repo = ds.repo
     # construct a would-be ssh url based on the current dataset's path
     ri.path = remoteds_path
     ds_url = ri.as_str()
@@ -182,6 +170,40 @@ def _create_dataset_sibling(
         # not guaranteed that we can push via the primary URL
         ds_target_pushurl = target_pushurl.replace('%RELNAME', ds_name) \
             if target_pushurl else ds_url
+    return remoteds_path, ds_target_url, ds_target_pushurl
+
+
+def _create_dataset_sibling(
+        name,
+        ds,
+        hierarchy_basepath,
+        shell,
+        replicate_local_structure,
+        ri,
+        target_dir,
+        target_url,
+        target_pushurl,
+        existing,
+        shared,
+        group,
+        publish_depends,
+        publish_by_default,
+        install_postupdate_hook,
+        as_common_datasrc,
+        annex_wanted,
+        annex_group,
+        annex_groupwanted,
+        inherit
+):
+    """Everyone is very smart here and could figure out the combinatorial
+    affluence among provided tiny (just slightly over a dozen) number of options
+    and only a few pages of code
+    """
+    localds_path = ds.path
+    remoteds_path, ds_target_url, ds_target_pushurl = _get_remote_ds_urls(
+        ds, hierarchy_basepath, replicate_local_structure, ri, target_dir,
+        target_url, target_pushurl)
+    ds_repo = ds.repo
 
     lgr.info("Considering to create a target dataset {0} at {1} of {2}".format(
         localds_path, remoteds_path,
@@ -406,6 +428,202 @@ def _ls_remote_path(ssh, path):
     return [l for l in out.split(os.linesep) if l]
 
 
+# prefix of the lines that delimit the output of individual command blocks
+# in a remote script
+_SCRIPT_MARKER = '@@datalad-create-sibling@@'
+
+
+def _run_remote_script(shell, blocks):
+    """Run blocks of commands in a single remote shell session
+
+    The script is fed to the remote shell via stdin, hence its size is not
+    limited by the maximum length of a command line.
+
+    Parameters
+    ----------
+    shell : SSHRemoteShell or _RunnerAdapter
+    blocks : list of list of str
+      Each block is executed in its own subshell, which stops at the first
+      failing command.
+
+    Returns
+    -------
+    list of tuple
+      Exit code (None, if the block was not run to completion) and combined
+      stdout/stderr of each block, in the order of `blocks`.
+
+    Raises
+    ------
+    CommandError
+      If the remote shell itself fails.
+    """
+    script = []
+    for i, cmds in enumerate(blocks):
+        script.append("echo '{} {}'".format(_SCRIPT_MARKER, i))
+        script.append('( set -e')
+        script.extend(cmds)
+        script.append(') 2>&1')
+        script.append('echo "{} {} $?"'.format(_SCRIPT_MARKER, i))
+    with make_tempfile(content='\n'.join(script) + '\n') as tempf, \
+            open(tempf) as stdin:
+        out, err = shell('sh -s', stdin=stdin)
+    if err:
+        lgr.warning("Got stderr while running remote script: %s", err)
+
+    results = [(None, []) for b in blocks]
+    current = None
+    for line in out.splitlines():
+        if line.startswith(_SCRIPT_MARKER):
+            marker = line.split()
+            current = int(marker[1])
+            if len(marker) > 2:
+                # end of a block
+                results[current] = (int(marker[2]), results[current][1])
+                current = None
+        elif current is not None:
+            results[current][1].append(line)
+    return [(code, '\n'.join(output)) for code, output in results]
+
+
+def _get_absent_targets(shell, paths):
+    """Determine which remote paths are absent or an empty directory
+
+    Returns
+    -------
+    set
+    """
+    res = _run_remote_script(
+        shell,
+        [['ls -A1 {}'.format(sh_quote(p))] for p in paths])
+    return set(
+        p for p, (code, out) in zip(paths, res)
+        # an empty directory
+        if (code == 0 and not out.strip()) or
+        # nothing at all
+        (code and "No such file or directory" in out and p in out))
+
+
+def _create_dataset_siblings_batched(
+        name,
+        datasets,
+        hierarchy_basepath,
+        shell,
+        replicate_local_structure,
+        ri,
+        target_dir,
+        target_url,
+        target_pushurl,
+        shared,
+        group,
+        publish_depends,
+        publish_by_default,
+        install_postupdate_hook,
+        as_common_datasrc,
+        annex_wanted,
+        annex_group,
+        annex_groupwanted):
+    """Create not yet existing siblings for a number of datasets at once
+
+    As opposed to `_create_dataset_sibling()`, all remote operations for all
+    datasets are composed into a single script that is executed in one
+    remote shell session.
+
+    Returns
+    -------
+    list of tuple, list of tuple
+      Dataset and remote path of each created sibling, and dataset, remote
+      path, and output of the failed remote commands for each sibling whose
+      creation failed, both in the order of `datasets`.
+    """
+    git_version = shell.get_git_version()
+    if not (git_version and git_version >= LooseVersion("2.4")):
+        lgr.error("Git version >= 2.4 needed to configure remote."
+                  " Version detected on server: %s\nSkipping configuration"
+                  " of receive.denyCurrentBranch - you will not be able to"
+                  " publish updates to this repository. Upgrade your git"
+                  " and run with --existing=reconfigure",
+                  git_version)
+    hook_content = CreateSibling._get_postupdate_hook_content()
+
+    targets = []
+    blocks = []
+    for ds in datasets:
+        remoteds_path, ds_target_url, ds_target_pushurl = _get_remote_ds_urls(
+            ds, hierarchy_basepath, replicate_local_structure, ri, target_dir,
+            target_url, target_pushurl)
+        targets.append((ds, remoteds_path, ds_target_url, ds_target_pushurl))
+        qpath = sh_quote(remoteds_path)
+        cmds = []
+        if remoteds_path != '.':
+            cmds.append("mkdir -p {}".format(qpath))
+        if group:
+            cmds.append("chgrp -R {} {}".format(sh_quote(str(group)), qpath))
+        cmds.extend(CreateSibling._get_init_remote_repo_cmds(
+            remoteds_path, shared, ds, description=target_url))
+        if target_url and not is_ssh(target_url):
+            # we are not coming in via SSH, hence cannot assume proper
+            # setup for webserver access -> fix
+            cmds.append('git -C {} update-server-info'.format(qpath))
+        if git_version and git_version >= LooseVersion("2.4"):
+            # allow for pushing to checked out branch
+            cmds.append(
+                "git -C {} config receive.denyCurrentBranch updateInstead "
+                "|| echo 'W: failed to configure receive.denyCurrentBranch'"
+                .format(qpath))
+        branch = ds.repo.get_active_branch()
+        if branch is not None:
+            branch = ds.repo.get_corresponding_branch(branch) or branch
+            # see _create_dataset_sibling() on why this is done
+            cmds.append("git -C {} symbolic-ref HEAD refs/heads/{}"
+                        .format(qpath, branch))
+        if install_postupdate_hook:
+            hooks_remote_dir = opj(remoteds_path, '.git', 'hooks')
+            hook_remote_target = sh_quote(opj(hooks_remote_dir, 'post-update'))
+            cmds.append(
+                "{{ mkdir -p {} && printf '%s' {} > {} && chmod +x {}; }} "
+                "|| echo 'W: failed to install post-update hook'".format(
+                    sh_quote(hooks_remote_dir),
+                    sh_quote(hook_content),
+                    hook_remote_target,
+                    hook_remote_target))
+        blocks.append(cmds)
+
+    lgr.info("Creating %i target datasets in a single remote session",
+             len(blocks))
+    created = []
+    failed = []
+    for (ds, remoteds_path, ds_target_url, ds_target_pushurl), (code, out) \
+            in zip(targets, _run_remote_script(shell, blocks)):
+        if code != 0:
+            failed.append((ds, remoteds_path, out.strip()))
+            continue
+        for line in out.splitlines():
+            if line.startswith('W: '):
+                lgr.error("At remote location %s: %s",
+                          remoteds_path, line[3:])
+        # at this point we have a remote sibling -> add as remote
+        lgr.debug("Adding the sibling for %s", ds)
+        Siblings.__call__(
+            'configure',
+            dataset=ds,
+            name=name,
+            url=ds_target_url,
+            pushurl=ds_target_pushurl,
+            recursive=False,
+            fetch=True,
+            as_common_datasrc=as_common_datasrc,
+            publish_by_default=publish_by_default,
+            publish_depends=publish_depends,
+            annex_wanted=annex_wanted,
+            annex_group=annex_group,
+            annex_groupwanted=annex_groupwanted,
+            inherit=False,
+            result_renderer=None,
+        )
+        created.append((ds, remoteds_path))
+    return created, failed
+
+
 @build_doc
 class CreateSibling(Interface):
     """Create a dataset sibling on a UNIX-like Shell (local or SSH)-accessible machine
@@ -426,7 +644,8 @@ class CreateSibling(Interface):
     siblings are created in hierarchical structure that reflects the
     organization on the local file system. However, a simple templating
     mechanism is provided to produce a flat list of datasets (see
-    --target-dir).
+    --target-dir). Siblings whose target directory does not exist yet are
+    created together in a single remote shell session.
     """
     # XXX prevent common args from being added to the docstring
     _no_eval_results = True
@@ -702,7 +921,9 @@ class CreateSibling(Interface):
         if ssh_sibling:
             # request ssh connection:
             lgr.info("Connecting ...")
-            shell = ssh_manager.get_connection(sshurl)
+            # a persistent remote shell saves starting an ssh process for
+            # each of the many remote commands
+            shell = ssh_manager.get_shell(sshurl)
         else:
             shell = _RunnerAdapter()
             sibling_ri.path = str(resolve_path(sibling_ri.path, dataset))
@@ -732,13 +953,30 @@ class CreateSibling(Interface):
         # below valid (existing directories would cause the machinery to halt)
         # But we need to run post-update hook in depth-first fashion, so
         # would only collect first and then run (see gh #790)
-        yielded = set()
-        remote_repos_to_run_hook_for = []
-        for currentds_ap in \
-                sorted(to_process, key=lambda x: x['path'].count('/')):
+        to_process = sorted(to_process, key=lambda x: x['path'].count('/'))
+        if inherit:
+            # settings are inherited from the sibling of the respective
+            # superdataset, hence they must be processed one by one
+            batched = set()
+        else:
+            # any target that does not exist yet (or is an empty directory)
+            # can be created together with all others in a single remote
+            # session, whereas existing ones need individual inspection
+            # according to `existing`
+            remote_paths = OrderedDict(
+                (ap['path'], _get_remote_ds_urls(
+                    Dataset(ap['path']), refds_path, replicate_local_structure,
+                    sibling_ri, target_dir, target_url, target_pushurl)[0])
+                for ap in to_process)
+            absent = _get_absent_targets(shell, list(remote_paths.values()))
+            batched = set(
+                p for p, rp in remote_paths.items() if rp in absent)
+        created = []
+        for currentds_ap in to_process:
+            if currentds_ap['path'] in batched:
+                continue
             current_ds = Dataset(currentds_ap['path'])
-
-            path = _create_dataset_sibling(
+            created.append((current_ds, _create_dataset_sibling(
                 name,
                 current_ds,
                 refds_path,
@@ -759,7 +997,45 @@ class CreateSibling(Interface):
                 annex_group,
                 annex_groupwanted,
                 inherit
+            )))
+        failed = []
+        if batched:
+            batch_created, failed = _create_dataset_siblings_batched(
+                name,
+                [Dataset(ap['path']) for ap in to_process
+                 if ap['path'] in batched],
+                refds_path,
+                shell,
+                replicate_local_structure,
+                sibling_ri,
+                target_dir,
+                target_url,
+                target_pushurl,
+                shared,
+                group,
+                publish_depends,
+                publish_by_default,
+                ui,
+                as_common_datasrc,
+                annex_wanted,
+                annex_group,
+                annex_groupwanted,
             )
+            created.extend(batch_created)
+        ap_by_path = {ap['path']: ap for ap in to_process}
+
+        yielded = set()
+        for current_ds, path, out in failed:
+            currentds_ap = ap_by_path[current_ds.path]
+            currentds_ap['status'] = 'error'
+            currentds_ap['message'] = (
+                "failed to create the remote dataset under %s (%s)",
+                path, out)
+            yield currentds_ap
+            yielded.add(currentds_ap['path'])
+        remote_repos_to_run_hook_for = []
+        for current_ds, path in created:
+            currentds_ap = ap_by_path[current_ds.path]
             if not path:
                 # nothing new was created
                 # TODO is 'notneeded' appropriate in this case?
@@ -785,20 +1061,26 @@ class CreateSibling(Interface):
                     continue
 
         # in reverse order would be depth first
+        remote_repos_to_run_hook_for = sorted(
+            remote_repos_to_run_hook_for,
+            key=lambda x: x[1]['path'].count('/'),
+            reverse=True)
         lgr.info("Running post-update hooks in all created siblings")
-        # TODO: add progressbar
-        for path, currentds_ap in remote_repos_to_run_hook_for[::-1]:
-            # Trigger the hook
-            lgr.debug("Running hook for %s (if exists and executable)", path)
-            try:
-                shell("cd {} "
-                      "&& ( [ -x hooks/post-update ] && hooks/post-update || : )"
-                      "".format(sh_quote(_path_(path, ".git"))))
-            except CommandError as e:
+        # all hooks are triggered in a single remote session
+        hook_results = _run_remote_script(
+            shell,
+            [["cd {} "
+              "&& ( [ -x hooks/post-update ] && hooks/post-update || : )"
+              "".format(sh_quote(_path_(path, ".git")))]
+             for path, currentds_ap in remote_repos_to_run_hook_for]) \
+            if remote_repos_to_run_hook_for else []
+        for (path, currentds_ap), (code, out) in zip(
+                remote_repos_to_run_hook_for, hook_results):
+            if code != 0:
                 currentds_ap['status'] = 'error'
                 currentds_ap['message'] = (
                     "failed to run post-update hook under remote path %s (%s)",
-                    path, exc_str(e))
+                    path, out)
                 yield currentds_ap
                 yielded.add(currentds_ap['path'])
                 continue
@@ -894,26 +1176,32 @@ class CreateSibling(Interface):
         return url
 
     @staticmethod
-    def init_remote_repo(path, ssh, shared, dataset, description=None):
-        cmd = "git -C {} init{}".format(
+    def _get_init_remote_repo_cmds(path, shared, dataset, description=None):
+        """Shell commands to initialize the repository of a remote sibling"""
+        cmds = ["git -C {} init{}".format(
             sh_quote(path),
-            " --shared='{}'".format(sh_quote(shared)) if shared else '')
+            " --shared='{}'".format(sh_quote(shared)) if shared else '')]
+        if isinstance(dataset.repo, AnnexRepo):
+            # init remote git annex repo (part fix of #463)
+            cmds.append("git -C {} annex init {}".format(
+                sh_quote(path),
+                sh_quote(description) if description else ''))
+        return cmds
+
+    @staticmethod
+    def init_remote_repo(path, ssh, shared, dataset, description=None):
+        cmds = CreateSibling._get_init_remote_repo_cmds(
+            path, shared, dataset, description=description)
         try:
-            ssh(cmd)
+            ssh(cmds[0])
         except CommandError as e:
             lgr.error("Initialization of remote git repository failed at %s."
                       "\nError: %s\nSkipping ..." % (path, exc_str(e)))
             return False
 
-        if isinstance(dataset.repo, AnnexRepo):
-            # init remote git annex repo (part fix of #463)
+        if len(cmds) > 1:
             try:
-                ssh(
-                    "git -C {} annex init {}".format(
-                        sh_quote(path),
-                        sh_quote(description)
-                        if description else '')
-                )
+                ssh(cmds[1])
             except CommandError as e:
                 lgr.error("Initialization of remote git annex repository failed at %s."
                           "\nError: %s\nSkipping ..." % (path, exc_str(e)))
@@ -927,7 +1215,17 @@ class CreateSibling(Interface):
         # make sure hooks directory exists (see #1251)
         ssh('mkdir -p {}'.format(sh_quote(hooks_remote_dir)))
         hook_remote_target = opj(hooks_remote_dir, 'post-update')
+        hook_content = CreateSibling._get_postupdate_hook_content()
+
+        with make_tempfile(content=hook_content) as tempf:
+            # create post_update hook script
+            # upload hook to dataset
+            ssh.put(tempf, hook_remote_target)
+        # and make it executable
+        ssh('chmod +x {}'.format(sh_quote(hook_remote_target)))
 
+    @staticmethod
+    def _get_postupdate_hook_content():
         # create json command for current dataset
         log_filename = 'datalad-publish-hook-$(date +%s).log' % TIMESTAMP_FMT
         hook_content = r'''#!/bin/bash
@@ -961,13 +1259,7 @@ done
   || echo "E: no datalad found - skipping generation of indexes for web frontend"; \
 ) &> "$logfile"
 '''.format(WEB_META_LOG=WEB_META_LOG, **locals())
-
-        with make_tempfile(content=hook_content) as tempf:
-            # create post_update hook script
-            # upload hook to dataset
-            ssh.put(tempf, hook_remote_target)
-        # and make it executable
-        ssh('chmod +x {}'.format(sh_quote(hook_remote_target)))
+        return hook_content
 
     @staticmethod
     def upload_web_interface(path, ssh, shared, ui):
@@ -57,8 +57,64 @@ lgr = logging.getLogger('datalad.dataset')
 lgr.log(5, "Importing dataset")
 
 
+# maps API names to the specifications of all interfaces that provide them,
+# determined once per process
+_dataset_method_specs = None
+
+
+def _get_dataset_method_specs():
+    global _dataset_method_specs
+    if _dataset_method_specs is None:
+        from datalad.interface.base import (
+            get_extension_interface_groups,
+            get_interface_groups,
+            get_api_name,
+        )
+        specs = {}
+        groups = get_interface_groups(True) + get_extension_interface_groups()
+        for group, _, interfaces in groups:
+            for intfspec in interfaces:
+                specs.setdefault(get_api_name(intfspec), []).append(intfspec)
+        _dataset_method_specs = specs
+    return _dataset_method_specs
+
+
+def _load_dataset_method(attr):
+    """Load the interface that possibly binds `attr` as a Dataset method
+
+    The gotcha could be the mismatch between explicit name
+    provided to @datasetmethod and what is defined in interfaces
+    """
+    if attr.startswith('_'):  # do not even consider those
+        return
+    from datalad.interface.base import load_interface
+    meth = None
+    for intfspec in _get_dataset_method_specs().get(attr, []):
+        meth_ = load_interface(intfspec)
+        if meth_:
+            lgr.debug("Found matching interface %s for %s",
+                      intfspec, attr)
+            if meth:
+                lgr.debug(
+                    "New match %s possibly overloaded previous one %s",
+                    meth_, meth
+                )
+            meth = meth_
+    if not meth:
+        lgr.debug("Found no match among known interfaces for %r", attr)
+
+
+class _DatasetMeta(PathBasedFlyweight):
+    """Metaclass of Dataset that binds Dataset methods on first access"""
+
+    def __getattr__(cls, attr):
+        # the class-level counterpart of Dataset.__getattr__
+        _load_dataset_method(attr)
+        return type.__getattribute__(cls, attr)
+
+
 @path_based_str_repr
-class Dataset(object, metaclass=PathBasedFlyweight):
+class Dataset(object, metaclass=_DatasetMeta):
     """Representation of a DataLad dataset/repository
 
     This is the core data type of DataLad: a representation of a dataset.
@@ -181,31 +237,7 @@ class Dataset(object, metaclass=PathBasedFlyweight):
     def __getattr__(self, attr):
         # Assure that we are not just missing some late binding
         # @datasetmethod . We will use interface definitions.
-        # The gotcha could be the mismatch between explicit name
-        # provided to @datasetmethod and what is defined in interfaces
-        meth = None
-        if not attr.startswith('_'):  # do not even consider those
-            from datalad.interface.base import (
-                get_interface_groups, get_api_name, load_interface
-            )
-            groups = get_interface_groups(True)
-            for group, _, interfaces in groups:
-                for intfspec in interfaces:
-                    # lgr.log(5, "Considering interface %s", intfspec)
-                    name = get_api_name(intfspec)
-                    if attr == name:
-                        meth_ = load_interface(intfspec)
-                        if meth_:
-                            lgr.debug("Found matching interface %s for %s",
-                                      intfspec, name)
-                            if meth:
-                                lgr.debug(
-                                    "New match %s possibly overloaded previous one %s",
-                                    meth_, meth
-                                )
-                            meth = meth_
-            if not meth:
-                lgr.debug("Found no match among known interfaces for %r", attr)
+        _load_dataset_method(attr)
         return super(Dataset, self).__getattribute__(attr)
 
     def close(self):
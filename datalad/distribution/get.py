@@ -12,6 +12,9 @@
 
 import logging
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import os.path as op
 
@@ -30,7 +33,6 @@ from datalad.interface.results import (
 from datalad.interface.common_opts import (
     recursion_flag,
     location_description,
-    jobs_opt,
     reckless_opt,
 )
 from datalad.interface.results import is_ok_dataset
@@ -41,6 +43,7 @@ from datalad.support.constraints import (
     EnsureNone,
 )
 from datalad.support.param import Parameter
+from datalad.support.parallel import get_n_jobs
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.gitrepo import (
     GitRepo,
@@ -61,6 +64,7 @@ from datalad.utils import (
     unique,
     Path,
     get_dataset_root,
+    nothing_cm,
 )
 
 from datalad.local.subdatasets import Subdatasets
@@ -262,7 +266,7 @@ def _get_flexible_source_candidates_for_submodule(ds, sm):
     return clone_urls
 
 
-def _install_subds_from_flexible_source(ds, sm, **kwargs):
+def _install_subds_from_flexible_source(ds, sm, parent_lock=None, **kwargs):
     """Tries to obtain a given subdataset from several meaningful locations
 
     Parameters
@@ -271,6 +275,12 @@ def _install_subds_from_flexible_source(ds, sm, **kwargs):
       Parent dataset of to-be-installed subdataset.
     sm : dict
       Submodule record as produced by `subdatasets()`.
+    parent_lock : threading.Lock, optional
+      Held while the new clone is registered in the parent dataset, in
+      order to serialize concurrent modifications of the parent's
+      configuration. Must be given whenever subdatasets of the same parent
+      are installed concurrently. Without it (sequential installation), no
+      locking takes place.
     **kwargs
       Passed onto clone()
     """
@@ -307,11 +317,13 @@ def _install_subds_from_flexible_source(ds, sm, **kwargs):
                 res.get('status', None) == 'ok' and \
                 res.get('type', None) == 'dataset' and \
                 res.get('path', None) == dest_path:
-            _fixup_submodule_dotgit_setup(ds, sm_path)
+            with parent_lock or nothing_cm():
+                _fixup_submodule_dotgit_setup(ds, sm_path)
 
-            # do fancy update
-            lgr.debug("Update cloned subdataset {0} in parent".format(dest_path))
-            ds.repo.update_submodule(sm_path, init=True)
+                # do fancy update
+                lgr.debug(
+                    "Update cloned subdataset {0} in parent".format(dest_path))
+                ds.repo.update_submodule(sm_path, init=True)
         yield res
 
     subds = Dataset(dest_path)
@@ -410,40 +422,61 @@ def _install_necessary_subdatasets(
         cur_subds = subds_trail[-1]
 
 
-def _recursive_install_subds_underneath(ds, recursion_limit, reckless, start=None,
-                                        refds_path=None, description=None):
-    if isinstance(recursion_limit, int) and recursion_limit <= 0:
-        return
-    # install using helper that give some flexibility regarding where to
-    # get the module from
+def _install_subds(ds, sub, reckless, refds_path=None, description=None,
+                   parent_lock=None):
+    """Install a single subdataset `sub` of `ds`, unless it exists already"""
+    if sub.get('state', None) != 'absent':
+        # dataset was already found to exist
+        yield get_status_dict(
+            'install', ds=Dataset(sub['path']), status='notneeded',
+            logger=lgr, refds=refds_path)
+        # do not stop, even if an intermediate dataset exists it
+        # does not imply that everything below it does too
+    else:
+        # try to get this dataset
+        for res in _install_subds_from_flexible_source(
+                ds,
+                sub,
+                parent_lock=parent_lock,
+                reckless=reckless,
+                description=description):
+            # yield everything to let the caller decide how to deal with
+            # errors
+            yield res
 
+
+def _get_subds_to_install(ds, start=None):
     for sub in ds.subdatasets(
             path=start,
             return_type='generator',
             result_renderer='disabled'):
-        subds = Dataset(sub['path'])
         if sub.get('gitmodule_datalad-recursiveinstall', '') == 'skip':
             lgr.debug(
                 "subdataset %s is configured to be skipped on recursive installation",
                 sub['path'])
             continue
-        if sub.get('state', None) != 'absent':
-            # dataset was already found to exist
-            yield get_status_dict(
-                'install', ds=subds, status='notneeded', logger=lgr,
-                refds=refds_path)
-            # do not continue, even if an intermediate dataset exists it
-            # does not imply that everything below it does too
-        else:
-            # try to get this dataset
-            for res in _install_subds_from_flexible_source(
-                    ds,
-                    sub,
-                    reckless=reckless,
-                    description=description):
-                # yield everything to let the caller decide how to deal with
-                # errors
-                yield res
+        yield sub
+
+
+def _recursive_install_subds_underneath(ds, recursion_limit, reckless, start=None,
+                                        refds_path=None, description=None,
+                                        jobs=None):
+    if isinstance(recursion_limit, int) and recursion_limit <= 0:
+        return
+    if get_n_jobs(jobs) > 1:
+        yield from _concurrent_install_subds_underneath(
+            ds, recursion_limit, reckless, start=start,
+            refds_path=refds_path, description=description, jobs=jobs)
+        return
+    # install using helper that give some flexibility regarding where to
+    # get the module from
+
+    for sub in _get_subds_to_install(ds, start=start):
+        subds = Dataset(sub['path'])
+        for res in _install_subds(
+                ds, sub, reckless,
+                refds_path=refds_path, description=description):
+            yield res
         if not subds.is_installed():
             # an error result was emitted, and the external consumer can decide
             # what to do with it, but there is no point in recursing into
@@ -460,6 +493,54 @@ def _recursive_install_subds_underneath(ds, recursion_limit, reckless, start=Non
             yield res
 
 
+def _concurrent_install_subds_underneath(ds, recursion_limit, reckless,
+                                         start=None, refds_path=None,
+                                         description=None, jobs=None):
+    """Like _recursive_install_subds_underneath(), but with up to `jobs`
+    subdatasets being installed at the same time
+
+    Each installation is a task that, once complete, schedules the
+    installation of the subdatasets of the new clone. Results are
+    yielded in the same order as for a sequential installation.
+    """
+    # only the registration of a clone in its parent dataset has to be
+    # serialized
+    parent_locks = defaultdict(threading.Lock)
+
+    with ThreadPoolExecutor(max_workers=get_n_jobs(jobs)) as executor:
+
+        def _schedule(ds, recursion_limit, start=None):
+            if isinstance(recursion_limit, int) and recursion_limit <= 0:
+                return []
+            return [
+                executor.submit(_install, ds, sub, recursion_limit)
+                for sub in _get_subds_to_install(ds, start=start)
+            ]
+
+        def _install(ds, sub, recursion_limit):
+            subds = Dataset(sub['path'])
+            results = list(_install_subds(
+                ds, sub, reckless,
+                refds_path=refds_path, description=description,
+                parent_lock=parent_locks[ds.path]))
+            if not subds.is_installed():
+                lgr.debug(
+                    'Subdataset %s could not be installed, skipped', subds)
+                return results, []
+            return results, _schedule(
+                subds,
+                recursion_limit - 1 if isinstance(recursion_limit, int)
+                else recursion_limit)
+
+        def _collect(futures):
+            for f in futures:
+                results, subfutures = f.result()
+                yield from results
+                yield from _collect(subfutures)
+
+        yield from _collect(_schedule(ds, recursion_limit, start=start))
+
+
 def _install_targetpath(
         ds,
         target_path,
@@ -467,7 +548,8 @@ def _install_targetpath(
         recursion_limit,
         reckless,
         refds_path,
-        description):
+        description,
+        jobs=None):
     """Helper to install as many subdatasets as needed to verify existence
     of a target path
 
@@ -476,6 +558,9 @@ def _install_targetpath(
     ds : Dataset
       Locally available dataset that contains the target path
     target_path : Path
+    jobs : int or 'auto' or None, optional
+      Number of subdatasets to install concurrently on recursive
+      installation.
     """
     # if it is an empty dir, it could still be a subdataset that is missing
     if (target_path.is_dir() and any(target_path.iterdir())) or \
@@ -552,7 +637,8 @@ def _install_targetpath(
             # TODO keep Path when RF is done
             start=str(target_path),
             refds_path=refds_path,
-            description=description):
+            description=description,
+            jobs=jobs):
         # yield immediately so errors could be acted upon
         # outside, before we continue
         res.update(
@@ -624,6 +710,10 @@ class Get(Interface):
     enabled, relevant subdatasets are detected and installed in order to
     fulfill a request.
 
+    When more than one job is requested, subdatasets are installed
+    concurrently, while results are still reported in the order of a
+    sequential installation.
+
     Known data locations for each requested file are evaluated and data are
     obtained from some available location (according to git-annex configuration
     and possibly assigned remote priorities), unless a specific source is
@@ -690,7 +780,19 @@ class Get(Interface):
             for file handles from being obtained CMD]"""),
         description=location_description,
         reckless=reckless_opt,
-        jobs=jobs_opt)
+        jobs=Parameter(
+            args=("-J", "--jobs"),
+            metavar="NJOBS",
+            constraints=EnsureInt() | EnsureNone() | EnsureChoice('auto'),
+            doc="""how many parallel jobs (where possible) to use. On
+            recursive installation, this many subdatasets are installed
+            concurrently. Afterwards, file content is obtained one dataset at
+            a time, with this many parallel jobs of git-annex each, hence the
+            two do not multiply. "auto" corresponds to the number defined by
+            the 'datalad.runtime.max-jobs' configuration item for the
+            installation, and by 'datalad.runtime.max-annex-jobs' for
+            obtaining file content."""),
+    )
 
     @staticmethod
     @datasetmethod(name='get')
@@ -762,7 +864,8 @@ class Get(Interface):
                             recursion_limit,
                             reckless,
                             refds_path,
-                            description):
+                            description,
+                            jobs=jobs):
                         # fish out the datasets that 'contains' a targetpath
                         # and store them for later
                         if res.get('status', None) in ('ok', 'notneeded') and \
@@ -798,7 +901,8 @@ class Get(Interface):
                         recursion_limit,
                         reckless,
                         refds_path,
-                        description):
+                        description,
+                        jobs=jobs):
                     known_ds = res['path'] in content_by_ds
                     if res.get('status', None) in ('ok', 'notneeded') and \
                             'contains' in res:
@@ -70,6 +70,7 @@ from datalad.utils import (
 )
 
 import logging
+from unittest.mock import patch
 lgr = logging.getLogger('datalad.tests')
 
 
@@ -835,3 +836,51 @@ def test_non_master_branch(src_path, target_path):
         "other-sub")
     eq_(get_branch(Dataset(target_path / "b" / "sub-b").repo),
         DEFAULT_BRANCH)
+
+
+@skip_if_on_windows
+@with_tempfile(mkdir=True)
+def test_remote_script(path):
+    from datalad.distribution.create_sibling import (
+        _RunnerAdapter,
+        _get_absent_targets,
+        _run_remote_script,
+    )
+    shell = _RunnerAdapter()
+    # each block stops at its first failure, but not the entire script
+    eq_(_run_remote_script(
+        shell,
+        [['echo a', 'false', 'echo never'],
+         ['echo b', 'echo c >&2'],
+         ["echo 'spa ce'"]]),
+        [(1, 'a'), (0, 'b\nc'), (0, 'spa ce')])
+
+    path = Path(path)
+    create_tree(str(path), {'empty': {}, 'full': {'some': 'thing'}})
+    targets = [str(path / p) for p in ('empty', 'full', 'none', "we'ird")]
+    eq_(_get_absent_targets(shell, targets),
+        {targets[0], targets[2], targets[3]})
+
+
+@skip_if_on_windows
+@with_tempfile(mkdir=True)
+@with_tempfile
+def test_create_sibling_batched_failure(path, target):
+    from datalad.distribution import create_sibling as cs
+    ds = Dataset(path).create(annex=False)
+    ds.create('sub', annex=False)
+    run_remote_script = cs._run_remote_script
+
+    def _fail_creation(shell, blocks):
+        res = run_remote_script(shell, blocks)
+        return [(1, 'mkdir: Permission denied')
+                if any(c.startswith('mkdir -p') for c in block) else r
+                for block, r in zip(blocks, res)]
+
+    with patch.object(cs, '_run_remote_script', _fail_creation):
+        res = ds.create_sibling(
+            name='target', sshurl=target, recursive=True,
+            on_failure='ignore')
+    assert_result_count(res, 2)
+    assert_status('error', res)
+    assert_in('Permission denied', res[0]['message'][2])
@@ -150,6 +150,15 @@ def test_dataset_constructor(path):
         eq_(dsrel.repo, None)
 
 
+def test_dataset_str_repr():
+    ds = Dataset('/some/where')
+    eq_(str(ds), 'Dataset(/some/where)')
+    eq_(repr(ds), "Dataset('/some/where')")
+    ds = Dataset('/some/where else')
+    eq_(str(ds), "Dataset('/some/where else')")
+    eq_(repr(ds), "Dataset('/some/where else')")
+
+
 @with_tempfile(mkdir=True)
 def test_repo_cache(path):
     ds = Dataset(path)
@@ -52,6 +52,7 @@ from datalad.utils import (
     with_pathsep,
     chpwd,
     rmtree,
+    Path,
 )
 from ..dataset import Dataset
 
@@ -634,3 +635,34 @@ def test_gh3356(src, path):
     assert_result_count(
         clone.status(recursive=True, annex='all', report_filetype='eval'), 2,
         action='status', has_content=True)
+
+
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+def test_get_recursive_concurrent(src, path, path_seq):
+    origin = Dataset(src).create()
+    for i in range(3):
+        sub = origin.create('sub{}'.format(i))
+        for j in range(2):
+            sub.create('subsub{}'.format(j))
+    origin.save(recursive=True)
+
+    seq = install(path_seq, source=src, result_xfm='datasets',
+                  return_type='item-or-list')
+    res_seq = seq.get(recursive=True, get_data=False, jobs=None)
+    clone = install(path, source=src, result_xfm='datasets',
+                    return_type='item-or-list')
+    res = clone.get(recursive=True, get_data=False, jobs=3)
+    assert_result_count(res, 9, action='install', type='dataset',
+                        status='ok')
+    eq_(len(clone.subdatasets(recursive=True, fulfilled=True)), 9)
+    # same results in the same order as a sequential installation
+    eq_([(Path(r['path']).relative_to(clone.pathobj), r['status'])
+         for r in res],
+        [(Path(r['path']).relative_to(seq.pathobj), r['status'])
+         for r in res_seq])
+    assert_repo_status(clone.path)
+    # a second run has nothing to do
+    assert_status('notneeded',
+                  clone.get(recursive=True, get_data=False, jobs=3))
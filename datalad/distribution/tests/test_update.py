@@ -10,6 +10,8 @@
 """
 
 import os
+import time
+from unittest.mock import patch
 import os.path as op
 from os.path import (
     join as opj,
@@ -696,6 +698,65 @@ def test_merge_follow_parentds_subdataset_adjusted_warning(path):
     eq_(ds_clone.repo.get_hexsha(), ds_src.repo.get_hexsha())
 
 
+@with_tempfile(mkdir=True)
+def test_update_recursive_jobs(path):
+    path = Path(path)
+    ds_src = Dataset(path / "source").create(annex=False)
+    for i in range(3):
+        ds_src.create("s{}".format(i), annex=False).create(
+            "ss", annex=False)
+    ds_src.save(recursive=True)
+    ds_clone = install(source=ds_src.path, path=path / "clone",
+                       recursive=True, result_xfm="datasets")
+    # new states in all subdatasets of the source
+    for i in range(3):
+        (ds_src.pathobj / "s{}".format(i) / "ss" / "file").write_text(
+            "content")
+    ds_src.save(recursive=True)
+    assert_repo_status(ds_src.path)
+
+    res = ds_clone.update(merge=True, recursive=True, follow="parentds",
+                          jobs=3)
+    assert_result_count(res, 7, action="update", status="ok",
+                        type="dataset")
+    assert_repo_status(ds_clone.path)
+    eq_(ds_clone.repo.get_hexsha(), ds_src.repo.get_hexsha())
+    for i in range(3):
+        ok_file_has_content(
+            ds_clone.pathobj / "s{}".format(i) / "ss" / "file", "content")
+    # merges happen superdataset first, fetches can complete in any order
+    updated = [r["path"] for r in res if r["action"] == "update"]
+    eq_(updated[0], ds_clone.path)
+    for i in range(3):
+        sub = str(ds_clone.pathobj / "s{}".format(i))
+        ok_(updated.index(sub) < updated.index(str(Path(sub) / "ss")))
+
+
+@with_tempfile(mkdir=True)
+def test_update_recursive_jobs_stop_early(path):
+    path = Path(path)
+    ds_src = Dataset(path / "source").create(annex=False)
+    for i in range(6):
+        ds_src.create("s{}".format(i), annex=False)
+    ds_clone = install(source=ds_src.path, path=path / "clone",
+                       recursive=True, result_xfm="datasets")
+    fetched = []
+
+    def _slow_fetch(ds, repo, sibling):
+        time.sleep(0.5)
+        fetched.append(ds.path)
+
+    with patch("datalad.distribution.update._fetch", _slow_fetch):
+        res = ds_clone.update(recursive=True, jobs=2,
+                              return_type="generator",
+                              result_renderer="disabled")
+        next(res)
+        res.close()
+        # enough time for all fetches, had they not been cancelled
+        time.sleep(2)
+    ok_(len(fetched) < 7)
+
+
 @with_tempfile(mkdir=True)
 def check_merge_follow_parentds_subdataset_detached(on_adjusted, path):
     # Note: For the adjusted case, this is not much more than a smoke test that
@@ -16,6 +16,7 @@ __docformat__ = 'restructuredtext'
 import logging
 from os.path import lexists, join as opj
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 from datalad.dochelpers import exc_str
 from datalad.interface.base import Interface
@@ -28,12 +29,14 @@ from datalad.interface.results import (
 from datalad.support.constraints import (
     EnsureBool,
     EnsureChoice,
+    EnsureInt,
     EnsureStr,
     EnsureNone,
 )
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.exceptions import CommandError
 from datalad.support.param import Parameter
+from datalad.support.parallel import get_n_jobs
 from datalad.interface.common_opts import (
     recursion_flag,
     recursion_limit,
@@ -141,7 +144,16 @@ class Update(Interface):
             args=("--reobtain-data",),
             action="store_true",
             doc="""if enabled, file content that was present before an update
-            will be re-obtained in case a file was changed by the update."""), )
+            will be re-obtained in case a file was changed by the update."""),
+        jobs=Parameter(
+            args=("-J", "--jobs"),
+            metavar="NJOBS",
+            constraints=EnsureInt() | EnsureNone() | EnsureChoice('auto'),
+            doc="""how many datasets to fetch updates for in parallel.
+            "auto" corresponds to the number defined by the
+            'datalad.runtime.max-jobs' configuration item. Merges are always
+            performed one dataset at a time, superdatasets first."""),
+    )
 
     @staticmethod
     @datasetmethod(name='update')
@@ -155,7 +167,8 @@ class Update(Interface):
             recursive=False,
             recursion_limit=None,
             fetch_all=None,
-            reobtain_data=False):
+            reobtain_data=False,
+            jobs=None):
         if fetch_all is not None:
             lgr.warning('update(fetch_all=...) called. Option has no effect, and will be removed')
         if path and not recursive:
@@ -164,166 +177,226 @@ class Update(Interface):
 
         refds = require_dataset(dataset, check_installed=True, purpose='updating')
 
-        save_paths = []
-        merge_failures = set()
-        saw_subds = False
-        for ds, revision in itertools.chain([(refds, None)], refds.subdatasets(
-                path=path,
-                fulfilled=True,
-                recursive=recursive,
-                recursion_limit=recursion_limit,
-                return_type='generator',
-                result_renderer='disabled',
-                result_xfm=YieldDatasetAndRevision()) if recursive else []):
-            if ds != refds:
-                saw_subds = True
-            repo = ds.repo
-            is_annex = isinstance(repo, AnnexRepo)
-            # prepare return value
-            res = get_status_dict('update', ds=ds, logger=lgr, refds=refds.path)
-            # get all remotes which have references (would exclude
-            # special remotes)
-            remotes = repo.get_remotes(
-                **({'exclude_special_remotes': True} if is_annex else {}))
-            if not remotes and not sibling:
-                res['message'] = ("No siblings known to dataset at %s\nSkipping",
-                                  repo.path)
-                res['status'] = 'notneeded'
-                yield res
-                continue
-            curr_branch = repo.get_active_branch()
-            tracking_remote = None
-            if not sibling and len(remotes) == 1:
-                # there is only one remote, must be this one
-                sibling_ = remotes[0]
-            elif not sibling:
-                # nothing given, look for tracking branch
-                tracking_remote = repo.get_tracking_branch(
-                    branch=curr_branch, remote_only=True)[0]
-                sibling_ = tracking_remote
+        # with multiple jobs, the fetches for all datasets are started right
+        # away, and the processing below only waits for their completion.
+        # Datasets must still be merged one by one, in the order reported
+        # by subdatasets(), because it reports on the state of a
+        # superdataset after it was merged
+        executor = None
+        fetches = {}
+        if get_n_jobs(jobs) > 1:
+            executor = ThreadPoolExecutor(max_workers=get_n_jobs(jobs))
+            for ds in itertools.chain([refds], refds.subdatasets(
+                    path=path,
+                    fulfilled=True,
+                    recursive=recursive,
+                    recursion_limit=recursion_limit,
+                    return_type='generator',
+                    result_renderer='disabled',
+                    result_xfm='datasets') if recursive else []):
+                # the repo instances are created here, as this is not
+                # thread-safe
+                fetches[ds.path] = executor.submit(
+                    _fetch_if_possible, ds, ds.repo, sibling, merge)
+        try:
+            yield from _update(
+                refds, path, sibling, merge, follow, recursive,
+                recursion_limit, reobtain_data, fetches)
+        finally:
+            if executor is not None:
+                # do not wait for fetches that are no longer needed, when
+                # stopping early (on failure, or interrupted)
+                for f in fetches.values():
+                    f.cancel()
+                executor.shutdown()
+
+
+def _update(refds, path, sibling, merge, follow, recursive, recursion_limit,
+            reobtain_data, fetches):
+    save_paths = []
+    merge_failures = set()
+    saw_subds = False
+    for ds, revision in itertools.chain([(refds, None)], refds.subdatasets(
+            path=path,
+            fulfilled=True,
+            recursive=recursive,
+            recursion_limit=recursion_limit,
+            return_type='generator',
+            result_renderer='disabled',
+            result_xfm=YieldDatasetAndRevision()) if recursive else []):
+        if ds != refds:
+            saw_subds = True
+        repo = ds.repo
+        is_annex = isinstance(repo, AnnexRepo)
+        # prepare return value
+        res = get_status_dict('update', ds=ds, logger=lgr, refds=refds.path)
+        curr_branch = repo.get_active_branch()
+        sibling_, tracking_remote, status, msg = _choose_update_sibling(
+            repo, sibling, merge)
+        if status:
+            yield dict(res, status=status, message=msg)
+            continue
+        if ds.path in fetches:
+            # wait for the fetch that is already underway
+            fetches.pop(ds.path).result()
+        else:
+            _fetch(ds, repo, sibling)
+        # NOTE reevaluate ds.repo again, as it might have be converted from
+        # a GitRepo to an AnnexRepo
+        repo = ds.repo
+
+        follow_parent = revision and follow == "parentds"
+        if follow_parent and not repo.commit_exists(revision):
+            if sibling_:
+                try:
+                    lgr.debug("Fetching revision %s directly for %s",
+                              revision, repo)
+                    repo.fetch(remote=sibling_, refspec=revision,
+                               git_options=["--recurse-submodules=no"])
+                except CommandError as exc:
+                    yield dict(
+                        res,
+                        status="impossible",
+                        message=(
+                            "Attempt to fetch %s from %s failed: %s",
+                            revision, sibling_, exc_str(exc)))
+                    continue
             else:
-                sibling_ = sibling
-            if sibling_ and sibling_ not in remotes:
-                res['message'] = ("'%s' not known to dataset %s\nSkipping",
-                                  sibling_, repo.path)
-                res['status'] = 'impossible'
-                yield res
+                yield dict(res,
+                           status="impossible",
+                           message=("Need to fetch %s directly "
+                                    "but single sibling not resolved",
+                                    revision))
                 continue
-            if not sibling_ and len(remotes) > 1 and merge:
-                lgr.debug("Found multiple siblings:\n%s" % remotes)
-                res['status'] = 'impossible'
-                res['message'] = "Multiple siblings, please specify from which to update."
-                yield res
-                continue
-            lgr.info("Fetching updates for %s", ds)
-            # fetch remote
-            fetch_kwargs = dict(
-                # test against user-provided value!
-                remote=None if sibling is None else sibling_,
-                all_=sibling is None,
-                # required to not trip over submodules that
-                # were removed in the origin clone
-                recurse_submodules="no",
-                prune=True)  # prune to not accumulate a mess over time
-            repo.fetch(**fetch_kwargs)
-            # NOTE reevaluate ds.repo again, as it might have be converted from
-            # a GitRepo to an AnnexRepo
-            repo = ds.repo
-
-            follow_parent = revision and follow == "parentds"
-            if follow_parent and not repo.commit_exists(revision):
-                if sibling_:
-                    try:
-                        lgr.debug("Fetching revision %s directly for %s",
-                                  revision, repo)
-                        repo.fetch(remote=sibling_, refspec=revision,
-                                   git_options=["--recurse-submodules=no"])
-                    except CommandError as exc:
-                        yield dict(
-                            res,
-                            status="impossible",
-                            message=(
-                                "Attempt to fetch %s from %s failed: %s",
-                                revision, sibling_, exc_str(exc)))
-                        continue
-                else:
-                    yield dict(res,
-                               status="impossible",
-                               message=("Need to fetch %s directly "
-                                        "but single sibling not resolved",
-                                        revision))
-                    continue
 
-            saw_merge_failure = False
-            if merge:
+        saw_merge_failure = False
+        if merge:
+            if follow_parent:
+                merge_target = revision
+            else:
+                merge_target = _choose_merge_target(
+                    repo, curr_branch,
+                    sibling_, tracking_remote)
+
+            merge_fn = _choose_merge_fn(
+                repo,
+                is_annex=is_annex,
+                adjusted=is_annex and repo.is_managed_branch(curr_branch))
+
+            merge_opts = None
+            if merge_fn is _annex_sync:
                 if follow_parent:
-                    merge_target = revision
-                else:
-                    merge_target = _choose_merge_target(
-                        repo, curr_branch,
-                        sibling_, tracking_remote)
-
-                merge_fn = _choose_merge_fn(
-                    repo,
-                    is_annex=is_annex,
-                    adjusted=is_annex and repo.is_managed_branch(curr_branch))
-
-                merge_opts = None
-                if merge_fn is _annex_sync:
-                    if follow_parent:
-                        yield dict(
-                            res, status="impossible",
-                            message=("follow='parentds' is incompatible "
-                                     "with adjusted branches"))
-                        continue
-                elif merge_target is None:
-                    yield dict(res,
-                               status="impossible",
-                               message="Could not determine merge target")
+                    yield dict(
+                        res, status="impossible",
+                        message=("follow='parentds' is incompatible "
+                                 "with adjusted branches"))
                     continue
-                elif merge == "ff-only":
-                    merge_opts = ["--ff-only"]
-
-                if is_annex and reobtain_data:
-                    merge_fn = _reobtain(ds, merge_fn)
-
-                for mres in merge_fn(repo, sibling_, merge_target,
-                                     merge_opts=merge_opts):
-                    if mres["action"] == "merge" and mres["status"] != "ok":
-                        saw_merge_failure = True
-                    yield dict(res, **mres)
-
-            if saw_merge_failure:
-                merge_failures.add(ds)
-                res['status'] = 'error'
-                res['message'] = ("Merge of %s failed", merge_target)
-            else:
-                res['status'] = 'ok'
-                save_paths.append(ds.path)
-            yield res
-        # we need to save updated states only if merge was requested -- otherwise
-        # it was a pure fetch
-        if merge and recursive:
-            if path and not saw_subds:
-                lgr.warning(
-                    'path constraints did not match an installed subdataset: %s',
-                    path)
-            if refds in merge_failures:
-                lgr.warning("Not saving because top-level dataset %s "
-                            "had a merge failure",
-                            refds.path)
-            else:
-                save_paths = [p for p in save_paths if p != refds.path]
-                if not save_paths:
-                    return
-                lgr.debug(
-                    'Subdatasets where updated state may need to be '
-                    'saved in the parent dataset: %s', save_paths)
-                for r in refds.save(
-                        path=save_paths,
-                        recursive=False,
-                        message='[DATALAD] Save updated subdatasets'):
-                    yield r
+            elif merge_target is None:
+                yield dict(res,
+                           status="impossible",
+                           message="Could not determine merge target")
+                continue
+            elif merge == "ff-only":
+                merge_opts = ["--ff-only"]
+
+            if is_annex and reobtain_data:
+                merge_fn = _reobtain(ds, merge_fn)
+
+            for mres in merge_fn(repo, sibling_, merge_target,
+                                 merge_opts=merge_opts):
+                if mres["action"] == "merge" and mres["status"] != "ok":
+                    saw_merge_failure = True
+                yield dict(res, **mres)
+
+        if saw_merge_failure:
+            merge_failures.add(ds)
+            res['status'] = 'error'
+            res['message'] = ("Merge of %s failed", merge_target)
+        else:
+            res['status'] = 'ok'
+            save_paths.append(ds.path)
+        yield res
+    # we need to save updated states only if merge was requested -- otherwise
+    # it was a pure fetch
+    if merge and recursive:
+        if path and not saw_subds:
+            lgr.warning(
+                'path constraints did not match an installed subdataset: %s',
+                path)
+        if refds in merge_failures:
+            lgr.warning("Not saving because top-level dataset %s "
+                        "had a merge failure",
+                        refds.path)
+        else:
+            save_paths = [p for p in save_paths if p != refds.path]
+            if not save_paths:
+                return
+            lgr.debug(
+                'Subdatasets where updated state may need to be '
+                'saved in the parent dataset: %s', save_paths)
+            for r in refds.save(
+                    path=save_paths,
+                    recursive=False,
+                    message='[DATALAD] Save updated subdatasets'):
+                yield r
+
+
+def _choose_update_sibling(repo, sibling, merge):
+    """Determine the sibling to update `repo` from
+
+    Returns
+    -------
+    tuple
+      (sibling, tracking remote, status, message). Status and message are
+      None, unless no update is possible.
+    """
+    is_annex = isinstance(repo, AnnexRepo)
+    # get all remotes which have references (would exclude
+    # special remotes)
+    remotes = repo.get_remotes(
+        **({'exclude_special_remotes': True} if is_annex else {}))
+    if not remotes and not sibling:
+        return (None, None, 'notneeded',
+                ("No siblings known to dataset at %s\nSkipping", repo.path))
+    tracking_remote = None
+    if not sibling and len(remotes) == 1:
+        # there is only one remote, must be this one
+        sibling_ = remotes[0]
+    elif not sibling:
+        # nothing given, look for tracking branch
+        tracking_remote = repo.get_tracking_branch(
+            branch=repo.get_active_branch(), remote_only=True)[0]
+        sibling_ = tracking_remote
+    else:
+        sibling_ = sibling
+    if sibling_ and sibling_ not in remotes:
+        return (sibling_, tracking_remote, 'impossible',
+                ("'%s' not known to dataset %s\nSkipping",
+                 sibling_, repo.path))
+    if not sibling_ and len(remotes) > 1 and merge:
+        lgr.debug("Found multiple siblings:\n%s" % remotes)
+        return (sibling_, tracking_remote, 'impossible',
+                "Multiple siblings, please specify from which to update.")
+    return sibling_, tracking_remote, None, None
+
+
+def _fetch(ds, repo, sibling):
+    lgr.info("Fetching updates for %s", ds)
+    # fetch remote
+    repo.fetch(
+        # test against user-provided value! If given, it was verified to
+        # be a known sibling
+        remote=sibling,
+        all_=sibling is None,
+        # required to not trip over submodules that
+        # were removed in the origin clone
+        recurse_submodules="no",
+        prune=True)  # prune to not accumulate a mess over time
+
+
+def _fetch_if_possible(ds, repo, sibling, merge):
+    if _choose_update_sibling(repo, sibling, merge)[2] is None:
+        _fetch(ds, repo, sibling)
 
 
 def _choose_merge_target(repo, branch, remote, cfg_remote):
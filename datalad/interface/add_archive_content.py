@@ -16,6 +16,7 @@ __docformat__ = 'restructuredtext'
 
 import re
 import os
+import shutil
 import tempfile
 
 from os.path import join as opj, curdir, exists, lexists, relpath, basename
@@ -28,14 +29,18 @@ from os.path import normpath
 
 from .base import Interface
 from datalad.interface.base import build_doc
-from .common_opts import allow_dirty
+from .common_opts import (
+    allow_dirty,
+)
 from ..consts import ARCHIVES_SPECIAL_REMOTE
 from ..support.param import Parameter
 from ..support.constraints import EnsureStr, EnsureNone
+from ..support.constraints import EnsureInt, EnsureChoice
 
 from ..support.annexrepo import AnnexRepo
 from datalad.support.exceptions import FileNotInRepositoryError
 from ..support.strings import apply_replacement_rules
+from ..support.parallel import parallel_map
 from ..support.stats import ActivityStats
 from ..cmdline.helpers import get_repo_instance
 from ..utils import getpwd, rmtree, file_basename
@@ -55,6 +60,10 @@ lgr = logging.getLogger('datalad.interfaces.add_archive_content')
 _KEY_OPT = "[PY: `key=True` PY][CMD: --key CMD]"
 _KEY_OPT_NOTE = "Note that it will be of no effect if %s is given" % _KEY_OPT
 
+# number of files to accumulate in pipeline mode before they get moved
+# into the tree and registered with annex in one go
+_PIPELINE_BATCH_SIZE = 10000
+
 # TODO: may be we could enable separate logging or add a flag to enable
 # all but by default to print only the one associated with this given action
 
@@ -174,6 +183,25 @@ class AddArchiveContent(Interface):
             doc="""extract under a temporary directory, git-annex add, and delete after.  To
              be used to "index" files within annex without actually creating corresponding
              files under git.  Note that `annex dropunused` would later remove that load"""),
+        pipeline=Parameter(
+            args=("--pipeline",),
+            action="store_true",
+            doc="""flag to process extracted files in large batches instead of
+            one at a time: files are moved into the tree (in parallel, see
+            [PY: `jobs` PY][CMD: --jobs CMD]), added to annex with a single
+            :command:`git annex add` call, and their URLs are registered via
+            :command:`git annex registerurl --batch`.  In this mode
+            [PY: `annex_options` PY][CMD: --annex-options CMD] are passed to
+            :command:`git annex add`"""),
+        jobs=Parameter(
+            args=("-J", "--jobs"),
+            metavar="NJOBS",
+            constraints=EnsureInt() | EnsureNone() | EnsureChoice('auto'),
+            doc="""how many extracted files to move into the tree in
+            parallel in [PY: `pipeline` PY][CMD: --pipeline CMD] mode (no
+            effect otherwise). "auto" corresponds to the number defined by
+            the 'datalad.runtime.max-jobs' configuration item. By default,
+            files are moved one at a time."""),
 
         # TODO: interaction with archives cache whenever we make it persistent across runs
         archive=Parameter(
@@ -199,7 +227,8 @@ class AddArchiveContent(Interface):
                  use_current_dir=False,
                  delete=False, key=False, exclude=None, rename=None, existing='fail',
                  annex_options=None, copy=False, commit=True, allow_dirty=False,
-                 stats=None, drop_after=False, delete_after=False):
+                 stats=None, drop_after=False, delete_after=False,
+                 pipeline=False, jobs=None):
         """
         Returns
         -------
@@ -335,6 +364,10 @@ class AddArchiveContent(Interface):
             # dedicated stats which would be added to passed in (if any)
             outside_stats = stats
             stats = ActivityStats()
+            # (target path, extracted path, url) awaiting registration in
+            # pipeline mode
+            pending = []
+            pending_targets = set()
 
             for extracted_file in earchive.get_extracted_files():
                 stats.files += 1
@@ -388,6 +421,13 @@ class AddArchiveContent(Interface):
 
                 target_file_path = opj(annex.path, target_file_path)
 
+                if pipeline and pending and target_file_path in pending_targets:
+                    # must be in the tree for collisions to be handled
+                    _register_extracted_files(
+                        annex, pending, annex_options, drop_after, jobs, stats)
+                    pending = []
+                    pending_targets = set()
+
                 if lexists(target_file_path):
                     handle_existing = True
                     if md5sum(target_file_path) == md5sum(extracted_path):
@@ -430,7 +470,10 @@ class AddArchiveContent(Interface):
                         suf, i = '', 0
                         while True:
                             target_file_path_new = opj(p, fn_base + suf + ('.' if (fn_ext or ends_with_dot) else '') + fn_ext)
-                            if not lexists(target_file_path_new):
+                            # in pipeline mode, files are not yet moved into
+                            # the tree, but must not be overwritten either
+                            if not lexists(target_file_path_new) and \
+                                    target_file_path_new not in pending_targets:
                                 break
                             lgr.debug("File %s already exists" % target_file_path_new)
                             i += 1
@@ -452,24 +495,35 @@ class AddArchiveContent(Interface):
                     # addurl implementation relying on annex'es addurl below would actually copy
                     pass
 
-                lgr.debug("Adding %s to annex pointing to %s and with options %r",
-                          target_file_path, url, annex_options)
-
-                out_json = annex.add_url_to_file(
-                    target_file_path,
-                    url, options=annex_options,
-                    batch=True)
-
-                if 'key' in out_json and out_json['key'] is not None:  # annex.is_under_annex(target_file, batch=True):
-                    # due to http://git-annex.branchable.com/bugs/annex_drop_is_not___34__in_effect__34___for_load_which_was___34__addurl_--batch__34__ed_but_not_yet_committed/?updated
-                    # we need to maintain a list of those to be dropped files
-                    if drop_after:
-                        annex.drop_key(out_json['key'], batch=True)
-                        stats.dropped += 1
-                    stats.add_annex += 1
+                if pipeline:
+                    pending.append((target_file_path, extracted_path, url))
+                    pending_targets.add(target_file_path)
+                    if len(pending) >= _PIPELINE_BATCH_SIZE:
+                        _register_extracted_files(
+                            annex, pending, annex_options, drop_after,
+                            jobs, stats)
+                        pending = []
+                        pending_targets = set()
                 else:
-                    lgr.debug("File {} was added to git, not adding url".format(target_file_path))
-                    stats.add_git += 1
+                    lgr.debug(
+                        "Adding %s to annex pointing to %s and with options %r",
+                        target_file_path, url, annex_options)
+
+                    out_json = annex.add_url_to_file(
+                        target_file_path,
+                        url, options=annex_options,
+                        batch=True)
+
+                    if 'key' in out_json and out_json['key'] is not None:  # annex.is_under_annex(target_file, batch=True):
+                        # due to http://git-annex.branchable.com/bugs/annex_drop_is_not___34__in_effect__34___for_load_which_was___34__addurl_--batch__34__ed_but_not_yet_committed/?updated
+                        # we need to maintain a list of those to be dropped files
+                        if drop_after:
+                            annex.drop_key(out_json['key'], batch=True)
+                            stats.dropped += 1
+                        stats.add_annex += 1
+                    else:
+                        lgr.debug("File {} was added to git, not adding url".format(target_file_path))
+                        stats.add_git += 1
 
                 if delete_after:
                     # delayed removal so it doesn't interfer with batched processes since any pure
@@ -491,6 +545,12 @@ class AddArchiveContent(Interface):
 
                 del target_file  # Done with target_file -- just to have clear end of the loop
 
+            if pending:
+                _register_extracted_files(
+                    annex, pending, annex_options, drop_after, jobs, stats)
+                pending = []
+                pending_targets = set()
+
             if delete and archive and origin != 'key':
                 lgr.debug("Removing the original archive {}".format(archive))
                 # force=True since some times might still be staged and fail
@@ -543,3 +603,66 @@ class AddArchiveContent(Interface):
             earchive.clean(force=True)
 
         return annex
+
+
+def _register_extracted_files(annex, pending, annex_options, drop_after,
+                              jobs, stats):
+    """Move a batch of extracted files into the tree and register their URLs
+
+    Helper for the pipeline mode of `AddArchiveContent`.
+
+    Parameters
+    ----------
+    annex : AnnexRepo
+    pending : list of tuple
+      (target path, extracted path, url) for each file.
+    annex_options : list or None
+      Passed to `git annex add`.
+    drop_after : bool
+      Drop the content of the annexed files after their URLs were
+      registered.
+    jobs : int or 'auto' or None
+      Number of parallel workers for moving the files.
+    stats : ActivityStats
+    """
+    lgr.debug("Moving %d extracted files into %s", len(pending), annex)
+
+    def _move(rec):
+        target_file_path, extracted_path, _ = rec
+        os.makedirs(dirname(target_file_path), exist_ok=True)
+        shutil.move(extracted_path, target_file_path)
+
+    for _ in parallel_map(_move, pending, jobs=jobs):
+        pass
+
+    urls = {relpath(t, annex.path): url for t, _, url in pending}
+    keys = []
+    with tempfile.TemporaryFile(mode='w+') as registerurl_input:
+        for res in annex.add_(list(urls), options=annex_options):
+            if not res.get('success', True):
+                raise RuntimeError(
+                    "Failed to add {} to annex: {}".format(
+                        res.get('file'), res.get('note', res)))
+            key = res.get('key')
+            if key is None:
+                lgr.debug("File %s was added to git, not adding url",
+                          res.get('file'))
+                stats.add_git += 1
+                continue
+            registerurl_input.write(
+                '{} {}\n'.format(key, urls[res['file']]))
+            keys.append(key)
+            stats.add_annex += 1
+        if keys:
+            registerurl_input.flush()
+            registerurl_input.seek(0)
+            lgr.debug("Registering URLs of %d keys", len(keys))
+            annex._run_annex_command(
+                'registerurl',
+                annex_options=['--batch'],
+                runner='gitwitless',
+                stdin=registerurl_input,
+                log_stdout=False)
+    if drop_after and keys:
+        annex.drop_key(keys)
+        stats.dropped += len(keys)
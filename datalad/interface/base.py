@@ -103,6 +103,180 @@ def get_interface_groups(include_plugins=False):
     return grps
 
 
+def _get_command_cache_key():
+    """Return a key to validate cached command metadata against
+
+    The key changes with the DataLad version and whenever anything is
+    (un)installed into any directory on `sys.path`, the set of core
+    commands is changed, or a plugin is changed. It is cheap to compute,
+    as it is needed at every startup. Hence edits of the docstrings of
+    individual commands in a development installation are not detected.
+    """
+    import datalad
+
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    return [
+        datalad.__version__,
+        sys.executable,
+        [[p, _mtime(p)] for p in sys.path if p],
+        # the command groups are declared here
+        _mtime(os.path.join(
+            os.path.dirname(datalad.__file__), 'interface', '__init__.py')),
+        [[props['file'], _mtime(props['file'])]
+         for _, props in _get_plugins()],
+    ]
+
+
+def _get_command_cache_item(name, compute):
+    """Return an item of the command metadata cache
+
+    The cache is stored as JSON in DataLad's cache directory. If an item is
+    not in the cache, or the cache is outdated, the item is recomputed by
+    calling `compute()` and stored.
+
+    Parameters
+    ----------
+    name : str
+      Name of the item.
+    compute : callable
+      Must return a JSON-serializable value.
+    """
+    import json
+    from datalad import cfg
+
+    cache_file = os.path.join(
+        cfg.obtain('datalad.locations.cache'), 'commands.json')
+    key = _get_command_cache_key()
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    item = cache.get(name)
+    if item and item['key'] == key:
+        return item['value']
+
+    lgr.debug("Updating cached command metadata '%s'", name)
+    value = compute()
+    cache[name] = dict(key=key, value=value)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = '{}.{}'.format(cache_file, os.getpid())
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        lgr.debug("Failed to cache command metadata: %s", exc_str(e))
+    return value
+
+
+def _load_extension_groups():
+    from pkg_resources import iter_entry_points  # delay expensive import
+    groups = []
+    for ep in iter_entry_points('datalad.extensions'):
+        lgr.debug(
+            'Loading entrypoint %s from datalad.extensions', ep.name)
+        try:
+            spec = ep.load()
+        except Exception as e:
+            lgr.warning('Failed to load entrypoint %s: %s', ep.name, exc_str(e))
+            continue
+        if len(spec) < 2 or not spec[1]:
+            lgr.debug(
+                'Extension does not provide a command suite: %s',
+                ep.name)
+            continue
+        groups.append((ep.name, spec[0], [list(i) for i in spec[1]]))
+        lgr.debug('Loaded entrypoint %s', ep.name)
+    return groups
+
+
+# command groups of extensions, determined once per process
+_extension_interface_groups = None
+
+
+def get_extension_interface_groups():
+    """Return a list of command groups provided by installed extensions
+
+    The extensions are discovered via their 'datalad.extensions' entry points.
+    As this is expensive, the result is cached across processes, and
+    determined only once per process.
+
+    Returns
+    -------
+    A list of tuples with the form (GROUP_NAME, GROUP_DESCRIPTION, COMMANDS),
+    like `get_interface_groups()`.
+    """
+    global _extension_interface_groups
+    if _extension_interface_groups is None:
+        _extension_interface_groups = [
+            (name, descr, [tuple(i) for i in specs])
+            for name, descr, specs in _get_command_cache_item(
+                'extensions', _load_extension_groups)
+        ]
+    # a copy, as callers extend the list of groups
+    return list(_extension_interface_groups)
+
+
+def _get_interface_spec_id(spec):
+    return spec[1]['file'] if isinstance(spec[1], dict) \
+        else '{}:{}'.format(*spec[:2])
+
+
+def get_interface_summaries(groups):
+    """Return the short descriptions of all commands in `groups`
+
+    This requires loading all interfaces, hence the descriptions are cached
+    across processes.
+
+    Parameters
+    ----------
+    groups : list of tuples
+        A list of groups and commands in the form described by
+        `get_interface_groups`.
+
+    Returns
+    -------
+    dict
+      Maps an interface specification identifier to a tuple with the short
+      descriptions for the Python API and the command line. Interfaces that
+      could not be loaded are not included.
+    """
+    def _compute():
+        summaries = {}
+        for _, _, specs in groups:
+            for spec in specs:
+                intf = load_interface(spec)
+                if intf is None:
+                    continue
+                doc = get_cmd_doc(intf)
+                api_descr = alter_interface_docs_for_api(doc).split("\n")[0]
+                if hasattr(intf, 'parser_args'):
+                    cmd_descr = intf.parser_args['description']
+                else:
+                    cmd_descr = alter_interface_docs_for_cmdline(doc)
+                cmd_descr = cmd_descr.split('\n')[0]
+                sdescr = getattr(intf, "short_description", None)
+                summaries[_get_interface_spec_id(spec)] = (
+                    sdescr or api_descr, sdescr or cmd_descr)
+        return summaries
+
+    name = 'summaries-{}'.format(','.join(sorted(g[0] for g in groups)))
+    summaries = _get_command_cache_item(name, _compute)
+    return {
+        _get_interface_spec_id(spec):
+        tuple(summaries[_get_interface_spec_id(spec)])
+        for _, _, specs in groups
+        for spec in specs
+        if _get_interface_spec_id(spec) in summaries
+    }
+
+
 def get_cmd_summaries(descriptions, groups, width=79):
     """Return summaries for the commands in `groups`.
 
@@ -743,7 +917,8 @@ class Interface(object):
         else:
             # common options
             # XXX define or better get from elsewhere
-            common_opts = ('change_path', 'common_debug', 'common_idebug', 'func',
+            common_opts = ('change_path', 'common_debug', 'common_idebug',
+                           'common_trace_subprocesses', 'func',
                            'help', 'log_level', 'logger', 'pbs_runner',
                            'result_renderer', 'subparser')
             argnames = [name for name in dir(args)
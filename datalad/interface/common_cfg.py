@@ -266,6 +266,13 @@ definitions = {
         'destination': 'global',
         'default': None,
     },
+    'datalad.subdatasets.hierarchy-index': {
+        'ui': ('question', {
+               'title': 'Persistent index of subdataset hierarchies',
+               'text': 'If enabled, the subdatasets reported for each dataset in a hierarchy are recorded in an index under .git/datalad/ of the dataset a subdatasets query is run on. Subsequent (recursive) queries use the record of any dataset whose .gitmodules file and Git index did not change since, instead of calling Git'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
     'datalad.annex.retry': {
         'ui': ('question',
                {'title': 'Value for annex.retry to use for git-annex calls',
@@ -297,6 +304,13 @@ definitions = {
         'type': EnsureInt(),
         'default': 5,
     },
+    'datalad.metadata.cache-size': {
+        'ui': ('question', {
+               'title': 'Size of the metadata object cache',
+               'text': 'Maximum size (in MB, estimated) of decoded aggregated metadata objects that are kept in memory for reuse by subsequent metadata queries within the same process. Set to 0 to disable caching'}),
+        'type': EnsureInt(),
+        'default': 100,
+    },
     'datalad.metadata.maxfieldsize': {
         'ui': ('question', {
                'title': 'Maximum metadata field size',
@@ -316,6 +330,20 @@ definitions = {
         'type': EnsureBool(),
         'default': True,
     },
+    'datalad.metadata.aggregate-content-incremental': {
+        'ui': ('question', {
+               'title': 'Incremental content metadata extraction',
+               'text': 'If enabled, re-aggregating metadata of a dataset only runs extractors on files that were added or modified since the previously aggregated state, and reuses previously extracted content metadata for all other files. Only enable if extractors report metadata on a file solely based on that file'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
+    'datalad.metadata.aggregate-content-format': {
+        'ui': ('question', {
+               'title': 'Storage format of aggregated content metadata',
+               'text': "Format of the object files that store aggregated content metadata. 'xz' is an XZ-compressed JSON stream that must be decompressed entirely on access. 'sqlite' is an SQLite database with per-file compressed records that allows for retrieving metadata on individual paths without loading the metadata of all other files"}),
+        'type': EnsureChoice('xz', 'sqlite'),
+        'default': 'xz',
+    },
     'datalad.search.default-mode': {
         'ui': ('question', {
                'title': 'Default search mode',
@@ -336,6 +364,27 @@ definitions = {
                'text': 'Git-annex large files expression (see https://git-annex.branchable.com/tips/largefiles; given expression will be wrapped in parentheses)'}),
         'default': 'anything',
     },
+    'datalad.run.inputs-from-index': {
+        'ui': ('question', {
+               'title': 'Match input globs against the index',
+               'text': 'If enabled, globs given as inputs to `run` are matched against the files recorded in the Git index rather than against the file system. This is faster for large directories and also matches files without a work tree file. Untracked files are matched too, and the file system is still consulted for globs that can match content of subdatasets or untracked directories'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
+    'datalad.run.record-output': {
+        'ui': ('question', {
+               'title': 'Size of the command output recorded by `run`',
+               'text': 'If set to a positive number, `run` keeps the last N bytes of the stdout and stderr of a command and includes them in the run record. Otherwise the command output is not processed by DataLad at all'}),
+        'type': EnsureInt(),
+        'default': 0,
+    },
+    'datalad.run.record-resources': {
+        'ui': ('question', {
+               'title': 'Record resource usage of `run` commands',
+               'text': 'If enabled, the wall time, CPU time, and peak memory usage (in bytes) of a command executed by `run` is included in the run record. Not supported on Windows'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
     'datalad.runtime.max-annex-jobs': {
         'ui': ('question', {
                'title': 'Maximum number of git-annex jobs to request when "jobs" option set to "auto" (default)',
@@ -343,6 +392,13 @@ definitions = {
         'type': EnsureInt(),
         'default': 1,
     },
+    'datalad.runtime.max-jobs': {
+        'ui': ('question', {
+               'title': 'Maximum number of parallel jobs DataLad itself uses when "jobs" option set to "auto"',
+               'text': 'Set this value to enable concurrent processing (e.g. of multiple datasets, or files) within DataLad commands that support it. The effective number of jobs will not exceed the number of available CPU cores (or 3 if there is less than 3 cores).'}),
+        'type': EnsureInt(),
+        'default': 1,
+    },
     'datalad.runtime.raiseonerror': {
         'ui': ('question', {
                'title': 'Error behavior',
@@ -146,6 +146,8 @@ reckless_opt = Parameter(
     Supported modes are:
     ['auto']: hard-link files between local clones. In-place
     modification in any clone will alter original annex content.
+    Clones from a RIA store on a local file system reference the store's
+    Git objects (git alternates) instead of copying them.
     ['ephemeral']: symlink annex to origin's annex and discard local availability
     info via git-annex-dead 'here'. Shares an annex between origin and clone
     w/o git-annex being aware of it. In case of a change in origin you need to
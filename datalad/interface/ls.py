@@ -328,10 +328,12 @@ class FsModel(AnnexModel):
 
         if type_ in ['file', 'link', 'link-broken']:
             # if node is under annex, ask annex for node size, ondisk_size
-            if isinstance(self.repo, AnnexRepo) and self.repo.is_under_annex(str(self._path)):
-                size = self.repo.info(str(self._path), batch=True)['size']
+            annexinfo = self.repo.get_files_annexinfo([str(self._path)]) \
+                if isinstance(self.repo, AnnexRepo) else None
+            if annexinfo and annexinfo['annexed'][0]:
+                size = annexinfo['bytesize'][0]
                 ondisk_size = size \
-                    if self.repo.file_has_content(str(self._path)) \
+                    if annexinfo['has_content'][0] \
                     else 0
             # else ask fs for node size (= ondisk_size)
             else:
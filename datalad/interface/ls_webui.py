@@ -14,6 +14,7 @@ import hashlib
 import numbers
 import humanize
 import json as js
+import os
 import time
 from genericpath import isdir, exists, getmtime
 from os import makedirs, remove, listdir
@@ -23,7 +24,9 @@ from os.path import join as opj, relpath, \
 from datalad.consts import OLDMETADATA_DIR, OLDMETADATA_FILENAME
 from datalad.distribution.dataset import Dataset
 from datalad.interface.ls import FsModel, lgr, GitModel
+from datalad.support.annexrepo import AnnexRepo
 from datalad.support.network import is_datalad_compat_ri
+from datalad.support.parallel import parallel_map
 from datalad.utils import safe_print, with_pathsep
 from datalad.utils import Path
 
@@ -120,22 +123,30 @@ def fs_extract(nodepath, repo, basepath='/'):
     """
     # Create FsModel from filesystem nodepath and its associated parent repository
     node = FsModel(nodepath, repo)
-    pretty_size = {
-        stype: humanize.naturalsize(svalue)
-            if isinstance(svalue, numbers.Number) else UNKNOWN_SIZE
-        for stype, svalue in node.size.items()
-    }
-    pretty_date = time.strftime(u"%Y-%m-%d %H:%M:%S", time.localtime(node.date))
-    name = leaf_name(node._path) \
-        if leaf_name(node._path) != "" \
-        else leaf_name(node.repo.path)
-    rec = {
-        "name": name,
-        "path": relpath(str(node._path), basepath),
-        "type": node.type_,
-        "size": pretty_size,
-        "date": pretty_date,
+    rec = _node_record(node._path, node.type_, node.size, node.date, basepath)
+    if rec['name'] == "":
+        rec['name'] = leaf_name(node.repo.path)
+    _add_node_metadata(rec, nodepath)
+    return rec
+
+
+def _node_record(nodepath, type_, size, date, basepath):
+    """format the record of a node from its (raw) properties"""
+    return {
+        "name": leaf_name(nodepath),
+        "path": relpath(str(nodepath), basepath),
+        "type": type_,
+        "size": {
+            stype: humanize.naturalsize(svalue)
+                if isinstance(svalue, numbers.Number) else UNKNOWN_SIZE
+            for stype, svalue in size.items()
+        },
+        "date": time.strftime(u"%Y-%m-%d %H:%M:%S", time.localtime(date)),
     }
+
+
+def _add_node_metadata(rec, nodepath):
+    """include (old-style) dataset metadata found at nodepath into its record"""
     # if there is meta-data for the dataset (done by aggregate-metadata)
     # we include it
     metadata_path = opj(nodepath, OLDMETADATA_DIR, OLDMETADATA_FILENAME)
@@ -154,7 +165,16 @@ def fs_extract(nodepath, repo, basepath='/'):
             metaid = metadata[0]['@id']
             assert all(m['@id'] == metaid for m in metadata)
         rec["metadata"] = metadata_reduced
-    return rec
+
+
+def _sum_sizes(nodes):
+    """humanized sum of sizes (per size type) of all given node records"""
+    nodes_size = {}
+    for node in nodes:
+        for size_type, node_size in node['size'].items():
+            nodes_size[size_type] = nodes_size.get(size_type, 0) + machinesize(node_size)
+    return {size_type: humanize.naturalsize(node_size)
+            for size_type, node_size in nodes_size.items()}
 
 
 def fs_render(fs_metadata, json=None, **kwargs):
@@ -174,7 +194,8 @@ def fs_render(fs_metadata, json=None, **kwargs):
         # create metadata_root directory if it doesn't exist
         metadata_dir = dirname(metadata_file)
         if not exists(metadata_dir):
-            makedirs(metadata_dir)
+            # might be rendering multiple nodes concurrently
+            makedirs(metadata_dir, exist_ok=True)
         # write directory metadata to json
         with open(metadata_file, 'w') as f:
             js.dump(fs_metadata, f)
@@ -295,16 +316,9 @@ def fs_traverse(path, repo, parent=None,
                 # append child metadata to list
                 children.extend([subdir])
 
-        # sum sizes of all 1st level children
-        children_size = {}
-        for node in children[1:]:
-            for size_type, child_size in node['size'].items():
-                children_size[size_type] = children_size.get(size_type, 0) + machinesize(child_size)
-
-        # update current node sizes to the humanized aggregate children size
-        fs['size'] = children[0]['size'] = \
-            {size_type: humanize.naturalsize(child_size)
-             for size_type, child_size in children_size.items()}
+        # update current node sizes to the humanized aggregate size of all
+        # 1st level children
+        fs['size'] = children[0]['size'] = _sum_sizes(children[1:])
 
         children[0]['name'] = '.'       # replace current node name with '.' to emulate unix syntax
         if parent:
@@ -319,6 +333,143 @@ def fs_traverse(path, repo, parent=None,
     return fs
 
 
+def fs_traverse_bulk(path, repo, parent=None,
+                     subdatasets=None,
+                     render=True,
+                     recurse_datasets=False,
+                     json=None, jobs='auto'):
+    """Traverse the entire directory tree of a dataset in one pass
+
+    Yields the same records as `fs_traverse(recurse_directories=True)`, but
+    instead of inspecting node by node, annex information on all files is
+    obtained from a single `get_content_annexinfo()` call, the directory
+    tree is walked once, and directory sizes are aggregated bottom-up in
+    memory. Records of subdirectories are rendered while the traversal
+    proceeds, in up to `jobs` threads.
+
+    Parameters
+    ----------
+    path: str
+      Path to the root directory of the dataset
+    repo: AnnexRepo or GitRepo
+      Repo object of the dataset
+    parent: dict
+      Extracted info about parent directory
+    subdatasets: list
+      Paths of subdatasets, relative to `path`
+    render: bool
+      Render the record of the root directory too. Records of all
+      subdirectories are always rendered.
+    jobs: int or 'auto' or None
+      Number of parallel jobs for rendering.
+
+    Returns
+    -------
+    dict
+      info of the root directory, with info on its children in 'nodes'
+    """
+    subdatasets = set(subdatasets or [])
+    dataset = Dataset(repo.path)
+    submodules = {str(sm["path"].relative_to(repo.pathobj)): sm
+                  for sm in repo.get_submodules_()}
+    annexinfo = {
+        str(p.relative_to(repo.pathobj)): props
+        for p, props in repo.get_content_annexinfo(
+            init=None, eval_availability=True).items()
+    } if isinstance(repo, AnnexRepo) else {}
+
+    def _file_record(entry):
+        nodepath = entry.path
+        if entry.is_symlink():
+            type_ = 'link' if exists(nodepath) else 'link-broken'
+        else:
+            type_ = 'file'
+        props = annexinfo.get(relpath(nodepath, path))
+        if props is not None:
+            size = props.get('bytesize')
+            ondisk_size = size if props.get('has_content') else 0
+        else:
+            size = ondisk_size = 0 \
+                if type_ == 'link-broken' \
+                else entry.stat().st_size
+        return _node_record(
+            nodepath, type_,
+            {'total': size, 'ondisk': ondisk_size,
+             'git': 0.0, 'annex': 0.0, 'annex_worktree': 0.0},
+            entry.stat(follow_symlinks=False).st_mtime,
+            path)
+
+    def _traverse(dirpath):
+        # generator of (dirpath, record) of all subdirectories underneath
+        # dirpath (depth-first), returns the record of dirpath itself
+        children = []
+        with os.scandir(dirpath) as entries:
+            entries = list(entries)
+        for entry in entries:
+            nodepath = entry.path
+            if entry.is_dir():
+                if relpath(nodepath, path) in subdatasets:
+                    # repo.path is real, so we are doomed (for now at least)
+                    # to resolve nodepath as well to get relpath for it
+                    node_relpath = relpath(str(Path(nodepath).resolve()), repo.path)
+                    subds = _traverse_handle_subds(
+                        node_relpath,
+                        dataset,
+                        recurse_datasets=recurse_datasets,
+                        recurse_directories=True,
+                        json=json
+                    )
+                    # Enhance it with external url if available
+                    submod_url = submodules[node_relpath]["gitmodule_url"]
+                    if submod_url and is_datalad_compat_ri(submod_url):
+                        subds['url'] = submod_url
+                    children.append(subds)
+                elif not ignored(nodepath):
+                    subdir = yield from _traverse(nodepath)
+                    children.append(
+                        {k: v for k, v in subdir.items() if k != 'nodes'})
+            elif not ignored(nodepath, only_hidden=True):
+                children.append(_file_record(entry))
+
+        node = FsModel(dirpath, repo)
+        fs = _node_record(
+            node._path, node.type_, {}, node.date, path)
+        if fs['name'] == "":
+            fs['name'] = leaf_name(repo.path)
+        _add_node_metadata(fs, dirpath)
+        fs['size'] = _sum_sizes(children)
+        this = fs.copy()
+        this['name'] = '.'
+        fs['nodes'] = [this] + children
+        if dirpath != path:
+            yield dirpath, fs
+        return fs
+
+    def _render(dir_fs):
+        dirpath, fs = dir_fs
+        fs_render(fs, json=json, ds_path=path)
+        return dirpath
+
+    root = []
+
+    def _walk():
+        root.append((yield from _traverse(path)))
+
+    # printing records in parallel would interleave them randomly
+    for dirpath in parallel_map(_render, _walk(),
+                                jobs=None if json == 'display' else jobs):
+        lgr.info('Directory: %s' % dirpath)
+
+    fs = root[0]
+    if parent:
+        parent['name'] = '..'
+        fs['nodes'].insert(1, parent)
+    if render:
+        fs_render(fs, json=json, ds_path=path)
+        lgr.info('Directory: %s' % path)
+    return fs
+
+
 def ds_traverse(rootds, parent=None, json=None,
                 recurse_datasets=False, recurse_directories=False,
                 long_=False):
@@ -347,16 +498,28 @@ def ds_traverse(rootds, parent=None, json=None,
         if parent else None
 
     # (recursively) traverse file tree of current dataset
-    fs = fs_traverse(
-        rootds.path, rootds.repo,
-        subdatasets=list(rootds.subdatasets(result_xfm='relpaths')),
-        render=False,
-        parent=fsparent,
-        # XXX note that here I kinda flipped the notions!
-        recurse_datasets=recurse_datasets,
-        recurse_directories=recurse_directories,
-        json=json
-    )
+    subdatasets = list(rootds.subdatasets(result_xfm='relpaths'))
+    if recurse_directories:
+        # whole tree is needed, get it in one sweep
+        fs = fs_traverse_bulk(
+            rootds.path, rootds.repo,
+            subdatasets=subdatasets,
+            render=False,
+            parent=fsparent,
+            recurse_datasets=recurse_datasets,
+            json=json
+        )
+    else:
+        fs = fs_traverse(
+            rootds.path, rootds.repo,
+            subdatasets=subdatasets,
+            render=False,
+            parent=fsparent,
+            # XXX note that here I kinda flipped the notions!
+            recurse_datasets=recurse_datasets,
+            recurse_directories=recurse_directories,
+            json=json
+        )
 
     # BUT if we are recurse_datasets but not recurse_directories
     #     we need to handle those subdatasets then somehow since
@@ -12,15 +12,23 @@ __docformat__ = 'restructuredtext'
 
 
 import logging
+from fnmatch import fnmatch
 from functools import partial
 from itertools import dropwhile
 import json
 import os.path as op
 import re
+import shutil
 import sys
+import tempfile
 
+from datalad.cmd import (
+    StdOutErrCapture,
+    WitlessRunner,
+)
 from datalad.dochelpers import exc_str
 from datalad.interface.base import Interface
+from datalad.interface.common_opts import jobs_opt
 from datalad.interface.utils import eval_results
 from datalad.interface.base import build_doc
 from datalad.interface.results import get_status_dict
@@ -31,8 +39,18 @@ from datalad.core.local.run import _format_cmd_shorty
 from datalad.consts import PRE_INIT_COMMIT_SHA
 
 from datalad.support.constraints import EnsureNone, EnsureStr
+from datalad.support.exceptions import CommandError
+from datalad.support.gitrepo import GitRepo
 from datalad.support.param import Parameter
 from datalad.support.json_py import load_stream
+from datalad.support.parallel import (
+    get_n_jobs,
+    parallel_map,
+)
+from datalad.utils import (
+    PurePosixPath,
+    get_tempfile_kwargs,
+)
 
 from datalad.distribution.dataset import require_dataset
 from datalad.distribution.dataset import EnsureDataset
@@ -50,6 +68,22 @@ class Rerun(Interface):
     then re-execute the command in the recorded path (if it was inside
     the dataset). Afterwards, all modifications will be saved.
 
+    *Concurrent reruns*
+
+    || REFLOW >>
+    With [CMD: --jobs CMD][PY: `jobs` PY] larger than one, a sequence of run
+    commits is analyzed for dependencies between their recorded inputs and
+    outputs (including files that a command is known to have modified).
+    Commands that do not depend on each other are re-executed concurrently,
+    each in a separate, temporary Git worktree, and the resulting commits are
+    then replayed onto the current HEAD in the original order. This mode is
+    not available for revision ranges with merges or commits without a run
+    record, or for datasets with subdatasets; a sequential rerun is performed
+    in such cases. Unless [CMD: --explicit CMD][PY: `explicit` PY] is given,
+    a command without recorded inputs is conservatively assumed to depend on
+    all preceding commands.
+    << REFLOW ||
+
     *Report mode*
 
     || REFLOW >>
@@ -152,6 +186,7 @@ class Rerun(Interface):
             every one. Care should also be taken when using [CMD: --onto
             CMD][PY: `onto` PY] because checking out a new HEAD can easily fail
             when the working tree has modifications."""),
+        jobs=jobs_opt,
     )
 
     _examples_ = [
@@ -187,7 +222,8 @@ class Rerun(Interface):
             onto=None,
             script=None,
             report=False,
-            explicit=False):
+            explicit=False,
+            jobs=None):
 
         ds = require_dataset(
             dataset, check_installed=True,
@@ -234,6 +270,9 @@ class Rerun(Interface):
             handler = _get_script_handler(script, since, revision)
         elif report:
             handler = _report
+        elif get_n_jobs(jobs) > 1:
+            handler = partial(_rerun_concurrently, explicit=explicit,
+                              jobs=jobs)
         else:
             handler = partial(_rerun, explicit=explicit)
 
@@ -492,6 +531,257 @@ def _rerun(dset, results, explicit=False):
         dset.repo.checkout(branch_to_restore)
 
 
+def _run_file_sets(dset, res):
+    """Paths (or globs) a run commit reads and writes, relative to `dset`
+
+    Returns None for the inputs, if none were recorded.
+    """
+    run_info = res["run_info"]
+    pwd = run_info.get("pwd", op.curdir)
+
+    def norm(specs):
+        return [PurePosixPath(op.normpath(op.join(pwd, p))).as_posix()
+                for p in specs]
+
+    inputs = norm(run_info.get("inputs", []) +
+                  run_info.get("extra_inputs", []))
+    outputs = norm(run_info.get("outputs", []))
+    # anything the command actually modified back then
+    outputs.extend(
+        PurePosixPath(op.relpath(ap["path"], dset.path)).as_posix()
+        for ap in new_or_modified(res["diff"]))
+    return inputs or None, outputs
+
+
+def _specs_overlap(a, b):
+    """Whether two path specifications (possibly globs) might intersect
+
+    This is conservative: If in doubt, they are considered to intersect.
+    """
+    a, b = PurePosixPath(a), PurePosixPath(b)
+    # identity, globs matching each other, or containment of one in the
+    # other (leading directories of a path matched by a glob)
+    return any(fnmatch(str(x), str(y)) or fnmatch(str(y), str(x))
+               for x in [a] + list(a.parents)
+               for y in [b] + list(b.parents)
+               if x == a or y == b)
+
+
+def _get_run_levels(dset, runs, explicit=False):
+    """Assign each run commit to a level of mutually independent commits
+
+    A commit depends on any earlier commit whose outputs intersect its
+    inputs or outputs, or whose inputs intersect its outputs. Unless
+    `explicit` is set, a commit without recorded inputs depends on all
+    earlier commits. Its level is one above the highest level of all its
+    dependencies.
+
+    Returns
+    -------
+    list of int
+    """
+    file_sets = [_run_file_sets(dset, res) for res in runs]
+    levels = []
+    for i, (inputs, outputs) in enumerate(file_sets):
+        level = 0
+        for j in range(i):
+            prev_inputs, prev_outputs = file_sets[j]
+            if (inputs is None and not explicit) or any(
+                    _specs_overlap(a, b)
+                    for a, b in
+                    [(a, b) for a in prev_outputs
+                     for b in (inputs or []) + outputs] +
+                    [(a, b) for a in (prev_inputs or []) for b in outputs]):
+                level = max(level, levels[j] + 1)
+        levels.append(level)
+    return levels
+
+
+def _rerun_in_worktree(dset, res, worktree, explicit):
+    """Rerun a single commit in a worktree of `dset` in a separate process
+
+    Returns
+    -------
+    list, str or None
+      Result records of the rerun, with paths relative to `dset`, and the
+      commit created by the rerun (None if there was nothing to commit, or
+      the rerun failed).
+    """
+    before = GitRepo(worktree, create=False).get_hexsha()
+    # use the running DataLad, not whatever `datalad` is first in PATH
+    cmd = [sys.executable, "-c",
+           "from datalad.cmdline.main import main; main()",
+           "-f", "json", "rerun"]
+    if explicit:
+        cmd.append("--explicit")
+    if res["rerun_message"]:
+        cmd.extend(["--message", res["rerun_message"]])
+    cmd.append(res["commit"])
+    try:
+        out = WitlessRunner(cwd=worktree).run(cmd, protocol=StdOutErrCapture)
+        failed = False
+    except CommandError as e:
+        out = {"stdout": e.stdout, "stderr": e.stderr}
+        failed = True
+    results = []
+    for line in out["stdout"].splitlines():
+        if not line.startswith("{"):
+            continue
+        r = json.loads(line)
+        for k in ("path", "refds", "parentds"):
+            if r.get(k) and r[k].startswith(worktree):
+                r[k] = dset.path + r[k][len(worktree):]
+        results.append(r)
+    if failed and not any(r.get("status") in ("error", "impossible")
+                          for r in results):
+        results.append(get_status_dict(
+            "run", ds=dset, status="error", commit=res["commit"],
+            message=("rerun failed: %s", out["stderr"].strip())))
+    after = GitRepo(worktree, create=False).get_hexsha()
+    return results, None if failed or after == before else after
+
+
+def _rerun_concurrently(dset, results, explicit=False, jobs=None):
+    """Like `_rerun()`, but independent run commits are executed concurrently
+    """
+    results = list(results)
+    actions = set(res.get("rerun_action") for res in results)
+    runs = [res for res in results if res.get("rerun_action") == "run"]
+    if actions - {"run", "checkout"}:
+        reason = "not all commits have a run record"
+    elif len(runs) < 2:
+        reason = "nothing to parallelize"
+    elif any(True for _ in dset.repo.get_submodules_()):
+        reason = "dataset has subdatasets"
+    else:
+        reason = None
+    if reason:
+        lgr.info("Cannot rerun concurrently (%s), rerunning sequentially",
+                 reason)
+        for r in _rerun(dset, results, explicit=explicit):
+            yield r
+        return
+
+    for res in results:
+        if res.get("rerun_action") == "checkout":
+            if res.get("branch"):
+                checkout_options = ["-b", res["branch"]]
+            else:
+                checkout_options = ["--detach"]
+            dset.repo.checkout(res["commit"], options=checkout_options)
+
+    for res in runs:
+        # needed more than once
+        res["diff"] = list(res["diff"])
+    levels = _get_run_levels(dset, runs, explicit=explicit)
+    lgr.info("Rerunning %d commands in %d rounds of concurrent execution",
+             len(runs), max(levels) + 1)
+
+    # worktrees share the object store, hence no need to transfer commits
+    tmpdir = tempfile.mkdtemp(**get_tempfile_kwargs(prefix="rerun"))
+    worktrees = []
+
+    def add_worktree(name, start):
+        path = op.join(tmpdir, name)
+        dset.repo.call_git(["worktree", "add", "--detach", path, start])
+        worktrees.append(path)
+        return path
+
+    def remove_worktrees():
+        while worktrees:
+            wt = worktrees.pop()
+            try:
+                dset.repo.call_git(["worktree", "remove", "--force", wt])
+            except CommandError as e:
+                lgr.debug("Failed to remove worktree %s: %s", wt, exc_str(e))
+
+    # commit created by the rerun of each run commit, None if no changes
+    new_commits = {}
+    integration_path = op.join(tmpdir, "integration")
+    try:
+        # concurrently executed commits get integrated here, to serve as the
+        # base for the next round
+        dset.repo.call_git(["worktree", "add", "--detach", integration_path,
+                            dset.repo.get_hexsha()])
+        integration = GitRepo(integration_path, create=False)
+        for level in range(max(levels) + 1):
+            base = integration.get_hexsha()
+            tasks = [(i, add_worktree(str(i), base))
+                     for i, l in enumerate(levels) if l == level]
+            done = parallel_map(
+                lambda task: _rerun_in_worktree(
+                    dset, runs[task[0]], task[1], explicit),
+                tasks,
+                jobs=jobs)
+            failed = False
+            for (i, _), (res_records, commit) in zip(tasks, done):
+                for r in res_records:
+                    yield r
+                if commit is None and any(
+                        r.get("status") in ("error", "impossible")
+                        for r in res_records):
+                    failed = True
+                    continue
+                if commit:
+                    error = _cherry_pick_or_abort(integration, commit)
+                    if error:
+                        yield get_status_dict(
+                            "run", ds=dset, status="error",
+                            commit=runs[i]["commit"],
+                            message=("failed to integrate the rerun of %s: "
+                                     "%s", runs[i]["commit"], error))
+                        failed = True
+                        continue
+                new_commits[i] = commit
+            remove_worktrees()
+            if failed:
+                break
+    finally:
+        worktrees.append(integration_path)
+        remove_worktrees()
+        dset.repo.call_git(["worktree", "prune"])
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    # replay in the original order, but not beyond the first commit that
+    # could not be rerun
+    for i, res in enumerate(runs):
+        if i not in new_commits:
+            yield get_status_dict(
+                "run", ds=dset, status="error", commit=res["commit"],
+                message=("rerun of %s failed, commands from this and "
+                         "subsequent commits were not replayed",
+                         res["commit"]))
+            break
+        if new_commits[i]:
+            error = _cherry_pick_or_abort(dset.repo, new_commits[i])
+            if error:
+                yield get_status_dict(
+                    "run", ds=dset, status="error", commit=res["commit"],
+                    message=("failed to replay the rerun of %s (%s), "
+                             "commands from this and subsequent commits "
+                             "were not replayed: %s",
+                             res["commit"], new_commits[i], error))
+                break
+
+
+def _cherry_pick_or_abort(repo, commit):
+    """Cherry pick `commit`, and abort on failure (e.g., a conflict)
+
+    Returns
+    -------
+    str or None
+      Error message, if the cherry pick failed.
+    """
+    try:
+        repo.cherry_pick(commit)
+    except CommandError as e:
+        try:
+            repo.call_git(["cherry-pick", "--abort"])
+        except CommandError as abort_e:
+            lgr.debug("Failed to abort cherry-pick: %s", exc_str(abort_e))
+        return exc_str(e)
+
+
 def _report(dset, results):
     for res in results:
         if "run_info" in res:
@@ -40,6 +40,7 @@ from datalad.tests.utils import (
     known_failure_windows,
     ok_,
     ok_archives_caches,
+    ok_file_has_content,
     ok_file_under_git,
     serve_path_via_http,
     slow,
@@ -354,6 +355,25 @@ def test_add_archive_content_zip(repo_path):
         ok_archives_caches(repo.path, 0)
 
 
+@known_failure_windows
+@with_tree(tree={"1.tar": {"1.dat": "new", "1-1.dat": "other"},
+                 "1.dat": "old"})
+def test_add_archive_content_pipeline_suffix_collision(repo_path):
+    repo = AnnexRepo(repo_path, create=True)
+    repo.add(["1.tar", "1.dat"])
+    repo.commit("add")
+    # the renamed 1.dat must not replace the extracted 1-1.dat, although
+    # that one is not yet moved into the tree
+    add_archive_content("1.tar", annex=repo, existing="archive-suffix",
+                        pipeline=True)
+    contents = {}
+    for f in glob(opj(repo_path, "1*.dat")):
+        with open(f) as fp:
+            contents[fp.read()] = f
+    eq_(sorted(contents), ["new", "old", "other"])
+    ok_file_has_content(opj(repo_path, "1.dat"), "old")
+
+
 @known_failure_windows
 @with_tree(tree={"ds": {"1.tar.gz": {"foo": "abc"}},
                  "notds": {"2.tar.gz": {"bar": "def"}}})
@@ -536,6 +556,22 @@ class TestAddArchiveOptions():
             # there should be no .datalad temporary files hanging around
             self.assert_no_trash_left_behind()
 
+    @known_failure_windows
+    def test_add_pipeline(self):
+        key1 = 'SHA256E-s5--16d3ad1974655987dd7801d70659990b89bfe7e931a0a358964e64e901761cc0.dat'
+        add_archive_content('1.tar', annex=self.annex, strip_leading_dirs=True,
+                            pipeline=True, jobs=2)
+        ok_file_under_git(self.annex.path, '1.dat', annexed=True)
+        ok_file_under_git(self.annex.path, 'file.txt', annexed=True)
+        w = self.annex.whereis(key1, key=True, output='full')
+        assert_equal(len(w), 2)  # in archive, and locally
+        ok_archives_caches(self.annex.path, 0)
+
+        # file is retrievable via the registered archive URL
+        self.annex.drop('1.dat')
+        self.annex.get('1.dat')
+        ok_file_has_content(opj(self.annex.path, '1.dat'), 'load2')
+
     def assert_no_trash_left_behind(self):
         assert_equal(
             list(find_files('\.datalad..*', self.annex.path, dirs=True)),
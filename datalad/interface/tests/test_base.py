@@ -180,3 +180,25 @@ def test_status_custom_summary_no_repeats(path):
         ["datalad", "--output-format=tailored", "status", "--annex"])
     out_lines = out.splitlines()
     eq_(len(out_lines), len(set(out_lines)))
+
+
+@with_tempfile(mkdir=True)
+def test_interface_summaries_cache(path):
+    from datalad.interface.base import (
+        get_interface_groups,
+        get_interface_summaries,
+    )
+    groups = get_interface_groups()
+    with patch_config({'datalad.locations.cache': path}):
+        summaries = get_interface_summaries(groups)
+        ok_exists(op.join(path, 'commands.json'))
+        eq_(summaries['datalad.core.local.status:Status'][0],
+            'Report on the state of dataset content.')
+        # second time around, no interface is loaded
+        with mock.patch('datalad.interface.base.load_interface') as load:
+            eq_(get_interface_summaries(groups), summaries)
+            load.assert_not_called()
+        # but an outdated cache is ignored
+        with mock.patch('datalad.interface.base._get_command_cache_key',
+                        lambda: ['other']):
+            eq_(get_interface_summaries(groups), summaries)
@@ -30,6 +30,8 @@ from datalad.interface.ls_webui import (
     machinesize,
     ignored,
     fs_traverse,
+    fs_traverse_bulk,
+    metadata_locator,
     _ls_json,
     UNKNOWN_SIZE,
 )
@@ -149,6 +151,51 @@ def test_fs_traverse(topdir):
             assert_equal(brokenlink['size']['total'], '3 Bytes')
 
 
+@known_failure_windows
+@with_tree(
+    tree={'dir': {'.fgit': {'ab.txt': '123'},
+                  'subdir': {'file1.txt': '124', 'file2.txt': '123'},
+                  'subgit': {'fgit.txt': '123'}},
+          'topfile.txt': '123',
+          'gitfile.txt': '12345',
+          'index.html': '<html/>',
+          '.hidden': {'.hidden_file': '123'}})
+def test_fs_traverse_bulk(topdir):
+    annex = AnnexRepo(topdir)
+    GitRepo(opj(topdir, 'dir', 'subgit'), create=True)
+    annex.add([opj(topdir, 'dir', 'subdir'), 'topfile.txt'])
+    annex.add('gitfile.txt', git=True)
+    annex.commit()
+    annex.drop(opj(topdir, 'dir', 'subdir', 'file2.txt'), options=['--force'])
+
+    def get_meta(path):
+        with open(metadata_locator(path=path, ds_path=topdir)) as f:
+            return js.load(f)
+
+    fs = fs_traverse(topdir, annex, recurse_directories=True, json='file')
+    subdir_meta = get_meta(opj('dir', 'subdir'))
+    dir_meta = get_meta('dir')
+    fs_traverse(topdir, annex, recurse_directories=True, json='delete')
+    assert_false(exists(metadata_locator(path='dir', ds_path=topdir)))
+
+    # bulk traversal yields identical records and metadata files
+    fs_bulk = fs_traverse_bulk(topdir, annex, json='file', jobs=2)
+    assert_equal(fs_bulk, fs)
+    assert_equal(get_meta(opj('dir', 'subdir')), subdir_meta)
+    assert_equal(get_meta('dir'), dir_meta)
+    nodes = {n['name']: n for n in get_meta(opj('dir', 'subdir'))['nodes']}
+    assert_equal(nodes['file2.txt']['type'], 'link-broken')
+    assert_equal(nodes['file2.txt']['size']['ondisk'], '0 Bytes')
+    assert_equal(nodes['file2.txt']['size']['total'], '3 Bytes')
+    nodes = {n['name']: n for n in fs_bulk['nodes']}
+    assert_equal(nodes['gitfile.txt']['size']['total'], '5 Bytes')
+    for ignored_node in ('index.html', '.hidden'):
+        assert_not_in(ignored_node, nodes)
+    nodes = {n['name']: n for n in dir_meta['nodes']}
+    for ignored_node in ('.fgit', 'subgit'):
+        assert_not_in(ignored_node, nodes)
+
+
 # underlying code cannot deal with adjusted branches
 # https://github.com/datalad/datalad/pull/3817
 @slow  # 9sec on Yarik's laptop
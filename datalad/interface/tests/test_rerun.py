@@ -29,6 +29,7 @@ from datalad.utils import (
 
 from datalad.distribution.dataset import Dataset
 from datalad.support.gitrepo import GitRepo
+from datalad.support.parallel import SUBPROCESSES_IN_THREADS
 from datalad.support.exceptions import (
     CommandError,
     IncompleteResultsError,
@@ -44,6 +45,7 @@ from datalad.interface.rerun import (
     get_run_info,
     diff_revision,
     new_or_modified,
+    _get_run_levels,
 )
 from datalad.tests.utils import (
     assert_raises,
@@ -71,6 +73,7 @@ from datalad.tests.utils import (
     known_failure_windows,
     known_failure_githubci_win,
     slow,
+    SkipTest,
 )
 
 
@@ -811,6 +814,90 @@ def test_rerun_explicit(path):
         ds.rerun(onto="", since="", explicit=True)
 
 
+def test_get_run_levels():
+    def rec(inputs, outputs, pwd="."):
+        return {"run_info": {"inputs": inputs, "outputs": outputs,
+                             "pwd": pwd},
+                "diff": []}
+
+    runs = [
+        rec(["raw/sub-01"], ["out/sub-01"]),
+        rec(["raw/sub-02"], ["out/sub-02"]),
+        # glob over outputs of both above
+        rec(["out/sub-*"], ["group.csv"]),
+        # directory containing an output of the first
+        rec(["out"], ["out.zip"]),
+        # output recorded relative to a subdirectory, must not modify what
+        # the two above read
+        rec(["../raw/sub-03"], ["sub-03"], pwd="out"),
+        # no inputs recorded
+        rec([], ["log"]),
+        # overwrites an input of an earlier command
+        rec(["other"], ["raw/sub-02"]),
+    ]
+    ds = Dataset("/nonexistent")
+    eq_(_get_run_levels(ds, runs), [0, 0, 1, 1, 2, 3, 1])
+    eq_(_get_run_levels(ds, runs, explicit=True), [0, 0, 1, 1, 2, 0, 1])
+
+
+@known_failure_windows
+@with_tempfile(mkdir=True)
+def test_rerun_concurrently(path):
+    ds = Dataset(path).create(annex=False)
+    for s in "abc":
+        ds.run("echo {0} >> {0}".format(s), outputs=[s])
+    ds.run("cat a b > ab", inputs=["a", "b"], outputs=["ab"])
+    ds.run("echo d >> c", outputs=["c"])
+    orig_head = ds.repo.get_hexsha()
+    orig_msgs = [ds.repo.format_commit("%s", "HEAD~{}".format(i))
+                 for i in reversed(range(5))]
+
+    res = ds.rerun(since="", jobs=3, explicit=True)
+    assert_not_in("error", [r["status"] for r in res])
+    assert_repo_status(ds.path)
+    # no worktree left behind
+    eq_(len(ds.repo.call_git(["worktree", "list"]).splitlines()), 1)
+    # commits got replayed in the original order
+    eq_(orig_head, ds.repo.get_hexsha("HEAD~5"))
+    eq_([ds.repo.format_commit("%s", "HEAD~{}".format(i))
+         for i in reversed(range(5))],
+        orig_msgs)
+    concurrent_tree = ds.repo.call_git_oneline(["rev-parse", "HEAD^{tree}"])
+    for f, content in (("a", "a\na\n"), ("ab", "a\na\nb\nb\n"),
+                       ("c", "c\nd\nc\nd\n")):
+        ok_file_has_content(op.join(ds.path, f), content)
+
+    # same result as a sequential rerun
+    ds.repo.checkout(orig_head, options=["-b", "sequential"])
+    ds.rerun(since="", explicit=True)
+    eq_(concurrent_tree, ds.repo.call_git_oneline(["rev-parse", "HEAD^{tree}"]))
+
+
+@known_failure_windows
+@with_tempfile(mkdir=True)
+def test_rerun_concurrently_conflict(path):
+    if not SUBPROCESSES_IN_THREADS:
+        raise SkipTest("No concurrent rerun with this Python version")
+    ds = Dataset(op.join(path, "ds")).create(annex=False)
+    trigger = op.join(path, "trigger")
+    create_tree(ds.path, {"in_a": "", "in_b": ""})
+    ds.save()
+    # both commands write to the same file, but only once the trigger exists
+    for s in "ab":
+        ds.run("echo {0} > {0}; if [ -e '{1}' ]; then echo {0} > shared; fi"
+               .format(s, trigger),
+               inputs=["in_" + s], outputs=[s])
+    orig_head = ds.repo.get_hexsha()
+    create_tree(path, {"trigger": ""})
+
+    res = ds.rerun(since="HEAD~2", jobs=2, on_failure="ignore")
+    assert_in_results(res, action="run", status="error")
+    # no cherry-pick left in progress, and only the first rerun replayed
+    assert_repo_status(ds.path)
+    eq_(orig_head, ds.repo.get_hexsha("HEAD~1"))
+    eq_(len(ds.repo.call_git(["worktree", "list"]).splitlines()), 1)
+
+
 # underlying code cannot deal with adjusted branches
 # https://github.com/datalad/datalad/pull/3817
 @known_failure_windows
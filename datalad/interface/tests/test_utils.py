@@ -16,6 +16,8 @@ from os.path import (
     exists,
     join as opj,
 )
+from unittest.mock import patch
+
 from datalad.tests.utils import (
     assert_dict_equal,
     assert_equal,
@@ -460,3 +462,30 @@ def test_utils_suppress_similar():
         assert_in("path10", cmo.out)
         assert_not_in("path20", cmo.out)
         assert_re_in("[^-0-9]1 .* suppressed", cmo.out, match=False)
+
+
+def test_custom_result_summary():
+    tu = TestUtils()
+    summaries = []
+
+    def aggregate(res, summary):
+        return (summary or 0) + res['somekey']
+
+    with patch.object(TestUtils, 'custom_result_summary_renderer',
+                      summaries.append, create=True):
+        # without an aggregate, all results are passed on, once
+        tu(4)
+        assert_equal([len(s) for s in summaries], [4])
+        del summaries[:]
+        # no summary of transformed results
+        tu(4, result_xfm='paths')
+        assert_equal(summaries, [])
+
+        with patch.object(TestUtils, 'custom_result_summary_aggregate',
+                          aggregate, create=True):
+            for return_type in ('list', 'generator'):
+                list(tu(4, return_type=return_type))
+            # only the aggregate of the filtered results is passed on
+            tu(4, result_filter=lambda x: x['somekey'] > 1)
+            tu(0)
+            assert_equal(summaries, [6, 6, 5, None])
@@ -299,6 +299,15 @@ def eval_results(func):
     'tailored' custom output formatting provided by each command
     class (if any).
 
+    A command class can also provide a summary of all results via a
+    `custom_result_summary_renderer(results)` method, which receives the list
+    of all (untransformed) results. To avoid keeping all results around for
+    this purpose, a class can additionally provide a
+    `custom_result_summary_aggregate(res, summary)` method that folds a single
+    result into a summary (`None` for the first result) and returns it. In this
+    case, the summary renderer receives this aggregate (`None` if there were no
+    results) instead of a list.
+
     Error detection works by inspecting the `status` item of all result
     dictionaries. Any occurrence of a status other than 'ok' or 'notneeded'
     will cause an IncompleteResultsError exception to be raised that carries
@@ -369,6 +378,15 @@ def eval_results(func):
         # look for hooks
         hooks = get_jsonhooks_from_config(ds.config if ds else dlcfg)
 
+        # a custom summary is rendered from the results before any
+        # transformation, only
+        do_custom_result_summary = not result_xfm \
+            and result_renderer in ('tailored', 'default') \
+            and hasattr(wrapped_class, 'custom_result_summary_renderer')
+        summary_aggregate = getattr(
+            wrapped_class, 'custom_result_summary_aggregate', None) \
+            if do_custom_result_summary else None
+
         # this internal helper function actually drives the command
         # generator-style, it may generate an exception if desired,
         # on incomplete results
@@ -379,10 +397,8 @@ def eval_results(func):
             action_summary = {}
 
             # if a custom summary is to be provided, collect the results
-            # of the command execution
-            results = []
-            do_custom_result_summary = result_renderer in ('tailored', 'default') \
-                and hasattr(wrapped_class, 'custom_result_summary_renderer')
+            # of the command execution, or aggregate them on the fly
+            results = None if summary_aggregate else []
 
             # process main results
             for r in _process_results(
@@ -414,15 +430,25 @@ def eval_results(func):
                             # apply same logic as for main results, otherwise
                             # any filters would only tackle the primary results
                             # and a mixture of return values could happen
-                            if not keep_result(hr, result_filter, **allkwargs):
+                            if result_filter and not keep_result(
+                                    hr, result_filter, **allkwargs):
                                 continue
-                            hr = xfm_result(hr, result_xfm)
+                            if result_xfm:
+                                hr = result_xfm(hr)
                             # rationale for conditional is a few lines down
                             if hr:
                                 yield hr
-                if not keep_result(r, result_filter, **allkwargs):
+                if result_filter and not keep_result(
+                        r, result_filter, **allkwargs):
                     continue
-                r = xfm_result(r, result_xfm)
+                if result_xfm:
+                    r = result_xfm(r)
+                # collect if summary is desired, never with transformed
+                # results
+                elif summary_aggregate:
+                    results = summary_aggregate(r, results)
+                elif do_custom_result_summary:
+                    results.append(r)
                 # in case the result_xfm decided to not give us anything
                 # exclude it from the results. There is no particular reason
                 # to do so other than that it was established behavior when
@@ -431,10 +457,6 @@ def eval_results(func):
                 if r:
                     yield r
 
-                # collect if summary is desired
-                if do_custom_result_summary:
-                    results.append(r)
-
             # result summary before a potential exception
             # custom first
             if do_custom_result_summary:
@@ -465,13 +487,8 @@ def eval_results(func):
                 results = wrapped_(*args_, **kwargs_)
                 if inspect.isgenerator(results):
                     # unwind generator if there is one, this actually runs
-                    # any processing
+                    # any processing, including the rendering of summaries
                     results = list(results)
-                # render summaries
-                if not result_xfm and result_renderer in ('tailored', 'default'):
-                    # cannot render transformed results
-                    if hasattr(wrapped_class, 'custom_result_summary_renderer'):
-                        wrapped_class.custom_result_summary_renderer(results)
                 if return_type == 'item-or-list' and \
                         len(results) < 2:
                     return results[0] if results else None
@@ -11,9 +11,12 @@
 __docformat__ = 'restructuredtext'
 
 
+import json
 import logging
 import re
 import os
+import time
+from pathlib import PurePosixPath
 
 from datalad.interface.base import Interface
 from datalad.interface.utils import eval_results
@@ -53,8 +56,109 @@ lgr = logging.getLogger('datalad.local.subdatasets')
 valid_key = re.compile(r'^[A-Za-z][-A-Za-z0-9]*$')
 
 
-def _parse_git_submodules(ds_pathobj, repo, paths):
+class _HierarchyIndex(object):
+    """Persistent index of the submodules of all datasets in a hierarchy
+
+    The index is stored under .git/datalad/ of the dataset a query is run
+    on, and holds the submodule records reported by
+    `GitRepo.get_submodules_()` for each dataset visited by the query. A
+    record is only used as long as the `.gitmodules` file and the Git index
+    of its dataset remain unchanged (inode, size, and modification time),
+    hence no Git call is needed, and no repository instance is created for a
+    dataset with an up-to-date record.
+    """
+    version = 1
+    # files modified more recently are not trusted to have a unique
+    # modification time, and their records are not stored
+    racy_seconds = 2
+
+    def __init__(self, ds):
+        self.fname = ds.repo.dot_git / 'datalad' / 'subdatasets.json'
+        self.root = ds.pathobj
+        self._records = None
+        self._modified = False
+
+    def _load(self):
+        self._records = {}
+        try:
+            with self.fname.open() as f:
+                index = json.load(f)
+            if index.get('version') == self.version:
+                self._records = index['datasets']
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            lgr.debug("Ignoring unusable subdataset index %s: %s",
+                      self.fname, exc_str(e))
+
+    def _get_signature(self, ds_pathobj):
+        sig = []
+        racy = False
+        for fpath in (ds_pathobj / '.gitmodules',
+                      GitRepo._get_dot_git(ds_pathobj) / 'index'):
+            try:
+                st = fpath.stat()
+            except OSError:
+                sig.append(None)
+                continue
+            sig.append([st.st_ino, st.st_size, st.st_mtime_ns])
+            racy |= st.st_mtime > time.time() - self.racy_seconds
+        return sig, racy
+
+    def get_submodules(self, ds):
+        """Return the records of all submodules of a dataset
+
+        Returns
+        -------
+        list of dict
+          Properties as reported by `GitRepo.get_submodules_()`, with each
+          'path' relative to the dataset.
+        """
+        if self._records is None:
+            self._load()
+        key = ds.pathobj.relative_to(self.root).as_posix()
+        sig, racy = self._get_signature(ds.pathobj)
+        record = self._records.get(key)
+        if record is None or record['signature'] != sig:
+            repo = ds.repo
+            record = dict(
+                signature=sig,
+                submodules=[
+                    dict(props,
+                         path=props['path'].relative_to(
+                             repo.pathobj).as_posix())
+                    for props in repo.get_submodules_()
+                ],
+            )
+            if racy:
+                self._records.pop(key, None)
+            else:
+                self._records[key] = record
+            self._modified = True
+        return [dict(props, path=PurePosixPath(props['path']))
+                for props in record['submodules']]
+
+    def save(self):
+        """Write the index, if any record was added or updated"""
+        if not self._modified:
+            return
+        tmp = self.fname.with_name(
+            '{}.{}.tmp'.format(self.fname.name, os.getpid()))
+        try:
+            self.fname.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open('w') as f:
+                json.dump(
+                    dict(version=self.version, datasets=self._records), f)
+            os.replace(str(tmp), str(self.fname))
+            self._modified = False
+        except OSError as e:
+            lgr.debug("Failed to write subdataset index %s: %s",
+                      self.fname, exc_str(e))
+
+
+def _parse_git_submodules(ds, paths, index=None):
     """All known ones with some properties"""
+    ds_pathobj = ds.pathobj
     if not (ds_pathobj / ".gitmodules").exists():
         # easy way out. if there is no .gitmodules file
         # we cannot have (functional) subdatasets
@@ -65,7 +169,10 @@ def _parse_git_submodules(ds_pathobj, repo, paths):
             paths,
             lambda p: ds_pathobj == p or ds_pathobj in p.parents)
         paths = [p.relative_to(ds_pathobj) for p in paths_at_or_in]
-        if not paths:
+        if any(not p.parts for p in paths):
+            # the dataset itself is among the paths, no constraint
+            paths = None
+        elif not paths:
             if any(p for p in paths_outside if p in ds_pathobj.parents):
                 # The dataset is directly under some specified path, so include
                 # it.
@@ -73,14 +180,18 @@ def _parse_git_submodules(ds_pathobj, repo, paths):
             else:
                 # we had path contraints, but none matched this dataset
                 return
-    for props in repo.get_submodules_(paths=paths):
-        path = props["path"]
+    if index is not None and not paths:
+        submodules = index.get_submodules(ds)
+    else:
+        repo = ds.repo
+        submodules = (
+            dict(props, path=props['path'].relative_to(repo.pathobj))
+            for props in repo.get_submodules_(paths=paths))
+    for props in submodules:
         if props.get('type', None) != 'dataset':
             continue
-        if ds_pathobj != repo.pathobj:
-            props['path'] = ds_pathobj / path.relative_to(repo.pathobj)
-        else:
-            props['path'] = path
+        path = ds_pathobj / props['path']
+        props['path'] = path
         if not path.exists() or not GitRepo.is_valid_repo(str(path)):
             props['state'] = 'absent'
         # TODO kill this after some time. We used to do custom things here
@@ -129,6 +240,13 @@ class Subdatasets(Interface):
     more flexible, but also notably slower (performs one call to Git per
     dataset versus a single call for all combined).
 
+    With the configuration setting 'datalad.subdatasets.hierarchy-index'
+    enabled, the subdatasets of each dataset are recorded in an index under
+    .git/datalad/ of the queried dataset. Queries without path constraints
+    (e.g. recursive or `contains` queries) use the record of any dataset
+    whose .gitmodules file and Git index did not change since, instead of
+    calling Git.
+
     The following properties for subdatasets are recognized by DataLad
     (without the 'gitmodule\_' prefix that is used in the query results):
 
@@ -244,20 +362,28 @@ class Subdatasets(Interface):
         if contains:
             contains = [resolve_path(c, dataset) for c in assure_list(contains)]
         contains_hits = set()
-        for r in _get_submodules(
-                ds, paths, fulfilled, recursive, recursion_limit,
-                contains, bottomup, set_property, delete_property,
-                refds_path):
-            # a boat-load of ancient code consumes this and is ignorant of
-            # Path objects
-            r['path'] = str(r['path'])
-            # without the refds_path cannot be rendered/converted relative
-            # in the eval_results decorator
-            r['refds'] = refds_path
-            if 'contains' in r:
-                contains_hits.update(r['contains'])
-                r['contains'] = [str(c) for c in r['contains']]
-            yield r
+        index = _HierarchyIndex(ds) \
+            if GitRepo.is_valid_repo(ds.path) \
+            and ds.config.obtain('datalad.subdatasets.hierarchy-index') \
+            else None
+        try:
+            for r in _get_submodules(
+                    ds, paths, fulfilled, recursive, recursion_limit,
+                    contains, bottomup, set_property, delete_property,
+                    refds_path, index=index):
+                # a boat-load of ancient code consumes this and is ignorant
+                # of Path objects
+                r['path'] = str(r['path'])
+                # without the refds_path cannot be rendered/converted
+                # relative in the eval_results decorator
+                r['refds'] = refds_path
+                if 'contains' in r:
+                    contains_hits.update(r['contains'])
+                    r['contains'] = [str(c) for c in r['contains']]
+                yield r
+        finally:
+            if index is not None:
+                index.save()
         if contains:
             for c in set(contains).difference(contains_hits):
                 yield get_status_dict(
@@ -279,13 +405,12 @@ class Subdatasets(Interface):
 # the main command interface with all its decorators again
 def _get_submodules(ds, paths, fulfilled, recursive, recursion_limit,
                     contains, bottomup, set_property, delete_property,
-                    refds_path):
+                    refds_path, index=None):
     dspath = ds.path
-    repo = ds.repo
     if not GitRepo.is_valid_repo(dspath):
         return
     # put in giant for-loop to be able to yield results before completion
-    for sm in _parse_git_submodules(ds.pathobj, repo, paths):
+    for sm in _parse_git_submodules(ds, paths, index=index):
         contains_hits = []
         if contains:
             contains_hits = [
@@ -304,7 +429,7 @@ def _get_submodules(ds, paths, fulfilled, recursive, recursion_limit,
             # first deletions
             for dprop in assure_list(delete_property):
                 try:
-                    repo.call_git(
+                    ds.repo.call_git(
                         ['config', '--file', '.gitmodules',
                          '--unset-all',
                          'submodule.{}.{}'.format(sm['gitmodule_name'], dprop),
@@ -336,7 +461,7 @@ def _get_submodules(ds, paths, fulfilled, recursive, recursion_limit,
                                 sm['path'].relative_to(refds_path)
                             ).replace(os.sep, '-')))
                 try:
-                    repo.call_git(
+                    ds.repo.call_git(
                         ['config', '--file', '.gitmodules',
                          '--replace-all',
                          'submodule.{}.{}'.format(sm['gitmodule_name'], prop),
@@ -401,7 +526,8 @@ def _get_submodules(ds, paths, fulfilled, recursive, recursion_limit,
                     bottomup,
                     set_property,
                     delete_property,
-                    refds_path):
+                    refds_path,
+                    index=index):
                 yield r
         if to_report and (bottomup and \
                 (fulfilled is None or
@@ -35,6 +35,7 @@ from datalad.tests.utils import (
     assert_result_count,
     assert_status,
     eq_,
+    ok_,
     slow,
     with_tempfile,
 )
@@ -327,3 +328,49 @@ def test_parent_on_unborn_branch(path):
     ds.repo.add_submodule(path="sub")
     eq_(ds.subdatasets(result_xfm='relpaths'),
         ["sub"])
+
+
+@with_tempfile
+def test_hierarchy_index(path):
+    from unittest.mock import patch
+    from datalad.support.gitrepo import GitRepo
+
+    ds = create(path, annex=False)
+    ds.create('sub1', annex=False)
+    ds.create(opj('sub1', 'sub2'), annex=False)
+    ds.save(recursive=True)
+    ds.create('sub3', annex=False)
+    ds.config.set('datalad.subdatasets.hierarchy-index', 'true',
+                  where='local')
+    expected = ds.subdatasets(recursive=True)
+
+    def age():
+        # records of freshly modified datasets are not stored
+        for p in (ds.pathobj, ds.pathobj / 'sub1'):
+            for f in (p / '.gitmodules', GitRepo._get_dot_git(p) / 'index'):
+                st = f.stat()
+                os.utime(str(f), (st.st_atime - 10, st.st_mtime - 10))
+
+    age()
+    with patch.object(GitRepo, 'get_submodules_',
+                      side_effect=GitRepo.get_submodules_,
+                      autospec=True) as get_submodules:
+        eq_(ds.subdatasets(recursive=True), expected)
+        eq_(get_submodules.call_count, 2)
+        ok_((ds.repo.dot_git / 'datalad' / 'subdatasets.json').exists())
+        # answered from the index
+        get_submodules.reset_mock()
+        eq_(ds.subdatasets(recursive=True), expected)
+        eq_(ds.subdatasets(contains=opj(path, 'sub1', 'sub2', 'file'),
+                           recursive=True, result_xfm='relpaths'),
+            ['sub1', _p('sub1/sub2')])
+        eq_(Dataset(opj(path, 'sub1')).get_superdataset(), ds)
+        eq_(get_submodules.call_count, 0)
+        # modified datasets are queried again (the new subdataset is also
+        # saved in the top-level dataset)
+        ds.create(opj('sub1', 'sub4'), annex=False)
+        get_submodules.reset_mock()
+        eq_(ds.subdatasets(recursive=True, result_xfm='relpaths'),
+            ['sub1', _p('sub1/sub2'), _p('sub1/sub4'), 'sub3'])
+        eq_([c[0][0].pathobj for c in get_submodules.call_args_list],
+            [ds.pathobj, ds.pathobj / 'sub1'])
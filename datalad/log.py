@@ -13,6 +13,7 @@ import os
 import sys
 import platform
 import logging.handlers
+from time import time
 
 from os.path import basename, dirname
 
@@ -192,12 +193,24 @@ class ColorFormatter(logging.Formatter):
         return logging.Formatter.format(self, record)
 
 
+# maximum number of times per second a progress bar is updated
+PROGRESS_UPDATE_RATE = 10
+
+# progress handlers that are in use (by the name of the logger they are
+# attached to), see log_progress()
+_progress_handlers = {}
+
+
 class ProgressHandler(logging.Handler):
     from datalad.ui import ui
 
     def __init__(self):
         super(self.__class__, self).__init__()
         self.pbars = {}
+        # progress updates not yet passed on to the progress bar, per pid
+        self.pending = {}
+        # time of the last update of a progress bar, per pid
+        self.last_update = {}
 
     def emit(self, record):
         from datalad.ui import ui
@@ -232,17 +245,76 @@ class ProgressHandler(logging.Handler):
             # TODO if the other logging that is happening is less frontpage
             # we may want to actually "print" the completion message
             self.pbars.pop(pid).finish()
+            self.last_update.pop(pid, None)
         else:
-            # Check for an updated label.
-            label = getattr(record, 'dlm_progress_label', None)
-            if label is not None:
-                self.pbars[pid].set_desc(label)
-            # an update
-            self.pbars[pid].update(
+            self._update(
+                pid,
                 update,
                 increment=getattr(record, 'dlm_progress_increment', False),
+                label=getattr(record, 'dlm_progress_label', None),
                 total=getattr(record, 'dlm_progress_total', None))
 
+    def _update(self, pid, update, increment=False, label=None, total=None):
+        # Check for an updated label.
+        if label is not None:
+            self.pbars[pid].set_desc(label)
+        # an update
+        self.pbars[pid].update(update, increment=increment, total=total)
+        self.last_update[pid] = time()
+
+    def _flush(self, pid):
+        """Pass any pending update on to the progress bar"""
+        pending = self.pending.pop(pid, None)
+        if pending and pid in self.pbars:
+            self._update(pid, **pending)
+
+    def coalesce(self, pid, kwargs):
+        """Take care of a progress update without a log record
+
+        Updates of an existing progress bar are accumulated, and passed on to
+        the progress bar at most `PROGRESS_UPDATE_RATE` times per second.
+        Any other progress report first flushes pending updates.
+
+        Parameters
+        ----------
+        pid : str
+        kwargs : dict
+          Keyword arguments of log_progress().
+
+        Returns
+        -------
+        bool
+          Whether the progress report was taken care of. If not, it needs to
+          be logged.
+        """
+        update = kwargs.get('update')
+        with self.lock:
+            if kwargs.get('maint'):
+                for p in list(self.pending):
+                    self._flush(p)
+                return False
+            if pid not in self.pbars or update is None:
+                # start or end of a progress bar
+                self._flush(pid)
+                return False
+            increment = kwargs.get('increment', False)
+            pending = self.pending.get(pid)
+            if pending is None:
+                pending = self.pending[pid] = dict(
+                    update=update, increment=increment)
+            elif increment:
+                # increments add up, also on top of an absolute update
+                pending['update'] += update
+            else:
+                pending.update(update=update, increment=False)
+            for k in ('label', 'total'):
+                if kwargs.get(k) is not None:
+                    pending[k] = kwargs[k]
+            if time() - self.last_update.get(pid, 0) \
+                    >= 1. / PROGRESS_UPDATE_RATE:
+                self._flush(pid)
+            return True
+
 
 class NoProgressLog(logging.Filter):
     def filter(self, record):
@@ -299,6 +371,11 @@ def log_progress(lgrcall, pid, *args, **kwargs):
       dropped; it will still be logged at the level of `lgrcall`.
     maint : {'clear', 'refresh'}
     """
+    for h in list(_progress_handlers.values()):
+        if h.coalesce(pid, kwargs):
+            # a mere update of a progress bar on display, no need for the
+            # expense of a log record
+            return
     d = dict(
         {'dlm_progress_{}'.format(n): v for n, v in kwargs.items()
          # initial progress might be zero, but not sending it further
@@ -494,6 +571,11 @@ class LoggerHelper(object):
             # no stream logs of progress messages when interactive
             loghandler.addFilter(NoProgressLog())
             self.lgr.addHandler(phandler)
+            # a repeated initialization replaces the previous progress handler
+            prev_phandler = _progress_handlers.get(self.lgr.name)
+            if prev_phandler is not None:
+                self.lgr.removeHandler(prev_phandler)
+            _progress_handlers[self.lgr.name] = phandler
         else:
             loghandler.addFilter(partial(filter_noninteractive_progress,
                                          self.lgr))
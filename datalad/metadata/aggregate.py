@@ -43,6 +43,7 @@ from datalad.interface.common_opts import (
 from datalad.interface.results import get_status_dict
 from datalad.distribution.dataset import Dataset
 from datalad.metadata.metadata import (
+    flush_metadata_cache,
     get_ds_aggregate_db_locations,
     load_ds_aggregate_db,
 )
@@ -51,6 +52,7 @@ from datalad.metadata.metadata import (
     get_metadata_type,
     _get_metadata,
     _get_metadatarelevant_paths,
+    _load_content_metadata,
     _get_containingds_from_agginfo,
     location_keys,
 )
@@ -68,6 +70,7 @@ from datalad.support.constraints import (
 from datalad.support.constraints import EnsureChoice
 from datalad.support.gitrepo import GitRepo
 from datalad.support.annexrepo import AnnexRepo
+from datalad.support.exceptions import CommandError
 from datalad.support import json_py
 from datalad.support.path import split_ext
 from datalad.utils import (
@@ -78,6 +81,12 @@ from datalad.utils import (
 
 lgr = logging.getLogger('datalad.metadata.aggregate')
 
+# storage methods for content metadata objects by format label
+_content_dumpers = {
+    'xz': json_py.dump2xzstream,
+    'sqlite': json_py.dump2sqlite,
+}
+
 
 def _get_dsinfo_from_aggmetadata(ds_path, path, recursive, db):
     """Grab info on aggregated metadata for a path from a given dataset.
@@ -318,7 +327,8 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
             metasources['cn'] = {
                 'type': 'content',
                 'targetds': agginto_ds,
-                'dumper': json_py.dump2xzstream}
+                'dumper': _content_dumpers[agginto_ds.config.obtain(
+                    'datalad.metadata.aggregate-content-format')]}
 
     # check if we have the extracted metadata for this state already
     # either in the source or in the destination dataset
@@ -381,7 +391,9 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
             metasources,
             refcommit,
             subds_relpaths,
-            agg_base_path)
+            agg_base_path,
+            # with forced extraction, nothing must be reused
+            prev_agginfo=None if force_extraction else old_agginfo)
 
     # we did not actually run an extraction, so we need to
     # assemble an aggregation record from the existing pieces
@@ -436,8 +448,123 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
         return False
 
 
+def _get_incremental_base(aggfrom_ds, prev_agginfo, refcommit, nativetypes,
+                          relevant_paths):
+    """Determine what needs extraction, given a previous aggregation record
+
+    Parameters
+    ----------
+    aggfrom_ds : Dataset
+    prev_agginfo : dict
+      Aggregation record of a previous extraction from `aggfrom_ds` (with
+      absolute paths).
+    refcommit : str
+    nativetypes : list
+      Extractors to engage.
+    relevant_paths : list
+      All metadata-relevant paths of `aggfrom_ds` at `refcommit`.
+
+    Returns
+    -------
+    list, dict or None, None
+      Paths added or modified since the previously aggregated `refcommit`,
+      and previously extracted content metadata of all other (still
+      existing) relevant paths. None, if the previous record cannot be used
+      as a base (different extractors, content metadata object missing, ...).
+    """
+    prev_refcommit = prev_agginfo.get('refcommit')
+    prev_objpath = prev_agginfo.get('content_info')
+    if not (prev_refcommit and refcommit and prev_objpath):
+        return None, None
+    if prev_agginfo.get('extractors') != nativetypes:
+        lgr.debug('Extractor configuration changed, no incremental extraction')
+        return None, None
+    if not op.exists(prev_objpath):
+        lgr.debug('Previous content metadata object %s is not available, '
+                  'no incremental extraction', prev_objpath)
+        return None, None
+    try:
+        diff = aggfrom_ds.repo.diff(
+            fr=prev_refcommit, to=refcommit, eval_submodule_state='no')
+    except Exception as e:
+        # e.g. previous refcommit is not known to this repository (anymore)
+        lgr.debug('Cannot determine changes since %s, no incremental '
+                  'extraction: %s', prev_refcommit, exc_str(e))
+        return None, None
+    changed = set(
+        op.relpath(str(p), aggfrom_ds.path)
+        for p, props in diff.items()
+        if props.get('state') != 'clean')
+    repo = aggfrom_ds.repo
+    if 'annex' in nativetypes and isinstance(repo, AnnexRepo):
+        # annex metadata can change without any change in the worktree
+        prev_annex_branch = prev_agginfo.get('annex_branch')
+        if not prev_annex_branch:
+            lgr.debug('No record of the previous state of the annex '
+                      'metadata, no incremental extraction')
+            return None, None
+        try:
+            changed.update(_get_annex_metadata_changes(
+                repo, prev_annex_branch, refcommit))
+        except CommandError as e:
+            lgr.debug('Cannot determine annex metadata changes since %s, '
+                      'no incremental extraction: %s',
+                      prev_annex_branch, exc_str(e))
+            return None, None
+    relevant = set(relevant_paths)
+    base = {
+        p: meta
+        # do not use the process-wide object cache, this is a one-off
+        for p, meta in _load_content_metadata(prev_objpath, cache={}).items()
+        if p in relevant and p not in changed
+    }
+    lgr.debug('Incremental metadata extraction from %s: %i changed paths, '
+              '%i reused records', aggfrom_ds, len(changed), len(base))
+    return [p for p in relevant_paths if p not in base], base
+
+
+def _decode_annex_keyfile(name):
+    """Return the annex key of a file name in the git-annex branch"""
+    return name.replace('%', '/').replace('&c', ':').replace(
+        '&s', '%').replace('&a', '&')
+
+
+def _get_annex_metadata_changes(repo, prev_annex_branch, refcommit):
+    """Return the paths whose annex metadata changed since a previous state
+
+    Parameters
+    ----------
+    repo : AnnexRepo
+    prev_annex_branch : str
+      Commit of the git-annex branch at the time of the previous extraction.
+    refcommit : str
+      Commit to determine the annex keys of the paths at.
+
+    Returns
+    -------
+    set
+      Paths relative to the repository root.
+    """
+    if prev_annex_branch == repo.get_hexsha('git-annex'):
+        return set()
+    keys = set(
+        _decode_annex_keyfile(op.basename(f)[:-len('.log.met')])
+        for f in repo.call_git_items_(
+            ['diff', '--name-only', prev_annex_branch, 'git-annex', '--',
+             '*.log.met'])
+        if f)
+    if not keys:
+        return set()
+    return set(
+        str(p.relative_to(repo.pathobj))
+        for p, props in repo.get_content_annexinfo(
+            init=None, ref=refcommit).items()
+        if props.get('key') in keys)
+
+
 def _extract_metadata(agginto_ds, aggfrom_ds, db, to_save, objid, metasources,
-                      refcommit, subds_relpaths, agg_base_path):
+                      refcommit, subds_relpaths, agg_base_path,
+                      prev_agginfo=None):
     lgr.debug('Performing metadata extraction from %s', aggfrom_ds)
     # we will replace any conflicting info on this dataset with fresh stuff
     agginfo = db.get(aggfrom_ds.path, {})
@@ -448,6 +575,26 @@ def _extract_metadata(agginto_ds, aggfrom_ds, db, to_save, objid, metasources,
     # store esssential extraction config in dataset record
     agginfo['extractors'] = nativetypes
     agginfo['datalad_version'] = datalad.__version__
+    if 'annex' in nativetypes and isinstance(aggfrom_ds.repo, AnnexRepo):
+        # state of the annex metadata, to detect changes in subsequent
+        # incremental extractions
+        agginfo['annex_branch'] = aggfrom_ds.repo.get_hexsha('git-annex')
+    else:
+        agginfo.pop('annex_branch', None)
+
+    base_contentmeta = None
+    # None: honor a dataset's per-extractor configuration
+    content_meta = None
+    if prev_agginfo and 'cn' in metasources and aggfrom_ds.config.obtain(
+            'datalad.metadata.aggregate-content-incremental'):
+        extract_paths, base_contentmeta = _get_incremental_base(
+            aggfrom_ds, prev_agginfo, refcommit, nativetypes, relevant_paths)
+        if base_contentmeta is not None:
+            relevant_paths = extract_paths
+            if not extract_paths:
+                # nothing changed, and extractors would consider an empty
+                # list of paths as the entire dataset
+                content_meta = False
 
     # perform the actual extraction
     dsmeta, contentmeta, errored = _get_metadata(
@@ -456,8 +603,9 @@ def _extract_metadata(agginto_ds, aggfrom_ds, db, to_save, objid, metasources,
         # None indicates to honor a datasets per-extractor configuration and to be
         # on by default
         global_meta=None,
-        content_meta=None,
-        paths=relevant_paths)
+        content_meta=content_meta,
+        paths=relevant_paths,
+        base_contentmeta=base_contentmeta)
 
     meta = {
         'ds': dsmeta,
@@ -582,6 +730,8 @@ def _get_obj_location(hash_str, ref_type, dumper):
 
     if dumper is json_py.dump2xzstream:
         objrelpath += '.xz'
+    elif dumper is json_py.dump2sqlite:
+        objrelpath += '.sqlite'
 
     return objrelpath
 
@@ -1062,6 +1212,8 @@ class AggregateMetaData(Interface):
         #
         # save potential modifications to dataset global metadata
         #
+        # whatever was cached in this process might describe a previous state
+        flush_metadata_cache()
         if not to_save:
             return
         lgr.info('Attempting to save %i files/datasets', len(to_save))
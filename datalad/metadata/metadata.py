@@ -13,6 +13,7 @@ __docformat__ = 'restructuredtext'
 
 import glob
 import logging
+from copy import deepcopy
 import re
 import os
 import os.path as op
@@ -32,6 +33,7 @@ from datalad.interface.results import get_status_dict
 from datalad.interface.utils import eval_results
 from datalad.interface.base import build_doc
 from datalad.metadata.definitions import version as vocabulary_version
+from datalad.support.cache import SizeLimitedCache
 from datalad.support.constraints import (
     EnsureNone,
     EnsureBool,
@@ -43,6 +45,7 @@ from datalad.support.param import Parameter
 import datalad.support.ansi_colors as ac
 from datalad.support.json_py import (
     load as jsonload,
+    load_sqlite,
     load_xzstream,
 )
 from datalad.interface.common_opts import (
@@ -109,26 +112,115 @@ def get_metadata_type(ds):
     return []
 
 
-def _load_json_object(fpath, cache=None):
+# process-wide cache of decoded metadata objects, see _get_objcache()
+_objcache = None
+
+
+def _get_objcache():
+    """Return the process-wide cache for decoded metadata objects
+
+    Its size (in MB) is configured via 'datalad.metadata.cache-size'.
+    Cached objects are shared between queries and must not be modified.
+    """
+    global _objcache
+    if _objcache is None:
+        _objcache = SizeLimitedCache(
+            cfg.obtain('datalad.metadata.cache-size') * 1024 ** 2)
+    return _objcache
+
+
+def flush_metadata_cache():
+    """Discard all decoded metadata objects cached in this process"""
+    if _objcache is not None:
+        lgr.debug('Flushing cache of %i metadata objects', len(_objcache))
+        _objcache.clear()
+
+
+def _load_cached(fpath, load, cache=None, extra=None):
+    """Helper to load a metadata object via a cache
+
+    Parameters
+    ----------
+    fpath : str
+      Path of the metadata object. If it does not exist, an empty dict is
+      returned.
+    load : callable
+      Called without arguments to load the object.
+    cache : dict, optional
+      If given, objects are cached in it by `fpath` (and `extra`) only.
+      Otherwise the process-wide cache is used, and the object's file
+      properties are considered in addition, so modified objects are not
+      taken from the cache.
+    extra : hashable, optional
+      Additional component of the cache key, e.g. to distinguish partial
+      loads of the same object.
+    """
+    if not op.lexists(fpath):
+        return {}
     if cache is None:
-        cache = {}
-    obj = cache.get(
-        fpath,
-        jsonload(fpath, fixup=True) if op.lexists(fpath) else {})
-    cache[fpath] = obj
+        cache = _get_objcache()
+        try:
+            st = os.stat(fpath)
+        except OSError:
+            # broken symlink, e.g. annexed object without content
+            return {}
+        key = (fpath, extra, st.st_ino, st.st_size, st.st_mtime_ns)
+    else:
+        key = (fpath, extra)
+    obj = cache.get(key)
+    if obj is None:
+        obj = load()
+        cache[key] = obj
     return obj
 
 
+def _load_json_object(fpath, cache=None):
+    return _load_cached(
+        fpath,
+        lambda: jsonload(fpath, fixup=True),
+        cache=cache)
+
+
 def _load_xz_json_stream(fpath, cache=None):
-    if cache is None:
-        cache = {}
-    obj = cache.get(
+    return _load_cached(
         fpath,
-        {s['path']: {k: v for k, v in s.items() if k != 'path'}
-         # take out the 'path' from the payload
-         for s in load_xzstream(fpath)} if op.lexists(fpath) else {})
-    cache[fpath] = obj
-    return obj
+        lambda: {s['path']: {k: v for k, v in s.items() if k != 'path'}
+                 # take out the 'path' from the payload
+                 for s in load_xzstream(fpath)},
+        cache=cache)
+
+
+def _load_content_metadata(fpath, rpath=None, cache=None):
+    """Load content metadata of all paths at or underneath `rpath`
+
+    Parameters
+    ----------
+    fpath : str
+      Path of a content metadata object, either an XZ-compressed JSON
+      stream or an SQLite database (detected by extension).
+    rpath : str, optional
+      Path relative to the dataset the metadata object describes. Only
+      for an SQLite database this avoids loading the metadata of all other
+      paths.
+    cache : dict, optional
+      See `_load_cached()`.
+
+    Returns
+    -------
+    dict
+      Metadata by path. For an XZ-compressed JSON stream, this contains
+      all paths.
+    """
+    if not fpath.endswith('.sqlite'):
+        return _load_xz_json_stream(fpath, cache=cache)
+    return _load_cached(
+        fpath,
+        lambda: {s['path']: {k: v for k, v in s.items() if k != 'path'}
+                 for s in load_sqlite(
+                     fpath,
+                     None if rpath is None else rpath.replace(op.sep, '/'))},
+        cache=cache,
+        extra=rpath)
 
 
 def _get_metadatarelevant_paths(ds, subds_relpaths):
@@ -209,12 +301,10 @@ def query_aggregated_metadata(reporton, ds, aps, recursive=False,
     # look for and load the aggregation info for the base dataset
     agginfos, agg_base_path = load_ds_aggregate_db(ds)
 
-    # cache once loaded metadata objects for additional lookups
-    # TODO possibly supply this cache from outside, if objects could
-    # be needed again -- their filename does not change in a superdataset
-    # if done, cache under relpath, not abspath key
+    # once loaded metadata objects are cached for additional lookups
+    # in the process-wide object cache (objcache=None)
     cache = {
-        'objcache': {},
+        'objcache': None,
         'subds_relpaths': None,
     }
     reported = set()
@@ -340,7 +430,9 @@ def _query_aggregated_metadata_singlepath(
         # datasets) -> prep result
         res = get_status_dict(
             status='ok',
-            metadata=dsmeta,
+            # (deep) copy, dsmeta is shared via the object cache, and
+            # consumers might modify the result in-place
+            metadata=deepcopy(dsmeta),
             # normpath to avoid trailing dot
             path=op.normpath(op.join(ds.path, rpath)),
             type='dataset')
@@ -358,15 +450,17 @@ def _query_aggregated_metadata_singlepath(
     rparentpath = op.relpath(rpath, start=containing_ds)
 
     # so we have some files to query, and we also have some content metadata
-    contentmeta = _load_xz_json_stream(
+    contentmeta = _load_content_metadata(
         op.join(agg_base_path, contentinfo_objloc),
+        rpath=rparentpath,
         cache=cache['objcache']) if contentinfo_objloc else {}
 
     for fpath in [f for f in contentmeta.keys()
                   if rparentpath == op.curdir or
                   path_startswith(f, rparentpath)]:
         # we might be onto something here, prepare result
-        metadata = contentmeta.get(fpath, {})
+        # (deep copy, contentmeta is shared via the object cache)
+        metadata = deepcopy(contentmeta.get(fpath, {}))
 
         # we have to pull out the context for each extractor from the dataset
         # metadata
@@ -376,7 +470,7 @@ def _query_aggregated_metadata_singlepath(
             context = dsmeta.get(tlk, {}).get('@context', None)
             if context is None:
                 continue
-            metadata[tlk]['@context'] = context
+            metadata[tlk] = dict(metadata[tlk], **{'@context': context})
         if '@context' in dsmeta:
             metadata['@context'] = dsmeta['@context']
 
@@ -431,17 +525,23 @@ def _ok_metadata(meta, mtype, ds, loc):
     return False
 
 
-def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
+def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None,
+                  base_contentmeta=None):
     """Make a direct query of a dataset to extract its metadata.
 
     Parameters
     ----------
     ds : Dataset
     types : list
+    base_contentmeta : dict, optional
+      Previously extracted content metadata (by path) for paths that are not
+      part of `paths`. It is included in the returned content metadata and
+      considered for the dataset's unique content properties, as if it was
+      reported by the extractors.
     """
     errored = False
     dsmeta = dict()
-    contentmeta = {}
+    contentmeta = dict(base_contentmeta) if base_contentmeta else {}
 
     if global_meta is not None and content_meta is not None and \
             not global_meta and not content_meta:
@@ -455,7 +555,9 @@ def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
     fullpathlist = paths
     if paths and isinstance(ds.repo, AnnexRepo):
         # Ugly? Jep: #2055
-        content_info = zip(paths, ds.repo.file_has_content(paths), ds.repo.is_under_annex(paths))
+        annexinfo = ds.repo.get_files_annexinfo(paths)
+        content_info = list(zip(
+            paths, annexinfo['has_content'], annexinfo['annexed']))
         paths = [p for p, c, a in content_info if not a or c]
         nocontent = len(fullpathlist) - len(paths)
         if nocontent:
@@ -557,6 +659,40 @@ def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
 
         unique_cm = {}
         extractor_unique_exclude = getattr(extractor_cls, "_unique_exclude", set())
+        generate_unique = ds.config.obtain(
+            'datalad.metadata.generate-unique-{}'.format(mtype_key.replace('_', '-')),
+            default=True,
+            valtype=EnsureBool())
+
+        def _add_unique(meta):
+            # go through content metadata and inject report of unique keys
+            # and values into `dsmeta`
+            for k, v in meta.items():
+                if k in dsmeta.get(mtype_key, {}):
+                    # if the dataset already has a dedicated idea
+                    # about a key, we skip it from the unique list
+                    # the point of the list is to make missing info about
+                    # content known in the dataset, not to blindly
+                    # duplicate metadata. Example: list of samples data
+                    # were recorded from. If the dataset has such under
+                    # a 'sample' key, we should prefer that, over an
+                    # aggregated list of a hopefully-kinda-ok structure
+                    continue
+                elif k in extractor_unique_exclude:
+                    # the extractor thinks this key is worthless for the purpose
+                    # of discovering whole datasets
+                    # we keep the key (so we know that some file is providing this key),
+                    # but ignore any value it came with
+                    unique_cm[k] = None
+                    continue
+                vset = unique_cm.get(k, set())
+                vset.add(_val2hashable(v))
+                unique_cm[k] = vset
+
+        if generate_unique and base_contentmeta:
+            for loc_meta in base_contentmeta.values():
+                if mtype_key in loc_meta:
+                    _add_unique(loc_meta[mtype_key])
         # TODO: ATM neuroimaging extractors all provide their own internal
         #  log_progress but if they are all generators, we could provide generic
         #  handling of the progress here.  Note also that log message is actually
@@ -607,37 +743,13 @@ def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
 
             # assign
             # only ask each metadata extractor once, hence no conflict possible
-            loc_dict = contentmeta.get(loc, {})
+            # (but do not modify records shared with `base_contentmeta`)
+            loc_dict = dict(contentmeta.get(loc, {}))
             loc_dict[mtype_key] = meta
             contentmeta[loc] = loc_dict
 
-            if ds.config.obtain(
-                    'datalad.metadata.generate-unique-{}'.format(mtype_key.replace('_', '-')),
-                    default=True,
-                    valtype=EnsureBool()):
-                # go through content metadata and inject report of unique keys
-                # and values into `dsmeta`
-                for k, v in meta.items():
-                    if k in dsmeta.get(mtype_key, {}):
-                        # if the dataset already has a dedicated idea
-                        # about a key, we skip it from the unique list
-                        # the point of the list is to make missing info about
-                        # content known in the dataset, not to blindly
-                        # duplicate metadata. Example: list of samples data
-                        # were recorded from. If the dataset has such under
-                        # a 'sample' key, we should prefer that, over an
-                        # aggregated list of a hopefully-kinda-ok structure
-                        continue
-                    elif k in extractor_unique_exclude:
-                        # the extractor thinks this key is worthless for the purpose
-                        # of discovering whole datasets
-                        # we keep the key (so we know that some file is providing this key),
-                        # but ignore any value it came with
-                        unique_cm[k] = None
-                        continue
-                    vset = unique_cm.get(k, set())
-                    vset.add(_val2hashable(v))
-                    unique_cm[k] = vset
+            if generate_unique:
+                _add_unique(meta)
 
         # log_progress(
         #     lgr.debug,
@@ -849,7 +961,8 @@ def load_ds_aggregate_db(ds, version='default', abspath=False, warn_absent=True)
     info_fpath, agg_base_path = get_ds_aggregate_db_locations(ds, version, warn_absent)
 
     # save to call even with a non-existing location
-    agginfos = _load_json_object(info_fpath)
+    # not using the process-wide cache, callers are free to modify the DB
+    agginfos = _load_json_object(info_fpath, cache={})
 
     if abspath:
         return {
@@ -126,10 +126,13 @@ def _meta2autofield_dict(meta, val2str=True, schema=None, consider_ucn=True):
     - ... TODO ...
     """
     if consider_ucn:
+        # `meta` might be shared with other consumers (e.g. via the metadata
+        # cache), hence (shallow) copies are modified only
+        meta = dict(meta)
         # loop over all metadata sources and the report of their unique values
         ucnprops = meta.get("datalad_unique_content_properties", {})
         for src, umeta in ucnprops.items():
-            srcmeta = meta.get(src, {})
+            srcmeta = dict(meta.get(src, {}))
             for uk in umeta:
                 if uk in srcmeta:
                     # we have a real entry for this key in the dataset metadata
@@ -137,7 +140,7 @@ def _meta2autofield_dict(meta, val2str=True, schema=None, consider_ucn=True):
                     # tailored data
                     continue
                 srcmeta[uk] = _listdict2dictlist(umeta[uk], strict=False) if umeta[uk] is not None else None
-            if src not in meta and srcmeta:
+            if srcmeta:
                 meta[src] = srcmeta  # assign the new one back
 
     srcmeta = None   # for paranoids to avoid some kind of manipulation of the last
@@ -11,19 +11,25 @@
 
 
 import os.path as op
+from unittest.mock import patch
 from os.path import join as opj
 
 from datalad.api import metadata
 from datalad.distribution.dataset import Dataset
+from datalad.metadata.extractors.base import BaseMetadataExtractor
 
 from datalad.tests.utils import (
     assert_dict_equal,
+    assert_in,
+    assert_not_equal,
     assert_not_in,
     assert_repo_status,
     assert_result_count,
     assert_status,
+    create_tree,
     eq_,
     known_failure_githubci_win,
+    ok_,
     skip_if_on_windows,
     skip_ssh,
     slow,
@@ -98,6 +104,122 @@ def test_basic_aggregate(path):
         assert_dict_equal(d, a)
 
 
+@known_failure_githubci_win
+@with_tree(tree=_dataset_hierarchy_template)
+def test_aggregate_sqlite_content(path):
+    base = Dataset(opj(path, 'origin')).create(force=True)
+    sub = base.create('sub', force=True)
+    base.save(recursive=True)
+    base.config.add('datalad.metadata.aggregate-content-format', 'sqlite',
+                    where='local')
+    base.aggregate_metadata(recursive=True, update_mode='all')
+    assert_repo_status(base.path)
+    agginfo = base.metadata(
+        get_aggregates=True, return_type='list')
+    # content metadata objects are SQLite databases
+    content_objs = [a['content_info'] for a in agginfo
+                    if a.get('content_info')]
+    assert content_objs
+    assert all(o.endswith('.sqlite') for o in content_objs)
+    # and can be queried for individual files, in sub- and superdataset
+    for p in (opj('sub', 'dataset_description.json'),
+              'dataset_description.json'):
+        res = base.metadata(p, reporton='files', return_type='list')
+        assert_result_count(res, 1, type='file', path=opj(base.path, p))
+
+
+@known_failure_githubci_win
+@with_tempfile(mkdir=True)
+def test_aggregate_incremental_content(path):
+    ds = Dataset(path).create()
+    for f in ('modified', 'untouched', 'removed'):
+        create_tree(ds.path, {f: f})
+    ds.save()
+    ds.config.add('datalad.metadata.aggregate-content-incremental', 'yes',
+                  where='local')
+    ds.aggregate_metadata()
+    before = {
+        r['path']: r
+        for r in ds.metadata(reporton='files', return_type='list')}
+    create_tree(ds.path, {'modified': 'changed', 'added': 'added'})
+    ds.remove('removed', check=False)
+    ds.save()
+    ds.aggregate_metadata()
+    assert_repo_status(ds.path)
+    after = {
+        r['path']: r
+        for r in ds.metadata(reporton='files', return_type='list')}
+    assert_not_in(opj(ds.path, 'removed'), after)
+    for f in ('modified', 'untouched', 'added'):
+        assert_in(opj(ds.path, f), after)
+    # reused record of an unchanged file
+    assert_dict_equal(
+        before[opj(ds.path, 'untouched')]['metadata'],
+        after[opj(ds.path, 'untouched')]['metadata'])
+    # and the modified file got a fresh record
+    assert_not_equal(
+        before[opj(ds.path, 'modified')]['metadata'],
+        after[opj(ds.path, 'modified')]['metadata'])
+    # identical to a full extraction from scratch
+    ds.config.unset('datalad.metadata.aggregate-content-incremental',
+                    where='local')
+    ds.aggregate_metadata(force_extraction=True)
+    full = {
+        r['path']: r
+        for r in ds.metadata(reporton='files', return_type='list')}
+    eq_(sorted(after), sorted(full))
+    for p in full:
+        assert_dict_equal(after[p]['metadata'], full[p]['metadata'])
+
+
+@known_failure_githubci_win
+@with_tempfile(mkdir=True)
+def test_aggregate_incremental_unchanged_content(path):
+    ds = Dataset(path).create()
+    create_tree(ds.path, {'file': 'file'})
+    ds.save()
+    ds.config.add('datalad.metadata.aggregate-content-incremental', 'yes',
+                  where='local')
+    ds.aggregate_metadata()
+    before = ds.metadata(reporton='files', return_type='list')
+    # a change that is not relevant for content metadata
+    ds.config.add('datalad.dummy', 'value', where='dataset')
+    ds.save()
+    with patch.object(BaseMetadataExtractor, 'get_metadata', autospec=True,
+                      side_effect=BaseMetadataExtractor.get_metadata) as gm:
+        ds.aggregate_metadata()
+    ok_(gm.called)
+    # no extractor ran on content
+    for call in gm.call_args_list:
+        eq_(call[1]['content'], False)
+    # but the previous content metadata is still reported
+    eq_(ds.metadata(reporton='files', return_type='list'), before)
+
+
+@known_failure_githubci_win
+@with_tempfile(mkdir=True)
+def test_aggregate_incremental_annex_metadata(path):
+    ds = Dataset(path).create()
+    create_tree(ds.path, {'tagged': 'tagged', 'untouched': 'untouched'})
+    ds.save()
+    ds.config.add('datalad.metadata.aggregate-content-incremental', 'yes',
+                  where='local')
+    ds.aggregate_metadata()
+    # a change of annex metadata only is not visible in the diff of the
+    # dataset, but must not lead to a reuse of the previous record
+    ds.repo.set_metadata('tagged', add={'tag': 'new'})
+    create_tree(ds.path, {'added': 'added'})
+    ds.save()
+    ds.aggregate_metadata()
+    res = ds.metadata('tagged', reporton='files', return_type='list')
+    assert_result_count(res, 1)
+    eq_(res[0]['metadata']['annex']['tag'], 'new')
+    # forced extraction does not reuse anything
+    with patch('datalad.metadata.aggregate._get_incremental_base') as base:
+        ds.aggregate_metadata(force_extraction=True)
+        base.assert_not_called()
+
+
 # tree puts aggregate metadata structures on two levels inside a dataset
 @known_failure_githubci_win
 @with_tree(tree={
@@ -25,6 +25,9 @@ from datalad.api import (
 )
 from datalad.metadata.metadata import (
     _get_containingds_from_agginfo,
+    _get_objcache,
+    _load_json_object,
+    flush_metadata_cache,
     get_metadata_type,
     query_aggregated_metadata,
 )
@@ -36,6 +39,8 @@ from datalad.tests.utils import (
     assert_dict_equal,
     assert_equal,
     assert_in,
+    assert_is,
+    assert_is_not,
     assert_raises,
     assert_re_in,
     assert_repo_status,
@@ -283,3 +288,26 @@ def test_get_containingds_from_agginfo():
     # will not tollerate mix'n'match
     assert_raises(ValueError, _get_containingds_from_agginfo, {'match': {}}, op.abspath(down))
     assert_raises(ValueError, _get_containingds_from_agginfo, {op.abspath('match'): {}}, down)
+
+
+@with_tree(tree={'obj.json': '{"some": "thing"}'})
+def test_metadata_objcache(path):
+    fpath = opj(path, 'obj.json')
+    obj = _load_json_object(fpath)
+    eq_(obj, {'some': 'thing'})
+    # decoded only once
+    assert_is(_load_json_object(fpath), obj)
+    # a modification is detected
+    with open(fpath, 'w') as f:
+        f.write('{"some": "other"}')
+    obj2 = _load_json_object(fpath)
+    eq_(obj2, {'some': 'other'})
+    assert_is(_load_json_object(fpath), obj2)
+    # explicit invalidation
+    flush_metadata_cache()
+    eq_(len(_get_objcache()), 0)
+    obj3 = _load_json_object(fpath)
+    eq_(obj3, obj2)
+    assert_is_not(obj3, obj2)
+    # non-existing objects come out empty and are not cached
+    eq_(_load_json_object(opj(path, 'absent.json')), {})
@@ -44,6 +44,7 @@ from datalad.support.exceptions import NoDatasetFound
 
 from datalad.api import search
 
+from ..metadata import flush_metadata_cache
 from ..search import (
     _listdict2dictlist,
     _meta2autofield_dict,
@@ -348,6 +349,40 @@ def test_listdict2dictlist():
     eq_(f([{1: [2, 3], 'a': 1}, {'a': 2, 'c': ''}]), {'a': [1, 2]})
 
 
+def test_meta2autofield_dict_unmodified():
+    meta = {
+        'datalad_unique_content_properties': {'extr1': {'prop1': ['v1']}},
+        'extr1': {'prop2': 'value'},
+    }
+    eq_(_meta2autofield_dict(meta),
+        {'extr1.prop1': 'v1', 'extr1.prop2': 'value'})
+    # the input record (possibly shared via the metadata cache) is untouched
+    eq_(meta['extr1'], {'prop2': 'value'})
+
+
+@known_failure_githubci_win
+@with_tempfile(mkdir=True)
+def test_search_leaves_metadata_unmodified(path):
+    try:
+        import mutagen
+    except ImportError:
+        raise SkipTest
+    ds = Dataset(path).create(force=True)
+    ds.config.add('datalad.metadata.nativetype', 'audio', where='dataset')
+    makedirs(opj(path, 'stim'))
+    copy(
+        opj(dirname(dirname(__file__)), 'tests', 'data', 'audio.mp3'),
+        opj(path, 'stim', 'stim1.mp3'))
+    ds.save()
+    ds.aggregate_metadata()
+    flush_metadata_cache()
+    cold = ds.metadata(reporton='all')
+    # search and metadata share the process-wide cache of metadata objects
+    for mode in ('egrep', 'autofield'):
+        ds.search('.', mode=mode)
+        eq_(ds.metadata(reporton='all'), cold)
+
+
 def test_meta2autofield_dict():
     # Just a test that we would obtain the value stored for that extractor
     # instead of what unique values it already had (whatever that means)
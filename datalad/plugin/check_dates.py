@@ -66,6 +66,7 @@ class CheckDates(Interface):
     timestamps within files of the "git-annex" branch, and (3) the timestamps
     of annotated tags.
     """
+    from datalad.interface.common_opts import jobs_opt
     from datalad.interface.utils import eval_results
     import datalad.support.ansi_colors as ac
     from datalad.support.constraints import EnsureChoice, EnsureNone, EnsureStr
@@ -137,6 +138,7 @@ class CheckDates(Interface):
             action="store_true",
             doc="""Find dates which are older than the reference date rather
             than newer."""),
+        jobs=jobs_opt,
     )
 
     @staticmethod
@@ -146,7 +148,9 @@ class CheckDates(Interface):
                  revs=None,
                  annex="all",
                  no_tags=False,
-                 older=False):
+                 older=False,
+                 jobs=None):
+        from datalad.support.parallel import parallel_map
         from datalad.support.repodates import check_dates
 
         which = "older" if older else "newer"
@@ -164,20 +168,26 @@ class CheckDates(Interface):
                  which,
                  time.strftime("%d %b %Y %H:%M:%S +0000", time.gmtime(ref_ts)))
 
-        for repo in _git_repos(paths or ["."]):
-            fullpath = os.path.abspath(repo)
-            lgr.debug("Checking %s", fullpath)
-
+        def check_repo(repo):
+            lgr.debug("Checking %s", os.path.abspath(repo))
             try:
-                report = check_dates(repo,
-                                     ref_ts,
-                                     which=which,
-                                     revs=revs or ["--all"],
-                                     annex={"all": True,
-                                            "none": False,
-                                            "tree": "tree"}[annex],
-                                     tags=not no_tags)
+                return repo, check_dates(repo,
+                                         ref_ts,
+                                         which=which,
+                                         revs=revs or ["--all"],
+                                         annex={"all": True,
+                                                "none": False,
+                                                "tree": "tree"}[annex],
+                                         tags=not no_tags)
             except InvalidGitRepositoryError as exc:
+                return repo, None
+
+        # repositories are inspected concurrently, but reported in order
+        for repo, report in parallel_map(check_repo,
+                                         _git_repos(paths or ["."]),
+                                         jobs=jobs):
+            fullpath = os.path.abspath(repo)
+            if report is None:
                 lgr.warning("Skipping invalid Git repo: %s", repo)
                 continue
 
@@ -14,6 +14,7 @@ import os
 
 from datalad.api import check_dates
 from datalad.support.annexrepo import AnnexRepo
+from datalad.support.gitrepo import GitRepo
 from datalad.support.exceptions import IncompleteResultsError
 from datalad.support.tests.test_repodates import set_date
 from datalad.tests.utils import (
@@ -102,3 +103,21 @@ def test_check_dates(path):
     newer_noannex = call([path], reference_date=refdate, annex="none")
     for entry in newer_noannex[0]["report"]["objects"].values():
         ok_(entry["type"] == "commit")
+
+
+@with_tree(tree={"a": {"f": "a"}, "b": {"f": "b"}, "c": {"f": "c"}})
+def test_check_dates_jobs(path):
+    ref_ts = 1218182889
+    refdate = "@{}".format(ref_ts)
+    for i, name in enumerate("abc"):
+        with set_date(ref_ts + (1 if name == "b" else -1) * (i + 1)):
+            repo = GitRepo(os.path.join(path, name), create=True)
+            repo.add("f")
+            repo.commit("add f")
+
+    serial = call([path], reference_date=refdate)
+    eq_(len(serial), 3)
+    # same reports, in the same order
+    eq_(call([path], reference_date=refdate, jobs=2), serial)
+    eq_([bool(r["report"]["objects"]) for r in serial],
+        [os.path.basename(r["path"]) == "b" for r in serial])
@@ -13,6 +13,7 @@ For further information on git-annex see https://git-annex.branchable.com/.
 """
 
 from collections import OrderedDict
+from hashlib import md5
 import json
 import logging
 import math
@@ -59,6 +60,7 @@ from datalad.utils import (
 from datalad.log import log_progress
 # must not be loads, because this one would log, and we need to log ourselves
 from datalad.support.json_py import json_loads
+from datalad.support.parallel import parallel_map
 from datalad.cmd import (
     BatchedCommand,
     GitRunner,
@@ -103,6 +105,9 @@ from .exceptions import (
 
 lgr = logging.getLogger('datalad.annex')
 
+# characters used by git-annex for the 'mixed' object hash directories
+_HASHDIR_MIXED_CHARS = '0123456789zqjxkmvwgpfZQJXKMVWGPF'
+
 # TODO Constant is no longer used, but left defined to avoid breakage in
 # dependent code. Remove in 0.14 release.
 N_AUTO_JOBS = 1
@@ -682,6 +687,32 @@ class AnnexRepo(GitRepo, RepoInterface):
             # S or C are given with the respective other one missing
             raise ValueError("invalid key: {}".format(key))
 
+    @staticmethod
+    def get_key_hashdirs(key):
+        """Compute the object hash directories of a key
+
+        This reimplements git-annex' `hashDirMixed` and `hashDirLower`
+        for the default two hash levels, so no annex call is needed.
+
+        Returns
+        -------
+        tuple(str, str)
+          POSIX paths of the 'mixed' hash directory (used for the objects
+          of non-bare repositories) and the 'lower' hash directory (used
+          in bare repositories and with adjusted branches), e.g.
+          ('pX/ZJ', 'f87/4d5').
+        """
+        digest = md5(key.encode('utf-8'))
+        # first 32bit word of the digest, little-endian
+        word = int.from_bytes(digest.digest()[:4], 'little')
+        chars = [_HASHDIR_MIXED_CHARS[(word >> (6 * i)) & 31]
+                 for i in range(4)]
+        hexdigest = digest.hexdigest()
+        return (
+            '{1}{0}/{3}{2}'.format(*chars),
+            '{}/{}'.format(hexdigest[:3], hexdigest[3:6]),
+        )
+
     @normalize_path
     def get_file_size(self, path):
         fpath = opj(self.path, path)
@@ -1798,6 +1829,46 @@ class AnnexRepo(GitRepo, RepoInterface):
 
         return self._check_files(check, files, batch)
 
+    @normalize_paths(match_return_type=False)
+    def get_files_annexinfo(self, files):
+        """Report annex properties of many files at once
+
+        A single `git annex find --json` pass (chunked only for very long
+        file lists) reports the keys of all annexed files among `files`,
+        and content presence is determined by testing for the key files in
+        the local annex object store. No per-file annex calls are made.
+
+        Parameters
+        ----------
+        files: list of str
+            files to query. Directories are not expanded and are reported
+            as not being annexed.
+
+        Returns
+        -------
+        dict
+          with the properties 'key', 'annexed', 'has_content', and
+          'bytesize', each mapping to a list aligned with `files`. For
+          files not under annex, 'key' and 'bytesize' are None, and
+          'annexed' and 'has_content' are False. 'bytesize' is also None
+          if the key carries no size information. 'has_content' refers to
+          the key that is recorded for a file, not to potential unsaved
+          modifications of an unlocked file.
+        """
+        res = {p: [] for p in ('key', 'annexed', 'has_content', 'bytesize')}
+        if not files:
+            return res
+        info = self.get_content_annexinfo(
+            paths=files, init=None, eval_availability=True)
+        for f in files:
+            rec = info.get(self.pathobj / f, {})
+            key = rec.get('key')
+            res['key'].append(key)
+            res['annexed'].append(key is not None)
+            res['has_content'].append(rec.get('has_content', False))
+            res['bytesize'].append(rec.get('bytesize'))
+        return res
+
     def init_remote(self, name, options):
         """Creates a new special remote
 
@@ -3237,33 +3308,47 @@ class AnnexRepo(GitRepo, RepoInterface):
     def _mark_content_availability(self, info):
         objectstore = self.pathobj.joinpath(
             self.path, GitRepo.get_git_dir(self), 'annex', 'objects')
-        for f, r in info.items():
-            if 'key' not in r or 'has_content' in r:
-                # not annexed or already processed
-                continue
+        # not annexed or already processed records are left alone
+        recs = [r for r in info.values()
+                if 'key' in r and 'has_content' not in r]
+        if not recs:
+            return
+        # with a single-level object hash the location cannot be computed,
+        # ask git-annex instead. Other tunings only switch between the two
+        # hash directory flavors that are tested below anyway
+        if self.config.getbool('annex', 'tune.objecthash1', False):
+            for r in recs:
+                loc = self.get_contentlocation(r['key'], batch=True)
+                r['has_content'] = bool(loc)
+                if loc:
+                    r['objloc'] = str(self.pathobj / loc)
+            return
+
+        def _locate(r):
+            key = r['key']
             # test hashdirmixed first, as it is used in non-bare repos
             # which be a more frequent target
-            # TODO optimize order based on some check that reveals
-            # what scheme is used in a given annex
-            r['has_content'] = False
-            key = r['key']
-            for testpath in (
-                    # ATM git-annex reports hashdir in native path
-                    # conventions and the actual file path `f` in
-                    # POSIX, weired...
-                    # we need to test for the actual key file, not
-                    # just the containing dir, as on windows the latter
-                    # may not always get cleaned up on `drop`
-                    objectstore.joinpath(
-                        ut.Path(r['hashdirmixed']), key, key),
-                    objectstore.joinpath(
-                        ut.Path(r['hashdirlower']), key, key)):
+            # we need to test for the actual key file, not
+            # just the containing dir, as on windows the latter
+            # may not always get cleaned up on `drop`
+            for hashdir in self.get_key_hashdirs(key):
+                testpath = objectstore.joinpath(
+                    ut.PurePosixPath(hashdir), key, key)
                 if testpath.exists():
-                    r.pop('hashdirlower', None)
-                    r.pop('hashdirmixed', None)
-                    r['objloc'] = str(testpath)
-                    r['has_content'] = True
-                    break
+                    return testpath
+            return None
+
+        # the checks are pure stat() calls, but on high-latency file
+        # systems it pays off to have several of them in flight
+        for r, testpath in zip(
+                recs,
+                parallel_map(_locate, recs,
+                             jobs='auto' if len(recs) > 1 else None)):
+            r['has_content'] = testpath is not None
+            if testpath is not None:
+                r.pop('hashdirlower', None)
+                r.pop('hashdirmixed', None)
+                r['objloc'] = str(testpath)
 
     def get_content_annexinfo(
             self, paths=None, init='git', ref=None, eval_availability=False,
@@ -3363,10 +3448,8 @@ class AnnexRepo(GitRepo, RepoInterface):
                     # of None/NaN etc.
                     del rec['bytesize']
             info[path] = rec
-            # TODO make annex availability checks optional and move in here
-            if not eval_availability:
-                # not desired, or not annexed
-                continue
+        # TODO make annex availability checks optional and move in here
+        if eval_availability:
             self._mark_content_availability(info)
         return info
 
@@ -9,6 +9,8 @@
 """Simple constructs to be used as caches
 """
 
+import sys
+import threading
 from collections import OrderedDict
 
 from functools import lru_cache
@@ -31,3 +33,91 @@ class DictCache(OrderedDict):
         if self.size_limit is not None:
             while len(self) > self.size_limit:
                 self.popitem(last=False)
+
+
+def get_obj_size(obj):
+    """Estimate the memory footprint of a (JSON-like) object in bytes
+
+    Only containers used by JSON-decoded structures (dict, list, tuple) are
+    traversed, anything else is accounted for by `sys.getsizeof()`.
+    """
+    size = 0
+    todo = [obj]
+    while todo:
+        o = todo.pop()
+        size += sys.getsizeof(o)
+        if isinstance(o, dict):
+            todo.extend(o.keys())
+            todo.extend(o.values())
+        elif isinstance(o, (list, tuple)):
+            todo.extend(o)
+    return size
+
+
+class SizeLimitedCache(object):
+    """A least-recently-used cache with a limit on the total size of its items
+
+    The size of an item is estimated by a function (`get_obj_size()` by
+    default) once, when the item is added.  Whenever the size limit is
+    exceeded, least recently used items are expunged.  A single item larger
+    than the limit is not cached at all.  Access is serialized, so an
+    instance can be shared among threads.
+    """
+    def __init__(self, size_limit, sizeof=get_obj_size):
+        """
+        Parameters
+        ----------
+        size_limit : int
+          Maximum total size of all cached items (in bytes, by default).
+        sizeof : callable, optional
+          Function returning the size of an item.
+        """
+        self.size_limit = size_limit
+        self._sizeof = sizeof
+        self._items = OrderedDict()
+        self.size = 0
+        # reentrant, as __setitem__() calls pop()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, _ = self._items[key]
+            self._items.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            self.pop(key)
+            if size > self.size_limit:
+                return
+            self._items[key] = (value, size)
+            self.size += size
+            while self.size > self.size_limit:
+                _, (_, size) = self._items.popitem(last=False)
+                self.size -= size
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            value, size = self._items.pop(key)
+            self.size -= size
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
@@ -9,6 +9,7 @@
 """Wrapper for globbing paths.
 """
 
+from fnmatch import fnmatch
 import glob
 import logging
 import os.path as op
@@ -35,11 +36,21 @@ class GlobbedPaths(object):
         Glob in this directory.
     expand : bool, optional
        Whether the `paths` property returns unexpanded or expanded paths.
+    repo : GitRepo, optional
+       If given, match patterns against the files recorded in the index of
+       this repository (which must contain `pwd`), and its untracked files,
+       rather than against the file system. This does not require file
+       content (or even a work tree file) to be present, and avoids walking
+       large directories. The file system is still consulted for patterns
+       that can match content of subdatasets or untracked directories, or
+       point outside of the repository.
     """
 
-    def __init__(self, patterns, pwd=None, expand=False):
+    def __init__(self, patterns, pwd=None, expand=False, repo=None):
         self.pwd = pwd or getpwd()
         self._expand = expand
+        self._repo = repo
+        self._index = None
 
         if patterns is None:
             self._maybe_dot = []
@@ -86,6 +97,94 @@ class GlobbedPaths(object):
         self._paths["sub_patterns"][pattern] = sub_patterns
         return sub_patterns
 
+    def _get_index(self):
+        """Return (path, type) of the index entries and untracked content
+
+        Paths are POSIX paths relative to the repository root. The type is
+        "file", "dataset" (a submodule), or "directory" (an untracked
+        directory whose content is not listed).
+        """
+        if self._index is None:
+            self._index = []
+            for line in self._repo.call_git_items_(
+                    ["ls-files", "-z", "--stage"], sep="\0"):
+                if not line:
+                    continue
+                props, path = line.split("\t", 1)
+                self._index.append(
+                    (path,
+                     "dataset" if props.startswith("160000 ") else "file"))
+            # untracked (and ignored) content, as it can match too
+            for path in self._repo.call_git_items_(
+                    ["ls-files", "-z", "--others", "--directory"], sep="\0"):
+                if not path:
+                    continue
+                if path.endswith("/"):
+                    self._index.append((path[:-1], "directory"))
+                else:
+                    self._index.append((path, "file"))
+        return self._index
+
+    def _glob_index(self, pattern):
+        """Like `glob.glob`, but match `pattern` against the index of `repo`
+
+        Returns
+        -------
+        list or None, bool
+          Matches relative to `pwd` (directories with a trailing separator
+          if `pattern` has one), or None if `pattern` points outside of the
+          repository. And whether these matches are complete. They are not,
+          if `pattern` could match content of a subdataset or of an untracked
+          directory, which is not listed in the index.
+        """
+        dirs_only = pattern.endswith(op.sep)
+        rpath = op.relpath(
+            op.normpath(op.join(op.realpath(self.pwd), pattern)),
+            op.realpath(self._repo.path))
+        if rpath == op.pardir or rpath.startswith(op.pardir + op.sep):
+            return None, False
+        pat_parts = rpath.split(op.sep)
+        n_parts = len(pat_parts)
+
+        def _match(parts):
+            # like glob, "*" and "?" do not match a leading "."
+            return all(
+                p == pp or (glob.has_magic(pp) and fnmatch(p, pp) and
+                            (pp.startswith(".") or not p.startswith(".")))
+                for p, pp in zip(parts, pat_parts))
+
+        matches = set()
+        complete = True
+        for path, type_ in self._get_index():
+            parts = path.split("/")
+            if len(parts) < n_parts:
+                if type_ != "file" and complete and _match(parts):
+                    # the pattern reaches into a directory whose content
+                    # is not known
+                    complete = False
+                continue
+            if dirs_only and len(parts) == n_parts and type_ == "file":
+                # not a directory
+                continue
+            if _match(parts):
+                matches.add(op.join(*parts[:n_parts]))
+        return [
+            op.relpath(op.join(self._repo.path, m), op.realpath(self.pwd)) +
+            (op.sep if dirs_only else "")
+            for m in matches], complete
+
+    def _glob(self, pattern):
+        if self._repo is None:
+            return glob.glob(pattern)
+        hits, complete = self._glob_index(pattern)
+        if complete:
+            return hits
+        # merge with the file system matches, these have precedence to keep
+        # the form of a path (e.g. "./name") intact
+        fs_hits = glob.glob(pattern)
+        seen = set(map(op.normpath, fs_hits))
+        return fs_hits + [h for h in hits or [] if op.normpath(h) not in seen]
+
     def _expand_globs(self):
         def normalize_hit(h):
             normalized = op.relpath(h) + ("" if op.basename(h) else op.sep)
@@ -97,7 +196,7 @@ class GlobbedPaths(object):
         expanded = []
         with chpwd(self.pwd):
             for pattern in self._paths["patterns"]:
-                hits = glob.glob(pattern)
+                hits = self._glob(pattern)
                 if hits:
                     expanded.extend(sorted(map(normalize_hit, hits)))
                 else:
@@ -106,7 +205,7 @@ class GlobbedPaths(object):
                     # a sub-pattern hit, that may mean we have an uninstalled
                     # subdataset.
                     for sub_pattern in self._get_sub_patterns(pattern):
-                        sub_hits = glob.glob(sub_pattern)
+                        sub_hits = self._glob(sub_pattern)
                         if sub_hits:
                             expanded.extend(
                                 sorted(map(normalize_hit, sub_hits)))
@@ -26,6 +26,7 @@ from simplejson import load as jsonload
 from simplejson import dump as jsondump
 # simply mirrored for now
 from simplejson import loads as json_loads
+from simplejson import dumps as json_dumps
 from simplejson import JSONDecodeError
 
 
@@ -129,6 +130,91 @@ def dump2xzstream(obj, fname):
     dump2stream(obj, fname, compressed=True)
 
 
+def dump2sqlite(obj, fname):
+    """Dump a sequence of JSON-serializable records into an SQLite database
+
+    Each record must be a dict with a 'path' key.  The records are stored
+    (compactly serialized and zlib-compressed, without the 'path' property)
+    in a table indexed by path, such that individual records (or all records
+    underneath a path) can be accessed without decompressing the entire
+    collection (see `load_sqlite()`).
+
+    Parameters
+    ----------
+    obj : iterable
+      Records to serialize.
+    fname : str
+      Name of the database file to create.  An existing file is replaced.
+    """
+    import sqlite3
+    import zlib
+
+    indir = dirname(fname)
+    if op.lexists(fname):
+        os.remove(fname)
+    elif indir and not exists(indir):
+        makedirs(indir)
+    con = sqlite3.connect(fname)
+    try:
+        with con:
+            con.execute(
+                'CREATE TABLE records (path TEXT PRIMARY KEY, record BLOB)')
+            con.executemany(
+                'INSERT INTO records VALUES (?, ?)',
+                ((o['path'],
+                  zlib.compress(json_dumps(
+                      {k: v for k, v in o.items() if k != 'path'},
+                      **compressed_json_dump_kwargs).encode('utf-8')))
+                 for o in obj))
+    finally:
+        con.close()
+
+
+def load_sqlite(fname, path=None):
+    """Load records from a database created by `dump2sqlite()`
+
+    Parameters
+    ----------
+    fname : str
+      Name of the database file.
+    path : str, optional
+      If given, only the record for this path, and any record for a path
+      underneath it (considering '/' as a separator), is loaded.
+
+    Returns
+    -------
+    generator
+      Records (dicts with 'path' property) in order of their path.
+    """
+    import sqlite3
+    import zlib
+    from urllib.parse import quote
+
+    # the file is never modified, no locking is needed, and it might even
+    # be on a read-only file system
+    con = sqlite3.connect(
+        'file:{}?mode=ro&immutable=1'.format(quote(op.abspath(fname))),
+        uri=True)
+    try:
+        if path in (None, '', op.curdir):
+            cursor = con.execute(
+                'SELECT path, record FROM records ORDER BY path')
+        else:
+            path = path.rstrip('/')
+            # '0' is the character following '/', so this range covers
+            # everything underneath `path` only
+            cursor = con.execute(
+                'SELECT path, record FROM records '
+                'WHERE path = ? OR (path > ? AND path < ?) ORDER BY path',
+                (path, path + '/', path + '0'))
+        for p, record in cursor:
+            o = loads(zlib.decompress(record).decode('utf-8'))
+            o['path'] = p
+            yield o
+    finally:
+        con.close()
+
+
 def load_stream(fname, compressed=None):
     _open = LZMAFile \
         if compressed or compressed is None and fname.endswith('.xz') \
@@ -0,0 +1,83 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 noet:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Helpers for running (mostly I/O bound) work concurrently
+
+"""
+
+__docformat__ = 'restructuredtext'
+
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+
+lgr = logging.getLogger('datalad.parallel')
+
+# Whether subprocesses can be run (by the asyncio-based WitlessRunner) in
+# threads other than the main thread. Before Python 3.8 (which introduced
+# the ThreadedChildWatcher), the exit of such a subprocess might never be
+# noticed, and the call would block forever.
+SUBPROCESSES_IN_THREADS = sys.version_info >= (3, 8)
+
+
+def get_n_jobs(jobs, cfg=None):
+    """Resolve a `jobs` specification into a number of workers
+
+    Parameters
+    ----------
+    jobs : int or 'auto' or None
+      None (or anything evaluating to False) results in a single
+      worker. 'auto' is resolved using the 'datalad.runtime.max-jobs'
+      configuration, but never exceeds the number of CPU cores (or 3, if
+      there are less than 3 cores). Without `SUBPROCESSES_IN_THREADS`,
+      this is always a single worker.
+    cfg : ConfigManager, optional
+      Configuration to consult for 'auto'. The global configuration is
+      used by default.
+
+    Returns
+    -------
+    int
+    """
+    if jobs == 'auto':
+        if cfg is None:
+            from datalad import cfg
+        jobs = min(cfg.obtain('datalad.runtime.max-jobs'),
+                   max(3, cpu_count()))
+    jobs = max(1, int(jobs or 1))
+    if jobs > 1 and not SUBPROCESSES_IN_THREADS:
+        lgr.debug(
+            'Running %s jobs in parallel is not supported by Python %s, '
+            'using a single one', jobs, sys.version.split()[0])
+        jobs = 1
+    return jobs
+
+
+def parallel_map(func, items, jobs=None):
+    """Like `map()`, but executes `func` in up to `jobs` threads
+
+    Results are yielded in the order of `items`. With a single job no
+    threads are started and `func` is called in the calling thread.
+    Any exception raised by `func` is re-raised upon retrieval of the
+    respective result.
+
+    Parameters
+    ----------
+    func : callable
+    items : iterable
+    jobs : int or 'auto' or None, optional
+      See `get_n_jobs()`.
+    """
+    n_jobs = get_n_jobs(jobs)
+    if n_jobs == 1:
+        yield from map(func, items)
+        return
+    lgr.debug("Running %s in %d threads", func, n_jobs)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        yield from executor.map(func, items)
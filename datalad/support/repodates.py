@@ -15,6 +15,7 @@ import re
 import time
 
 
+from datalad.cmd import BatchedCommand
 from datalad.log import log_progress
 from datalad.support.exceptions import CommandError
 from datalad.support.gitrepo import GitRepo
@@ -22,34 +23,53 @@ from datalad.support.gitrepo import GitRepo
 lgr = logging.getLogger('datalad.repodates')
 
 
-def _cat_blob(repo, obj, bad_ok=False):
-    """Call `git cat-file blob OBJ`.
+def _read_blob(stdout):
+    """Read a single `git cat-file --batch` response
+
+    The content size is reported in bytes, hence it is read from the binary
+    stream underneath. This is safe, as the text layer is never used for
+    reading from the process.
+
+    Returns
+    -------
+    str or None
+      Blob content, as passed on to the caller of `BatchedCommand.proc1()`
+      (which decodes the raw content read here). None if the object isn't
+      a known blob.
+    """
+    fields = stdout.buffer.readline().split()
+    if len(fields) != 3:
+        # "<object> missing" (or ambiguous)
+        return None
+    _, obj_type, size = fields
+    # content is followed by a newline
+    content = stdout.buffer.read(int(size) + 1)[:-1]
+    return content if obj_type == b"blob" else None
+
+
+def _cat_blobs(repo, objs):
+    """Get the content of objects through a single `git cat-file --batch`.
 
     Parameters
     ----------
     repo : GitRepo
-    obj : str
-        Blob object.
-    bad_ok : boolean, optional
-        Don't fail if `obj` doesn't name a known blob.
+    objs : iterable of str
+        Object names.
 
     Returns
     -------
-    Blob's content (str) or None if `obj` is not and `bad_ok` is true.
+    A generator object that returns (object name, content) for each item in
+    `objs`, in order. Content is None if the object isn't a known blob.
     """
-    if bad_ok:
-        kwds = {"expect_fail": True, "expect_stderr": True}
-    else:
-        kwds = {}
-
+    cat_file = BatchedCommand(
+        ["git", "cat-file", "--batch"],
+        path=repo.path,
+        output_proc=_read_blob)
     try:
-        out_cat = repo.call_git(["cat-file", "blob", obj], **kwds)
-    except CommandError as exc:
-        if bad_ok and "bad file" in exc.stderr:
-            out_cat = None
-        else:
-            raise
-    return out_cat
+        for obj in objs:
+            yield obj, cat_file.proc1(obj)
+    finally:
+        cat_file.close()
 
 
 def branch_blobs(repo, branch):
@@ -78,13 +98,12 @@ def branch_blobs(repo, branch):
     log_progress(lgr.info, "repodates_branch_blobs",
                  "Checking %d objects", num_objects,
                  label="Checking objects", total=num_objects, unit=" objects")
-    # This is inefficient.  It makes a git call for each object, some of which
-    # aren't even blobs.  We could instead use 'git cat-file --batch'.
-    for obj, fname in blob_trees:
+    # Not all of these objects are blobs, trees come out without content
+    contents = _cat_blobs(repo, (obj for obj, _ in blob_trees))
+    for (obj, content), (_, fname) in zip(contents, blob_trees):
         log_progress(lgr.info, "repodates_branch_blobs",
                      "Checking %s", obj,
                      increment=True, update=1)
-        content = _cat_blob(repo, obj, bad_ok=True)
         if content:
             yield obj, content, fname
     log_progress(lgr.info, "repodates_branch_blobs",
@@ -106,28 +125,28 @@ def branch_blobs_in_tree(repo, branch):
     the first file name that is reported by 'git ls-tree' is used (i.e., one
     entry per blob is yielded).
     """
-    seen_blobs = set()
-    lines = list(repo.call_git_items_(["ls-tree", "-z", "-r", branch],
-                                      sep="\0"))
-    if lines:
-        num_lines = len(lines)
+    blobs = {}
+    for line in repo.call_git_items_(["ls-tree", "-z", "-r", branch],
+                                     sep="\0"):
+        if not line:
+            continue
+        _, obj_type, obj, fname = line.split()
+        if obj_type == "blob" and obj not in blobs:
+            blobs[obj] = fname
+    if blobs:
+        num_blobs = len(blobs)
         log_progress(lgr.info,
                      "repodates_blobs_in_tree",
-                     "Checking %d objects in git-annex tree", num_lines,
-                     label="Checking objects", total=num_lines,
+                     "Checking %d objects in git-annex tree", num_blobs,
+                     label="Checking objects", total=num_blobs,
                      unit=" objects")
-        for line in lines:
-            if not line:
-                continue
-            _, obj_type, obj, fname = line.split()
+        for obj, content in _cat_blobs(repo, blobs):
             log_progress(lgr.info, "repodates_blobs_in_tree",
                          "Checking %s", obj,
                          increment=True, update=1)
-            if obj_type == "blob" and obj not in seen_blobs:
-                yield obj, _cat_blob(repo, obj), fname
-            seen_blobs.add(obj)
+            yield obj, content, blobs[obj]
         log_progress(lgr.info, "repodates_blobs_in_tree",
-                     "Finished checking %d blobs", num_lines)
+                     "Finished checking %d blobs", num_blobs)
 
 
 # In uuid.log, timestamps look like "timestamp=1523283745.683191724s" and occur
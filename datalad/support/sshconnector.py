@@ -17,8 +17,14 @@ import os
 import logging
 from socket import gethostname
 from hashlib import md5
-from subprocess import Popen
+from subprocess import (
+    DEVNULL,
+    PIPE,
+    Popen,
+)
 import tempfile
+import threading
+from uuid import uuid4
 # importing the quote function here so it can always be imported from this
 # module
 # this used to be shlex.quote(), but is now a cross-platform helper
@@ -37,12 +43,21 @@ from datalad.utils import (
     auto_repr,
     Path,
     assure_list,
+    assure_unicode,
     on_windows,
 )
 from datalad.cmd import Runner
+from datalad.support.tracer import (
+    get_command_label,
+    subprocess_tracer,
+)
 
 lgr = logging.getLogger('datalad.support.sshconnector')
 
+# essential properties of remote systems (e.g. tool versions), shared by all
+# connection instances using the same control path
+_remote_props = {}
+
 
 def get_connection_hash(hostname, port='', username='', identity_file='',
                         bundled='', force_ip=False):
@@ -124,8 +139,9 @@ class SSHConnection(object):
         self._identity_file = identity_file
         self._use_remote_annex_bundle = use_remote_annex_bundle
 
-        # essential properties of the remote system
-        self._remote_props = {}
+        # essential properties of the remote system, determined only once
+        # per host
+        self._remote_props = _remote_props.setdefault(str(self.ctrl_path), {})
         self._opened_by_us = False
 
     def __call__(self, cmd, options=None, stdin=None, log_output=True):
@@ -449,6 +465,269 @@ class SSHConnection(object):
         return git_version
 
 
+@auto_repr
+class SSHRemoteShell(object):
+    """A persistent shell on the remote end of an SSH connection
+
+    Commands are executed one after another by the same remote shell
+    process, instead of starting a new local ``ssh`` process for each of
+    them. Each command runs in its own subshell, with stdin connected to
+    /dev/null, hence changes to the working directory or the environment
+    do not persist across commands. Output of each command is delimited by
+    a unique end marker that also carries its exit code.
+
+    Calling an instance has the same signature and return value as calling
+    an `SSHConnection`, hence both can be used interchangeably.
+    """
+
+    def __init__(self, connection):
+        """
+        Parameters
+        ----------
+        connection : SSHConnection
+          Connection to start the shell with. It also serves any requests
+          that cannot be handled by a persistent shell (e.g. commands that
+          need a particular stdin).
+        """
+        self.connection = connection
+        self._proc = None
+        self._marker = 'datalad-shell-end-{}'.format(uuid4().hex)
+        self._lock = threading.Lock()
+
+    def is_alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self):
+        self.connection.open()
+        cmd = ['ssh'] + self.connection._ssh_args \
+            + [self.connection.sshri.as_str()]
+        lgr.debug("Starting remote shell %s by calling %s", self, cmd)
+        self._proc = Popen(cmd, stdin=PIPE, stdout=PIPE, stderr=DEVNULL)
+        setup = []
+        if self.connection._use_remote_annex_bundle:
+            remote_annex_installdir = self.connection.get_annex_installdir()
+            if remote_annex_installdir:
+                # make sure to use the bundled git version if any exists
+                setup.append('export "PATH={}:$PATH"'.format(
+                    remote_annex_installdir))
+        # stderr of each command is collected in a temporary file
+        setup.extend([
+            '_datalad_stderr="$(mktemp)"',
+            "trap 'rm -f \"$_datalad_stderr\"' EXIT",
+            # swallow any login message(s)
+            'echo {}'.format(self._marker),
+        ])
+        self._write(setup)
+        while True:
+            line = self._proc.stdout.readline()
+            if not line:
+                self.close()
+                raise CommandError(
+                    cmd, msg='Failed to start remote shell')
+            if line.rstrip(b'\n') == self._marker.encode():
+                break
+
+    def _write(self, lines):
+        self._proc.stdin.write(
+            ''.join(l + '\n' for l in lines).encode('utf-8'))
+        self._proc.stdin.flush()
+
+    def _send(self, cmd):
+        """Send a command to the shell"""
+        if not self.is_alive():
+            self._start()
+        lgr.log(5, "Running in remote shell %s: %s", self, cmd)
+        self._write([
+            '(',
+            cmd,
+            ') </dev/null 2>"$_datalad_stderr"',
+            # a newline is prepended to the marker, as the output might not
+            # end with one
+            'printf \'\\n%s %s\\n\' {} "$?"'.format(self._marker),
+            'cat "$_datalad_stderr"',
+            'printf \'\\n%s\\n\' {}'.format(self._marker),
+        ])
+
+    def _trace(self, cmd, tstart, code=None, received=None):
+        subprocess_tracer.record(
+            cmd, tstart, code=code, bytes_in=len(cmd), bytes_out=received,
+            label='ssh: {}'.format(get_command_label(cmd)))
+
+    def _readuntil(self, cmd, marker):
+        """Read output up to a marker line
+
+        Returns
+        -------
+        tuple
+          output (without the newline prepended to the marker), marker line
+        """
+        lines = []
+        while True:
+            line = self._proc.stdout.readline()
+            if not line:
+                # the shell is gone
+                self.close()
+                raise CommandError(
+                    cmd, msg='Remote shell terminated unexpectedly',
+                    stdout=assure_unicode(b''.join(lines)))
+            if line.startswith(marker):
+                return b''.join(lines)[:-1], line
+            lines.append(line)
+
+    def _read_result(self, cmd):
+        """Read the remaining output of a command
+
+        Returns
+        -------
+        tuple
+          stdout, stderr (as bytes), exit code
+        """
+        marker = self._marker.encode()
+        out, end = self._readuntil(cmd, marker + b' ')
+        code = int(end.split()[1])
+        err, end = self._readuntil(cmd, marker)
+        return out, err, code
+
+    @staticmethod
+    def _check_result(cmd, out, err, code):
+        out, err = assure_unicode(out), assure_unicode(err)
+        if code:
+            raise CommandError(
+                cmd, msg='Remote command failed', code=code,
+                stdout=out, stderr=err)
+        return out, err
+
+    def __call__(self, cmd, options=None, stdin=None, log_output=True):
+        """Executes a command in the remote shell.
+
+        It is the callers responsibility to properly quote commands
+        for remote execution (e.g. filename with spaces of other special
+        characters). Use the `sh_quote()` from the module for this purpose.
+
+        Parameters
+        ----------
+        cmd: str
+          command to run on the remote
+        options : list of str, optional
+          Additional options to pass to the `-o` flag of `ssh`. If given, the
+          command is not executed in the persistent shell, but via the
+          connection.
+        stdin : file, optional
+          If given, the command is not executed in the persistent shell, but
+          via the connection, and receives this input.
+        log_output : bool, optional
+          Only relevant, if the command is executed via the connection.
+
+        Returns
+        -------
+        tuple of str
+          stdout, stderr of the command run.
+
+        Raises
+        ------
+        CommandError
+          If the command exits with a non-zero exit code.
+        """
+        if options or stdin is not None:
+            return self.connection(
+                cmd, options=options, stdin=stdin, log_output=log_output)
+        with self._lock:
+            tstart = subprocess_tracer.start() \
+                if subprocess_tracer.enabled else None
+            code = received = None
+            try:
+                self._send(cmd)
+                out, err, code = self._read_result(cmd)
+                received = len(out) + len(err)
+            finally:
+                # record the call even if it failed to complete
+                if tstart is not None:
+                    self._trace(cmd, tstart, code, received)
+            return self._check_result(cmd, out, err, code)
+
+    def copy_output(self, cmd, fobj, size, progress_cb=None,
+                    buffer_size=1024 * 1024):
+        """Run a command and write its output to a file object
+
+        Parameters
+        ----------
+        cmd: str
+          command to run on the remote
+        fobj: file
+          file object opened in binary mode
+        size: int
+          Number of bytes the command will output. Note, that a command
+          that fails before producing this amount of output will let this
+          call block indefinitely.
+        progress_cb: callable, optional
+          Called with the number of bytes received so far.
+        buffer_size: int, optional
+
+        Raises
+        ------
+        CommandError
+          If the command exits with a non-zero exit code.
+        """
+        with self._lock:
+            tstart = subprocess_tracer.start() \
+                if subprocess_tracer.enabled else None
+            code = None
+            bytes_received = 0
+            try:
+                self._send(cmd)
+                while bytes_received < size:
+                    c = self._proc.stdout.read1(
+                        min(buffer_size, size - bytes_received))
+                    if not c:
+                        self.close()
+                        raise CommandError(
+                            cmd, msg='Remote shell terminated unexpectedly')
+                    bytes_received += len(c)
+                    fobj.write(c)
+                    if progress_cb:
+                        progress_cb(bytes_received)
+                out, err, code = self._read_result(cmd)
+                bytes_received += len(out) + len(err)
+            finally:
+                # record the call even if it failed to complete
+                if tstart is not None:
+                    self._trace(cmd, tstart, code, bytes_received)
+            self._check_result(cmd, out, err, code)
+
+    def close(self):
+        """Terminates the remote shell"""
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        lgr.debug("Closing remote shell %s", self)
+        try:
+            if proc.poll() is None:
+                # try exiting the shell clean first
+                proc.stdin.write(b"exit\n")
+                proc.stdin.flush()
+            proc.wait(timeout=0.5)
+        except Exception as e:
+            lgr.debug("Failed to close remote shell cleanly: %s", exc_str(e))
+            # be more brutal if it doesn't work
+            proc.terminate()
+            proc.wait()
+        proc.stdin.close()
+        proc.stdout.close()
+
+    # delegates to the connection for interchangeability with SSHConnection
+    def put(self, *args, **kwargs):
+        return self.connection.put(*args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        return self.connection.get(*args, **kwargs)
+
+    def get_annex_version(self):
+        return self.connection.get_annex_version()
+
+    def get_git_version(self):
+        return self.connection.get_git_version()
+
+
 @auto_repr
 class SSHManager(object):
     """Keeps ssh connections to share. Serves singleton representation
@@ -462,6 +741,8 @@ class SSHManager(object):
     def __init__(self):
         self._socket_dir = None
         self._connections = dict()
+        # persistent remote shells per control path and thread
+        self._shells = dict()
         # Initialization of prev_connections is happening during initial
         # handling of socket_dir, so we do not define them here explicitly
         # to an empty list to fail if logic is violated
@@ -569,6 +850,37 @@ class SSHManager(object):
             self._connections[ctrl_path] = c
             return c
 
+    def get_shell(self, url, use_remote_annex_bundle=True, force_ip=False):
+        """Get a persistent shell on the remote end of a connection to `url`
+
+        Shells are pooled per connection and thread: repeated calls from the
+        same thread yield the same shell, while concurrent threads each get
+        their own. All shells are terminated by `close()`.
+
+        Parameters
+        ----------
+        url: str
+          ssh url
+        use_remote_annex_bundle : bool
+          If set, prefer a git-annex installation's bundled binaries on the
+          remote.
+        force_ip : {False, 4, 6}
+          Force the use of IPv4 or IPv6 addresses.
+
+        Returns
+        -------
+        SSHRemoteShell
+        """
+        c = self.get_connection(
+            url,
+            use_remote_annex_bundle=use_remote_annex_bundle,
+            force_ip=force_ip)
+        key = (c.ctrl_path, threading.get_ident())
+        shell = self._shells.get(key)
+        if shell is None or shell.connection is not c:
+            shell = self._shells[key] = SSHRemoteShell(c)
+        return shell
+
     def close(self, allow_fail=True, ctrl_path=None):
         """Closes all connections, known to this instance.
 
@@ -580,8 +892,11 @@ class SSHManager(object):
         ctrl_path: str, Path, or list of str or Path, optional
           If specified, only the path(s) provided would be considered
         """
+        ctrl_paths = [Path(p) for p in assure_list(ctrl_path)]
+        for key in list(self._shells):
+            if not ctrl_paths or key[0] in ctrl_paths:
+                self._shells.pop(key).close()
         if self._connections:
-            ctrl_paths = [Path(p) for p in assure_list(ctrl_path)]
             to_close = [c for c in self._connections
                         # don't close if connection wasn't opened by SSHManager
                         if self._connections[c].ctrl_path
@@ -358,6 +358,38 @@ def test_AnnexRepo_is_under_annex(batch, src, annex_path):
         [False])
 
 
+@with_testrepos('.*annex.*', flavors=['local'], count=1)
+@with_tempfile
+def test_AnnexRepo_get_files_annexinfo(src, annex_path):
+    ar = AnnexRepo.clone(src, annex_path)
+
+    with open(opj(annex_path, 'not-committed.txt'), 'w') as f:
+        f.write("aaa")
+
+    testfiles = ["test-annex.dat", "INFO.txt", "not-committed.txt",
+                 "bogus.txt"]
+    info = ar.get_files_annexinfo(testfiles)
+    eq_(info['annexed'], [True, False, False, False])
+    eq_(info['has_content'], [False, False, False, False])
+    key = ar.get_file_key("test-annex.dat")
+    eq_(info['key'], [key, None, None, None])
+    eq_(info['bytesize'],
+        [AnnexRepo.get_size_from_key(key), None, None, None])
+
+    ok_annex_get(ar, "test-annex.dat")
+    # order of the input is retained, also for absolute paths
+    info = ar.get_files_annexinfo(
+        [opj(annex_path, f) for f in testfiles[::-1]])
+    eq_(info['annexed'], [False, False, False, True])
+    eq_(info['has_content'], [False, False, False, True])
+    # results agree with the per-file queries
+    eq_(info['has_content'][::-1], ar.file_has_content(testfiles))
+    eq_(info['annexed'][::-1], ar.is_under_annex(testfiles))
+
+    eq_(ar.get_files_annexinfo([]),
+        {'key': [], 'annexed': [], 'has_content': [], 'bytesize': []})
+
+
 @known_failure_githubci_win
 @with_tree(tree=(('about.txt', 'Lots of abouts'),
                  ('about2.txt', 'more abouts'),
@@ -2390,6 +2422,38 @@ def test_get_size_from_key():
         eq_(AnnexRepo.get_size_from_key(key), value)
 
 
+def test_get_key_hashdirs():
+    eq_(AnnexRepo.get_key_hashdirs(
+        'SHA256E-s0--e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'),
+        ('pX/ZJ', 'f87/4d5'))
+
+
+@with_tempfile(mkdir=True)
+def test_mark_content_availability(path):
+    ar = AnnexRepo(path, create=True)
+    (ar.pathobj / 'present').write_text('present')
+    (ar.pathobj / 'absent').write_text('absent')
+    ar.save(message='some content')
+    ar.drop('absent', options=['--force'])
+    info = ar.get_content_annexinfo(eval_availability=True)
+    present = info[ar.pathobj / 'present']
+    absent = info[ar.pathobj / 'absent']
+    ok_(present['has_content'])
+    assert_false(absent['has_content'])
+    assert_not_in('objloc', absent)
+    # the object location is computed without asking git-annex,
+    # but matches what git-annex reports
+    eq_(present['objloc'],
+        str(ar.pathobj / ar.get_contentlocation(present['key'])))
+    for rec in (present, absent):
+        hashdirs = AnnexRepo.get_key_hashdirs(rec['key'])
+        if 'hashdirmixed' in rec:
+            # annex reports them in platform conventions
+            eq_(hashdirs,
+                tuple(rec[h].replace('\\', '/').rstrip('/')
+                      for h in ('hashdirmixed', 'hashdirlower')))
+
+
 @with_tempfile(mkdir=True)
 def test_run_annex_gitwitless_invalid_callable(path):
     ar = AnnexRepo(path, create=True)
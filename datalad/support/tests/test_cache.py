@@ -7,8 +7,19 @@
 #
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 
-from ..cache import DictCache
-from ...tests.utils import assert_equal
+from concurrent.futures import ThreadPoolExecutor
+
+from ..cache import (
+    DictCache,
+    SizeLimitedCache,
+    get_obj_size,
+)
+from ...tests.utils import (
+    assert_equal,
+    assert_in,
+    assert_not_in,
+    assert_true,
+)
 
 
 def test_DictCache():
@@ -21,3 +32,54 @@ def test_DictCache():
 
     d['c'] = 2
     assert_equal(d, {'c': 2, 'b': 1})
+
+
+def test_SizeLimitedCache():
+    c = SizeLimitedCache(10, sizeof=len)
+    c['a'] = 'xxxx'
+    c['b'] = 'yyyy'
+    assert_equal(c.size, 8)
+    assert_equal(len(c), 2)
+    # access makes 'a' the most recently used
+    assert_equal(c['a'], 'xxxx')
+    c['c'] = 'zzz'
+    assert_not_in('b', c)
+    assert_in('a', c)
+    assert_in('c', c)
+    assert_equal(c.size, 7)
+    # replacing an item accounts for its new size
+    c['a'] = 'x'
+    assert_equal(c.size, 4)
+    # items exceeding the limit are not cached
+    c['d'] = 'w' * 11
+    assert_not_in('d', c)
+    assert_equal(c.get('d'), None)
+    assert_equal(c.pop('c'), 'zzz')
+    assert_equal(c.size, 1)
+    c.clear()
+    assert_equal(len(c), 0)
+    assert_equal(c.size, 0)
+
+
+def test_SizeLimitedCache_threads():
+    c = SizeLimitedCache(100, sizeof=len)
+
+    def churn(i):
+        for j in range(1000):
+            key = (i + j) % 30
+            c[key] = 'x' * (j % 20)
+            c.get((key + 1) % 30)
+            c.pop((key + 2) % 30)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(churn, range(8)))
+    # the accounted size is consistent with the items that remained
+    assert_equal(c.size, sum(len(c[k]) for k in range(30) if k in c))
+    assert_true(c.size <= 100)
+
+
+def test_get_obj_size():
+    small = get_obj_size({'a': 1})
+    big = get_obj_size({'a': ['x' * 1000, {'b': 'y' * 1000}]})
+    assert_true(big > 2000)
+    assert_true(small < big)
@@ -11,15 +11,19 @@
 
 __docformat__ = 'restructuredtext'
 
+import glob
 import logging
+import os
 from unittest.mock import patch
 import os.path as op
 
+from datalad.support.gitrepo import GitRepo
 from datalad.support.globbedpaths import GlobbedPaths
 from datalad.tests.utils import assert_in
 from datalad.tests.utils import eq_
 from datalad.tests.utils import swallow_logs
 from datalad.tests.utils import with_tree
+from datalad.tests.utils import create_tree
 from datalad.tests.utils import known_failure_windows
 
 
@@ -115,3 +119,52 @@ def test_globbedpaths(path):
     with swallow_logs(new_level=logging.DEBUG) as cml:
         GlobbedPaths(["not here"], pwd=path).expand()
         assert_in("No matching files found for 'not here'", cml.out)
+
+
+@with_tree(tree={"1.dat": "", "2.dat": "", "3.txt": "",
+                 "subdir": {"a.dat": "", "b.txt": ""}})
+def test_globbedpaths_index(path):
+    repo = GitRepo(path, create=True)
+    repo.add(["1.dat", "2.dat", "subdir"])
+    repo.commit("add")
+    os.unlink(op.join(path, "2.dat"))
+    create_tree(path, {"4.dat": ""})
+
+    # tracked files are matched even without a work tree file, and
+    # untracked ones are matched too
+    gp = GlobbedPaths(["*.dat"], pwd=path, repo=repo)
+    eq_(gp.expand(), ["1.dat", "2.dat", "4.dat"])
+    gp = GlobbedPaths([op.join("*", "*.dat")], pwd=path, repo=repo)
+    eq_(gp.expand(), [op.join("subdir", "a.dat")])
+    gp = GlobbedPaths(["sub*" + op.sep], pwd=path, repo=repo)
+    eq_(gp.expand(), ["subdir" + op.sep])
+    # relative to pwd
+    gp = GlobbedPaths(["*.dat"], pwd=op.join(path, "subdir"), repo=repo)
+    eq_(gp.expand(), ["a.dat"])
+    gp = GlobbedPaths(["*.txt"], pwd=path, repo=repo)
+    eq_(gp.expand(), ["3.txt"])
+
+
+@with_tree(tree={"1.dat": "",
+                 "sub": {"file.dat": ""},
+                 "untracked": {"file.dat": ""}})
+def test_globbedpaths_index_incomplete(path):
+    GitRepo(op.join(path, "sub"), create=True).add("file.dat")
+    GitRepo(op.join(path, "sub")).commit("add")
+    repo = GitRepo(path, create=True)
+    repo.call_git(["add", "1.dat", "sub"])
+    repo.commit("add")
+    create_tree(path, {"2.dat": ""})
+
+    # content of subdatasets and untracked directories is not in the index,
+    # and is matched via the file system
+    with patch("glob.glob", wraps=glob.glob) as fs_glob:
+        gp = GlobbedPaths([op.join("*", "file.dat")], pwd=path, repo=repo)
+        eq_(gp.expand(),
+            [op.join("sub", "file.dat"), op.join("untracked", "file.dat")])
+        fs_glob.assert_called()
+    # whereas the index is authoritative for anything else
+    with patch("glob.glob") as fs_glob:
+        gp = GlobbedPaths(["*.dat"], pwd=path, repo=repo)
+        eq_(gp.expand(), ["1.dat", "2.dat"])
+        fs_glob.assert_not_called()
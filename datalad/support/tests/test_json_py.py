@@ -12,8 +12,10 @@ import os.path as op
 
 from datalad.support.json_py import (
     dump,
+    dump2sqlite,
     dump2stream,
     dump2xzstream,
+    load_sqlite,
     load_stream,
     load_xzstream,
     load,
@@ -90,3 +92,23 @@ def test_dump2stream(path):
     # the same for compression
     dump2xzstream([dict(a=5), dict(b=4)], path)
     eq_(list(load_xzstream(path)), stream)
+
+
+@with_tempfile
+def test_dump2sqlite(path):
+    fname = op.join(path, 'sub', 'test.sqlite')
+    records = [
+        dict(path=p, v=i)
+        for i, p in enumerate(['a', 'a/b', 'a/b/c', 'a0', 'ab', u'b/äöü'])]
+    # order does not matter, and target directory is created
+    dump2sqlite(reversed(records), fname)
+    eq_(list(load_sqlite(fname)), records)
+    eq_(list(load_sqlite(fname, op.curdir)), records)
+    # everything at and underneath a path, but nothing sharing a mere prefix
+    eq_(list(load_sqlite(fname, 'a')), records[:3])
+    eq_(list(load_sqlite(fname, 'a/b/')), records[1:3])
+    eq_(list(load_sqlite(fname, u'b/äöü')), records[-1:])
+    eq_(list(load_sqlite(fname, 'c')), [])
+    # replaces an existing file
+    dump2sqlite([dict(path='x', v=1)], fname)
+    eq_(list(load_sqlite(fname)), [dict(path='x', v=1)])
@@ -0,0 +1,72 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 noet:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Tests for the concurrency helpers"""
+
+import threading
+from unittest.mock import patch
+
+from datalad.support.parallel import (
+    get_n_jobs,
+    parallel_map,
+)
+from datalad.tests.utils import (
+    assert_raises,
+    eq_,
+    ok_,
+)
+
+
+@patch('datalad.support.parallel.SUBPROCESSES_IN_THREADS', True)
+def test_get_n_jobs():
+    eq_(get_n_jobs(None), 1)
+    eq_(get_n_jobs(0), 1)
+    eq_(get_n_jobs(5), 5)
+    eq_(get_n_jobs('4'), 4)
+
+    class cfg:
+        @staticmethod
+        def obtain(var):
+            eq_(var, 'datalad.runtime.max-jobs')
+            return 2
+    eq_(get_n_jobs('auto', cfg=cfg), 2)
+    with patch('datalad.support.parallel.cpu_count', return_value=1):
+        cfg.obtain = staticmethod(lambda var: 10)
+        # never exceed 3 on machines with few cores
+        eq_(get_n_jobs('auto', cfg=cfg), 3)
+
+
+@patch('datalad.support.parallel.SUBPROCESSES_IN_THREADS', False)
+def test_get_n_jobs_no_threads():
+    # a single job, where subprocesses cannot be run in threads
+    eq_(get_n_jobs(5), 1)
+    eq_(get_n_jobs('auto'), 1)
+
+
+@patch('datalad.support.parallel.SUBPROCESSES_IN_THREADS', True)
+def test_parallel_map():
+    threads = set()
+
+    def f(x):
+        threads.add(threading.current_thread().ident)
+        return x * 2
+
+    items = list(range(20))
+    eq_(list(parallel_map(f, items)), [i * 2 for i in items])
+    eq_(threads, {threading.current_thread().ident})
+
+    eq_(list(parallel_map(f, items, jobs=4)), [i * 2 for i in items])
+    ok_(len(threads) > 1)
+
+    def fail(x):
+        if x == 3:
+            raise ValueError(x)
+        return x
+
+    with assert_raises(ValueError):
+        list(parallel_map(fail, items, jobs=2))
@@ -11,7 +11,10 @@ from unittest.mock import patch
 
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.gitrepo import GitRepo
-from datalad.support.repodates import check_dates
+from datalad.support.repodates import (
+    _cat_blobs,
+    check_dates,
+)
 from datalad.tests.utils import assert_equal, assert_false, \
     assert_in, assert_not_in, assert_raises, eq_, ok_, \
     set_date, with_tempfile, with_tree
@@ -100,3 +103,22 @@ def test_check_dates(path):
 
     with assert_raises(ValueError):
         check_dates(ar, refdate, which="unrecognized")
+
+
+@with_tree(tree={"foo": "foo content\n", "bar": u"bär content\n"})
+def test_cat_blobs(path):
+    repo = GitRepo(path, create=True)
+    repo.add(["foo", "bar"])
+    repo.commit("add")
+    blobs = {f: repo.call_git_oneline(["rev-parse", "HEAD:" + f])
+             for f in ("foo", "bar")}
+    objs = [blobs["foo"], "HEAD", "0" * 40, blobs["bar"]]
+    res = list(_cat_blobs(repo, objs))
+    eq_([obj for obj, _ in res], objs)
+    # only blobs come with content
+    eq_([content for _, content in res],
+        ["foo content\n", None, None, u"bär content\n"])
+    # stopping early doesn't stall
+    gen = _cat_blobs(repo, [blobs["foo"]] * 10000)
+    eq_(next(gen), (blobs["foo"], "foo content\n"))
+    gen.close()
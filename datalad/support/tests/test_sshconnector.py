@@ -18,6 +18,7 @@ from unittest.mock import patch
 from datalad.tests.utils import SkipTest
 
 
+from datalad.support.exceptions import CommandError
 from datalad.support.external_versions import external_versions
 from datalad.utils import Path
 
@@ -244,6 +245,30 @@ def test_ssh_compound_cmds():
     ssh.close()  # so we get rid of the possibly lingering connections
 
 
+@skip_if_on_windows
+@skip_ssh
+def test_ssh_shell():
+    manager = SSHManager()
+    shell = manager.get_shell('ssh://datalad-test')
+    # one shell per connection and thread
+    ok_(shell is manager.get_shell('ssh://datalad-test'))
+    eq_(shell('echo out; echo err >&2'), ('out\n', 'err\n'))
+    # output without a trailing newline
+    eq_(shell('printf some'), ('some', ''))
+    # nothing persists across commands
+    eq_(shell('cd /; pwd'), ('/\n', ''))
+    out, _ = shell('pwd')
+    ok_(out != '/\n')
+    with assert_raises(CommandError) as cme:
+        shell('echo partial; exit 3')
+    eq_(cme.exception.code, 3)
+    eq_(cme.exception.stdout, 'partial\n')
+    # the shell survives a failed command
+    eq_(shell('echo alive'), ('alive\n', ''))
+    manager.close()
+    assert_false(shell.is_alive())
+
+
 @skip_if_on_windows
 @skip_ssh
 def test_ssh_close_target():
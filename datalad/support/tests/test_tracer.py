@@ -0,0 +1,124 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 noet:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Tests for the subprocess tracer"""
+
+import json
+import sys
+from io import StringIO
+from unittest.mock import patch
+
+from datalad.cmd import (
+    BatchedCommand,
+    Runner,
+    StdOutErrCapture,
+    WitlessRunner,
+)
+from datalad.support.exceptions import CommandError
+from datalad.support.tracer import (
+    SubprocessTracer,
+    get_command_label,
+)
+from datalad.tests.utils import (
+    assert_in,
+    assert_raises,
+    eq_,
+    ok_,
+    with_tempfile,
+)
+
+
+def test_get_command_label():
+    eq_(get_command_label(['git', 'status']), 'git status')
+    eq_(get_command_label(
+        ['/usr/bin/git', '-c', 'annex.dotfiles=true', '--git-dir=.git',
+         '-C', 'sub', 'annex', '--debug', 'find', '--in', 'here']),
+        'git annex find')
+    eq_(get_command_label(['git-annex', 'version']), 'git-annex version')
+    eq_(get_command_label('ls -l "some file"'), 'ls')
+    eq_(get_command_label([]), '')
+
+
+def _get_tracer():
+    tracer = SubprocessTracer()
+    # do not report at the exit of the test process
+    tracer._exit_registered = True
+    tracer.enable()
+    return tracer
+
+
+@with_tempfile
+def test_tracer(tracefile):
+    tracer = _get_tracer()
+    with patch('datalad.cmd.subprocess_tracer', tracer):
+        out = WitlessRunner().run(
+            [sys.executable, '-c', 'print("12345")'],
+            protocol=StdOutErrCapture)
+        eq_(out['stdout'].strip(), '12345')
+        with assert_raises(CommandError):
+            WitlessRunner().run(
+                [sys.executable, '-c', 'import sys; sys.exit(3)'],
+                protocol=StdOutErrCapture)
+        Runner().run([sys.executable, '-c', 'print("12345")'])
+        bc = BatchedCommand([sys.executable, '-c', 'import sys\n'
+                             'for l in sys.stdin: print(l, end="", flush=True)'])
+        eq_(bc('abc'), 'abc')
+        eq_(bc('de'), 'de')
+        bc.close()
+
+    eq_(len(tracer.records), 5)
+    rec = tracer.records[0]
+    eq_(rec['code'], 0)
+    ok_(rec['bytes_out'] >= 6)
+    ok_(rec['duration'] > 0)
+    eq_(tracer.records[1]['code'], 3)
+    eq_(tracer.records[2]['code'], 0)
+    ok_(tracer.records[2]['bytes_out'] >= 6)
+    eq_([r['bytes_in'] for r in tracer.records[3:]], [4, 3])
+
+    summary = {s['label']: s for s in tracer.get_summary()}
+    label = get_command_label([sys.executable])
+    eq_(summary[label]['calls'], 3)
+    eq_(summary[label]['failed'], 1)
+    eq_(summary[label + ' (batched)']['calls'], 2)
+    eq_(summary[label + ' (batched)']['bytes_in'], 7)
+    # time spent outside of the commands is accounted for
+    ok_(tracer.python_time > 0)
+
+    out = StringIO()
+    tracer.report(out)
+    assert_in('Subprocess trace: 5 commands', out.getvalue())
+    assert_in(label + ' (batched)', out.getvalue())
+
+    tracer.write_trace(tracefile)
+    with open(tracefile) as f:
+        trace = json.load(f)
+    eq_(len(trace['traceEvents']), 5)
+    eq_(trace['traceEvents'][1]['args']['code'], 3)
+    eq_(trace['traceEvents'][0]['ph'], 'X')
+
+
+def test_tracer_batched_failure():
+    tracer = _get_tracer()
+
+    def failing_proc(stdout):
+        stdout.readline()
+        raise ValueError("unexpected output")
+
+    with patch('datalad.cmd.subprocess_tracer', tracer):
+        bc = BatchedCommand(
+            [sys.executable, '-c', 'import sys\n'
+             'for l in sys.stdin: print(l, end="", flush=True)'],
+            output_proc=failing_proc)
+        with assert_raises(ValueError):
+            bc('abc')
+        bc.close()
+    # the failed request is recorded, and no longer counts as active
+    eq_(len(tracer.records), 1)
+    eq_(tracer.records[0]['bytes_in'], 4)
+    eq_(tracer._active, 0)
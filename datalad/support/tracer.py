@@ -0,0 +1,271 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 noet:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Tracing of external command execution
+
+When enabled, every external command run by DataLad (via `WitlessRunner`,
+`Runner`, `BatchedCommand`, or a persistent SSH shell) is recorded with its
+duration, exit code, and the amount of data exchanged with it. An aggregated
+report per command type is printed to stderr at exit, and a trace in Chrome's
+trace event format (viewable with chrome://tracing or https://ui.perfetto.dev)
+can be written in addition.
+
+Tracing is enabled by setting the environment variable DATALAD_TRACE to a
+true value, by setting DATALAD_TRACE_FILE to the path of the trace file to
+write, or by the `--trace-subprocesses` command line option.
+"""
+
+__docformat__ = 'restructuredtext'
+
+import atexit
+import json
+import logging
+import os
+import os.path as op
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from datalad.utils import split_cmdline
+
+lgr = logging.getLogger('datalad.tracer')
+
+# options of git (and git-annex) that take a value as a separate argument,
+# and must be skipped to find the subcommand
+_GIT_OPTS_WITH_VALUE = {'-C', '-c', '--git-dir', '--work-tree', '--namespace'}
+
+
+def get_command_label(cmd):
+    """Determine the type of a command for aggregating trace records
+
+    For git and git-annex the (annex) subcommand is included in the label,
+    for any other command it is the name of the executable only.
+
+    Parameters
+    ----------
+    cmd : list or str
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(cmd, str):
+        try:
+            cmd = split_cmdline(cmd)
+        except ValueError:
+            cmd = cmd.split()
+    if not cmd:
+        return ''
+    words = [op.basename(str(cmd[0]))]
+    if words[0] in ('git', 'git-annex'):
+        args = iter(cmd[1:])
+        for arg in args:
+            if arg in _GIT_OPTS_WITH_VALUE:
+                next(args, None)
+            elif not arg.startswith('-'):
+                words.append(arg)
+                if arg != 'annex':
+                    break
+    return ' '.join(words)
+
+
+class SubprocessTracer(object):
+    """Collects timing records of external command executions
+
+    Runners are expected to test `enabled` before doing anything else,
+    hence a disabled tracer costs no more than an attribute lookup.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_file = None
+        self.records = []
+        # time not spent waiting for any external command since enabling
+        self.python_time = 0.0
+        self._lock = threading.Lock()
+        self._t0 = None
+        self._last_end = None
+        # number of commands currently running (from any thread)
+        self._active = 0
+        self._exit_registered = False
+
+    def enable(self, trace_file=None):
+        """Start recording
+
+        Parameters
+        ----------
+        trace_file : str, optional
+          Path to write a Chrome trace event file to at exit.
+        """
+        if trace_file:
+            self.trace_file = trace_file
+        if self.enabled:
+            return
+        self.enabled = True
+        self._t0 = self._last_end = time.time()
+        if not self._exit_registered:
+            atexit.register(self.finish)
+            self._exit_registered = True
+
+    def start(self):
+        """Register the start of a command
+
+        Returns
+        -------
+        float
+          Start time, to be passed to `record()`.
+        """
+        now = time.time()
+        with self._lock:
+            if not self._active:
+                self.python_time += now - self._last_end
+            self._active += 1
+        return now
+
+    def record(self, cmd, start, cwd=None, code=None, bytes_in=None,
+               bytes_out=None, label=None):
+        """Register the end of a command started with `start()`
+
+        Parameters
+        ----------
+        cmd : list or str
+        start : float
+          Return value of `start()`.
+        cwd : str, optional
+        code : int, optional
+          Exit code of the command, None if unknown.
+        bytes_in, bytes_out : int, optional
+          Amount of data sent to and received from the command,
+          None if unknown.
+        label : str, optional
+          Command type to aggregate the record under. Determined from
+          `cmd` by default.
+        """
+        end = time.time()
+        if not isinstance(cmd, str):
+            cmd = ' '.join(str(c) for c in cmd)
+        rec = dict(
+            label=label or get_command_label(cmd),
+            # keep the memory footprint of long-running sessions at bay
+            cmd=cmd if len(cmd) <= 200 else cmd[:197] + '...',
+            cwd=cwd,
+            start=start,
+            duration=end - start,
+            code=code,
+            bytes_in=bytes_in,
+            bytes_out=bytes_out,
+            thread=threading.get_ident(),
+        )
+        with self._lock:
+            self._active = max(self._active - 1, 0)
+            self._last_end = max(self._last_end, end)
+            self.records.append(rec)
+
+    def get_summary(self):
+        """Aggregate records per command type
+
+        Returns
+        -------
+        list of dict
+          One dict per command type, sorted by decreasing total duration.
+        """
+        summary = OrderedDict()
+        for rec in self.records:
+            s = summary.setdefault(rec['label'], dict(
+                label=rec['label'], calls=0, duration=0.0, max_duration=0.0,
+                bytes_in=0, bytes_out=0, failed=0))
+            s['calls'] += 1
+            s['duration'] += rec['duration']
+            s['max_duration'] = max(s['max_duration'], rec['duration'])
+            s['bytes_in'] += rec['bytes_in'] or 0
+            s['bytes_out'] += rec['bytes_out'] or 0
+            s['failed'] += 1 if rec['code'] else 0
+        return sorted(summary.values(), key=lambda s: -s['duration'])
+
+    def report(self, out=None):
+        """Print a per command type summary of all records
+
+        Parameters
+        ----------
+        out : file-like, optional
+          Defaults to stderr.
+        """
+        out = out or sys.stderr
+        with self._lock:
+            python_time = self.python_time
+            if not self._active:
+                python_time += time.time() - self._last_end
+        summary = self.get_summary()
+        out.write(
+            "Subprocess trace: {} commands, {:.3f}s in commands, {:.3f}s "
+            "in Python, {:.3f}s total\n".format(
+                len(self.records),
+                sum(s['duration'] for s in summary),
+                python_time,
+                time.time() - self._t0))
+        if not summary:
+            return
+        width = max(len('command'), max(len(s['label']) for s in summary))
+        row = '{:<%d} {:>7} {:>10} {:>9} {:>9} {:>11} {:>11} {:>6}\n' % width
+        out.write(row.format(
+            'command', 'calls', 'total[s]', 'mean[ms]', 'max[ms]',
+            'in[bytes]', 'out[bytes]', 'failed'))
+        for s in summary:
+            out.write(row.format(
+                s['label'],
+                s['calls'],
+                '{:.3f}'.format(s['duration']),
+                '{:.1f}'.format(1000 * s['duration'] / s['calls']),
+                '{:.1f}'.format(1000 * s['max_duration']),
+                s['bytes_in'],
+                s['bytes_out'],
+                s['failed']))
+
+    def write_trace(self, path):
+        """Write all records as a Chrome trace event file"""
+        pid = os.getpid()
+        events = [
+            dict(
+                name=rec['label'],
+                cat='subprocess',
+                ph='X',
+                # microseconds since enabling the tracer
+                ts=int(1e6 * (rec['start'] - self._t0)),
+                dur=int(1e6 * rec['duration']),
+                pid=pid,
+                tid=rec['thread'],
+                args={k: rec[k]
+                      for k in ('cmd', 'cwd', 'code', 'bytes_in', 'bytes_out')},
+            )
+            for rec in self.records
+        ]
+        with open(path, 'w') as f:
+            json.dump(
+                dict(traceEvents=events, displayTimeUnit='ms'), f)
+
+    def finish(self):
+        """Report and write the trace file, if one was requested"""
+        if not self.enabled:
+            return
+        self.report()
+        if self.trace_file:
+            try:
+                self.write_trace(self.trace_file)
+            except Exception as e:
+                lgr.warning("Failed to write subprocess trace to %s: %s",
+                            self.trace_file, e)
+
+
+subprocess_tracer = SubprocessTracer()
+
+if os.environ.get('DATALAD_TRACE_FILE') \
+        or os.environ.get('DATALAD_TRACE', '').lower() not in (
+            '', '0', 'no', 'off', 'false'):
+    subprocess_tracer.enable(
+        trace_file=os.environ.get('DATALAD_TRACE_FILE') or None)
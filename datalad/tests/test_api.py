@@ -34,6 +34,15 @@ def test_basic_setup():
     assert_in('Parameters', api.Dataset.create.__doc__)
 
 
+def test_import_command_by_name():
+    from datalad.api import install
+    from datalad import api
+    eq_(install, api.install)
+    assert_in('Parameters', install.__doc__)
+    # an unknown name is still an error
+    assert_false(hasattr(api, 'no_such_command'))
+
+
 def _test_consistent_order_of_args(intf, spec_posargs):
     f = getattr(intf, '__call__')
     args, varargs, varkw, defaults = getargspec(f)
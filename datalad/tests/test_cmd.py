@@ -262,6 +262,35 @@ def test_runner_heavy_output():
         yield check_runner_heavy_output, log_online
 
 
+def test_runner_online_chunked_lines():
+    skip_if_on_windows()
+    runner = Runner()
+    # lines exceeding the read size and lines split across reads
+    cmd = [sys.executable, "-c",
+           "import sys, time\n"
+           "for i in range(3):\n"
+           "    sys.stdout.write('%d' % i + 'x' * 100000 + '\\n')\n"
+           "sys.stdout.write('split ')\n"
+           "sys.stdout.flush()\n"
+           "time.sleep(0.1)\n"
+           "sys.stdout.write('line\\nlast')\n"]
+    logged = []
+
+    def process_stdout(l):
+        logged.append(l)
+        return l if l.startswith('split') else None
+
+    out, _ = runner.run(cmd, log_online=True, log_stdout=process_stdout,
+                        log_stderr=True)
+    eq_([l[:2] for l in logged], ['0x', '1x', '2x', 'sp', 'la'])
+    eq_(logged[0], '0' + 'x' * 100000 + '\n')
+    eq_(logged[3:], ['split line\n', 'last'])
+    eq_(out, 'split line\n')
+    # without any line processing, output is passed on as is
+    out, _ = runner.run(cmd, log_online=True, log_stdout=True)
+    eq_(len(out), 3 * 100002 + len('split line\nlast'))
+
+
 @with_tempfile(mkdir=True)
 def test_runner_failure(dir_):
     from ..support.annexrepo import AnnexRepo
@@ -20,6 +20,8 @@ from datalad.log import (
     ColorFormatter,
     LoggerHelper,
     log_progress,
+    PROGRESS_UPDATE_RATE,
+    ProgressHandler,
     TraceBack,
 )
 from datalad import cfg as dl_cfg
@@ -180,3 +182,55 @@ def test_log_progress_noninteractive_filter():
         for present in ["Start", "THERE0", "THERE1", "Done"]:
             assert_in(present, cml.out)
         assert_not_in("NOT", cml.out)
+
+
+@patch("datalad.log.is_interactive", lambda: True)
+def test_progress_handler_reinit():
+    name = "dl-test-reinit"
+    with patch("datalad.log._progress_handlers", {}) as handlers:
+        for i in range(2):
+            lgr = LoggerHelper(name).get_initialized_logger()
+        # a single progress handler, no matter how often it is initialized
+        phandlers = [h for h in lgr.handlers
+                     if isinstance(h, ProgressHandler)]
+        assert_equal(phandlers, [handlers[name]])
+        assert_equal(len(handlers), 1)
+
+
+def test_log_progress_coalescing():
+    class PBar(object):
+        def __init__(self):
+            self.updates = []
+
+        def set_desc(self, label):
+            self.updates.append(label)
+
+        def update(self, size, increment=False, total=None):
+            self.updates.append((size, increment, total))
+
+    lgr = logging.getLogger('datalad.tests.progress')
+    phandler = ProgressHandler()
+    pbar = phandler.pbars['lp_test'] = PBar()
+    with patch("datalad.log._progress_handlers", {lgr.name: phandler}), \
+            patch("datalad.log.time", return_value=1000.0) as time, \
+            swallow_logs(new_level=logging.INFO) as cml:
+        # the first update is passed on right away
+        log_progress(lgr.info, 'lp_test', "Update", update=1, increment=True)
+        assert_equal(pbar.updates, [(1, True, None)])
+        # subsequent ones (at the same time) are accumulated, and not logged
+        for i in range(99):
+            log_progress(lgr.info, 'lp_test', "Update", update=1,
+                         increment=True, label='newlabel')
+        log_progress(lgr.info, 'lp_test', "Update", update=5, total=10)
+        log_progress(lgr.info, 'lp_test', "Update", update=2, increment=True)
+        assert_equal(len(pbar.updates), 1)
+        assert_not_in("Update", cml.out)
+        # and flushed before the progress bar is done
+        log_progress(lgr.info, 'lp_test', "Done")
+        assert_equal(pbar.updates,
+                     [(1, True, None), 'newlabel', (7, False, 10)])
+        assert_in("Done", cml.out)
+        # once enough time has passed, an update is passed on right away
+        time.return_value += 2. / PROGRESS_UPDATE_RATE
+        log_progress(lgr.info, 'lp_test', "Update", update=3, increment=True)
+        assert_equal(pbar.updates[-1], (3, True, None))